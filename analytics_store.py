@@ -0,0 +1,104 @@
+"""Per-dimension price summaries of house_data.
+
+house_data_summary keeps (row_count, price_sum) for every value of each
+chart dimension. Writers update it in the same transaction as their
+house_data INSERT, so /chart-data reads O(#categories) rows instead of
+running seven GROUP BY scans over the whole table.
+"""
+from collections import defaultdict
+from decimal import Decimal, ROUND_HALF_UP
+
+SUMMARY_DIMENSIONS = ["bhk", "bath", "balcony", "parking", "furnishing", "property_type", "location"]
+NUMERIC_DIMENSIONS = {"bhk", "bath", "balcony", "parking"}
+
+UPSERT_SUMMARY_SQL = """
+    INSERT INTO house_data_summary (dimension, value, row_count, price_sum)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        row_count = row_count + VALUES(row_count),
+        price_sum = price_sum + VALUES(price_sum)
+"""
+
+
+def round_price(price):
+    # house_data.price is DECIMAL(20,0); round once here so the summary sums match it
+    return int(Decimal(str(price)).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def record_rows(cursor, columns, rows):
+    """Add house_data rows (sequences in `columns` order, price last) to the summary."""
+    position = {name: i for i, name in enumerate(columns)}
+    price_at = position["price"]
+
+    totals = defaultdict(lambda: [0, 0])
+    for row in rows:
+        for dim in SUMMARY_DIMENSIONS:
+            entry = totals[(dim, str(row[position[dim]]))]
+            entry[0] += 1
+            entry[1] += row[price_at]
+
+    # Every writer locks the summary rows in one order, so two of them cannot deadlock.
+    # value is compared case-folded, as the table's _ci collation compares it
+    ordered = sorted(totals.items(), key=lambda item: (item[0][0], item[0][1].casefold(), item[0][1]))
+    if ordered:
+        cursor.executemany(UPSERT_SUMMARY_SQL, [
+            (dim, value, count, price_sum)
+            for (dim, value), (count, price_sum) in ordered
+        ])
+
+
+def _label(dimension, value):
+    return int(value) if dimension in NUMERIC_DIMENSIONS else value
+
+
+def read_summary(cursor):
+    cursor.execute("""
+        SELECT dimension, value, price_sum / row_count AS avg_price
+        FROM house_data_summary
+        WHERE row_count > 0
+    """)
+    data = {dim: [] for dim in SUMMARY_DIMENSIONS}
+    for row in cursor.fetchall():
+        if row["dimension"] in data:
+            data[row["dimension"]].append({
+                "label": _label(row["dimension"], row["value"]),
+                "avg_price": row["avg_price"]
+            })
+    for dim, rows in data.items():
+        rows.sort(key=lambda r: r["label"])
+    return data
+
+
+def rebuild_summary(cursor):
+    cursor.execute("DELETE FROM house_data_summary")
+    for dim in SUMMARY_DIMENSIONS:
+        cursor.execute(f"""
+            INSERT INTO house_data_summary (dimension, value, row_count, price_sum)
+            SELECT '{dim}', {dim}, COUNT(*), SUM(price)
+            FROM house_data GROUP BY {dim}
+        """)
+
+
+def check_summary(cursor):
+    """Compare the summary with a fresh GROUP BY; returns the mismatching entries."""
+    cursor.execute("SELECT dimension, value, row_count, price_sum FROM house_data_summary")
+    stored = {(r["dimension"], r["value"]): (r["row_count"], r["price_sum"])
+              for r in cursor.fetchall() if r["row_count"]}
+
+    actual = {}
+    for dim in SUMMARY_DIMENSIONS:
+        cursor.execute(f"SELECT {dim} AS value, COUNT(*) AS row_count, SUM(price) AS price_sum "
+                       f"FROM house_data GROUP BY {dim}")
+        for r in cursor.fetchall():
+            actual[(dim, str(r["value"]))] = (r["row_count"], r["price_sum"])
+
+    mismatches = []
+    for key in sorted(set(stored) | set(actual)):
+        if stored.get(key) != actual.get(key):
+            mismatches.append({
+                "dimension": key[0],
+                "value": key[1],
+                "stored": stored.get(key),
+                "actual": actual.get(key)
+            })
+    return mismatches
@@ -1,38 +1,579 @@
-from flask import Flask, render_template, request, redirect, url_for, session, flash
+from flask import Flask, Response, render_template, request, redirect, url_for, session, flash, jsonify, g, has_request_context
 import mysql.connector
-from werkzeug.security import generate_password_hash,  check_password_hash
 import pandas as pd
 import joblib
-from data_encoder import FurnishingEncoder, FrequencyEncoder
+from db_pool import ConnectionPool, PoolTimeout
+from prediction_cache import PredictionCache, RedisBackend
+from model_store import ModelStore, ModelWatcher, ServingModel
+from fast_model import compile_pipeline
+from retrain_jobs import RetrainQueue
+from training_data import save_upload
+from property_limits import NUMERIC_COLUMNS, out_of_range
+from analytics_store import record_rows, read_summary, rebuild_summary, check_summary, round_price
+from counters import CounterCache, bump, reconcile
+from password_hashing import PasswordHasher, HasherBusy
+from session_store import ServerSessionInterface, MemoryBackend, FileBackend
+import house_snapshot
+import bulk_score
+from response_cache import ResponseCache
+from write_buffer import WriteBehindBuffer
+from metrics import Registry
+from profiler import RequestProfiler
 import os
+import atexit
+import time
+import csv
+import io
+import json
+import click
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import OneHotEncoder
-from sklearn.compose import ColumnTransformer
-from sklearn.pipeline import Pipeline
-from sklearn.model_selection import train_test_split
+from decimal import Decimal
 
 app = Flask(__name__)
 app.secret_key = "your_secret_key_here"
 
-# Load ML model
-model = joblib.load("house_price_model.pkl")
+# ---------- SESSIONS ----------
+# Server-side sessions: "file" (default) is shared by the workers on one host,
+# "memory" only works with a single worker, "cookie" keeps Flask's signed cookie
+SESSION_BACKEND = os.environ.get("SESSION_BACKEND", "file")
+SESSION_TTL = float(os.environ.get("SESSION_TTL", 86400))
+if SESSION_BACKEND == "memory":
+    app.session_interface = ServerSessionInterface(
+        MemoryBackend(maxsize=int(os.environ.get("SESSION_MAX", 10000))), ttl=SESSION_TTL)
+elif SESSION_BACKEND == "file":
+    app.session_interface = ServerSessionInterface(
+        FileBackend(os.environ.get("SESSION_DIR", "sessions")), ttl=SESSION_TTL)
+
+# The signed-in user's row as cached in the session; never the password hash
+USER_RECORD_FIELDS = ("user_id", "Username", "Usertype", "Email", "role")
+
+
+def end_user_sessions(user_id, keep_current=False):
+    # Signs the user out everywhere (but here, with keep_current); cookie sessions cannot be revoked
+    if isinstance(app.session_interface, ServerSessionInterface):
+        keep = session.sid if keep_current else None
+        app.session_interface.end_user_sessions(user_id, keep=keep)
+
+# ---------- ML MODEL ----------
+MODEL_PATH = "house_price_model.pkl"
+MODEL_DIR = os.environ.get("MODEL_DIR", "models")
+FAST_INFERENCE = os.environ.get("FAST_INFERENCE", "1") == "1"
+
+# Published versions live in MODEL_DIR; the legacy pickle is used until the first retrain
+model_store = ModelStore(MODEL_DIR, legacy_path=MODEL_PATH,
+                         keep=int(os.environ.get("MODEL_KEEP_VERSIONS", 5)))
+
+# Nothing is unpickled at import; the first prediction loads what it needs
+serving_model = ServingModel(model_store.current(), fast_enabled=FAST_INFERENCE)
+
+
+def warm_serving_model(manifest):
+    return ServingModel(manifest, fast_enabled=FAST_INFERENCE).warm()
+
+
+def install_model(new_serving_model, manifest):
+    # One assignment swaps the pipeline, fast path and fingerprint together
+    global serving_model
+    serving_model = new_serving_model
+    model_watcher.version = manifest["version"]
+    prediction_cache.clear()
+
+
+# Every worker polls the manifest so a retrain on one reaches all of them
+model_watcher = ModelWatcher(model_store, install_model,
+                             interval=float(os.environ.get("MODEL_CHECK_INTERVAL", 2)),
+                             load=warm_serving_model)
+model_watcher.version = serving_model.version
+
+
+@app.before_request
+def check_model_version():
+    model_watcher.check()
+
+# Cached prices keyed on (model fingerprint, feature tuple)
+prediction_cache = PredictionCache(
+    maxsize=int(os.environ.get("PREDICTION_CACHE_SIZE", 10000)),
+    ttl=float(os.environ.get("PREDICTION_CACHE_TTL", 3600)),
+    backend=RedisBackend(os.environ["PREDICTION_CACHE_REDIS_URL"])
+    if os.environ.get("PREDICTION_CACHE_REDIS_URL") else None
+)
+
+# Read-heavy pages and counters; write routes invalidate the tables they touch.
+# TTLs (seconds) can be overridden with CACHE_TTL_<NAME>, 0 disables one entry.
+CACHE_TTLS = {
+    name: int(os.environ.get(f"CACHE_TTL_{name.upper()}", default))
+    for name, default in {
+        "chart_data": 60,
+        "view_feedback": 30,
+        "terms": 300,
+        "retrain_history": 10,
+        "view_help": 15,
+    }.items()
+}
+response_cache = ResponseCache(enabled=os.environ.get("RESPONSE_CACHE", "1") == "1")
+
+
+# ---------- METRICS ----------
+# Per process: with several workers, scrape each one (or sum in Prometheus)
+METRICS_ENABLED = os.environ.get("METRICS", "1") == "1"
+metrics_registry = Registry()
+request_latency = metrics_registry.histogram(
+    "http_request_duration_seconds", "Time from before_request to after_request.",
+    ("method", "route", "status"))
+phase_latency = metrics_registry.histogram(
+    "http_request_phase_seconds", "Time spent in one phase of a request; phases may nest.",
+    ("route", "phase"))
+predictions_counter = metrics_registry.counter(
+    "predictions", "Properties priced, by entry point.", ("source",))
+retrains_counter = metrics_registry.counter(
+    "retrain_jobs", "Retrain job state changes, by mode and state.", ("mode", "state"))
+
+
+def current_route():
+    # Rule patterns keep the label set small; work off the request thread is "background"
+    if not has_request_context():
+        return "background"
+    return request.url_rule.rule if request.url_rule is not None else "unmatched"
+
+
+def observe_phase(phase, seconds):
+    phase_latency.labels(current_route(), phase).observe(seconds)
+
+
+@contextmanager
+def timed_phase(phase):
+    if not METRICS_ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_phase(phase, time.perf_counter() - start)
+
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_latency(response):
+    started = g.pop("request_started", None)
+    if METRICS_ENABLED and started is not None:
+        request_latency.labels(request.method, current_route(), response.status_code).observe(
+            time.perf_counter() - started)
+    return response
+
+
+# ---------- PROFILING ----------
+# Off unless PROFILE_SAMPLE_RATE > 0 (cProfile that fraction of requests) or
+# PROFILE_SLOW_MS is set (stack-sample requests, keep those at least that slow)
+profiler = RequestProfiler(
+    sample_rate=float(os.environ.get("PROFILE_SAMPLE_RATE", 0)),
+    slow_seconds=float(os.environ["PROFILE_SLOW_MS"]) / 1000 if os.environ.get("PROFILE_SLOW_MS") else None,
+    keep=int(os.environ.get("PROFILE_KEEP", 20)),
+    interval=float(os.environ.get("PROFILE_INTERVAL_MS", 5)) / 1000
+)
+profiler.init_app(app)
 
 
 # ---------- DATABASE CONNECTION ----------
+DB_CONFIG = {
+    "host": "localhost",
+    "user": "root",
+    "password": "",
+    "database": "house_app_database"
+}
+
+db_pool = ConnectionPool(
+    lambda: mysql.connector.connect(**DB_CONFIG),
+    size=int(os.environ.get("DB_POOL_SIZE", 5)),
+    max_overflow=int(os.environ.get("DB_POOL_MAX_OVERFLOW", 10)),
+    timeout=float(os.environ.get("DB_POOL_TIMEOUT", 30)),
+    recycle=float(os.environ.get("DB_POOL_RECYCLE", 3600)),
+    pre_ping=os.environ.get("DB_POOL_PRE_PING", "1") == "1",
+    observe=observe_phase if METRICS_ENABLED else None
+)
+
+
 def get_connection():
-    return mysql.connector.connect(
-        host="localhost",
-        user="root",
-        password="",
-        database="house_app_database"
-    )
+    # Pooled connection; conn.close() returns it to the pool
+    return db_pool.acquire()
+
+
+# Preferred form: `with db_connection() as conn:` releases even on exceptions
+db_connection = db_pool.connection
+
+
+# ---------- DASHBOARD COUNTERS ----------
+@contextmanager
+def counter_reconcile_lock():
+    # Non-blocking MySQL named lock: yields False when another worker is already recounting
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT GET_LOCK('house_counter_reconcile', 0)")
+        acquired = cursor.fetchone()[0] == 1
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                cursor.execute("SELECT RELEASE_LOCK('house_counter_reconcile')")
+                cursor.fetchone()
+            cursor.close()
+
+
+# Totals on the customer dashboard, read from app_counters; see counters.py
+dashboard_counters = CounterCache(
+    lambda: db_connection(),
+    refresh=float(os.environ.get("COUNTER_REFRESH_SECONDS", 10)),
+    reconcile_every=float(os.environ.get("COUNTER_RECONCILE_SECONDS", 3600)),
+    lock=counter_reconcile_lock
+)
+
+
+# ---------- PASSWORD HASHING ----------
+# PASSWORD_HASH_METHOD is the policy for new hashes; users whose stored hash
+# differs are re-hashed on their next successful sign-in
+password_hasher = PasswordHasher(
+    method=os.environ.get("PASSWORD_HASH_METHOD", "scrypt"),
+    workers=int(os.environ.get("PASSWORD_HASH_WORKERS", 1)),
+    max_concurrent=int(os.environ.get("PASSWORD_HASH_CONCURRENCY", 0)) or None,
+    wait_timeout=float(os.environ.get("PASSWORD_HASH_WAIT", 5)),
+    nice=int(os.environ.get("PASSWORD_HASH_NICE", 5)),
+    start_method=os.environ.get("PASSWORD_HASH_START_METHOD")
+)
+BUSY_MESSAGE = "Too many sign-ins right now. Please try again in a moment."
+
+
+def upgrade_password_hash(user_id, old_hash, new_hash):
+    # Only if the password was not changed meanwhile
+    try:
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("UPDATE userdata SET Password = %s WHERE user_id = %s AND Password = %s",
+                           (new_hash, user_id, old_hash))
+            conn.commit()
+            cursor.close()
+    except Exception as e:
+        print("PASSWORD REHASH ERROR:", e)
+
+
+# ---------- BACKGROUND RETRAINING ----------
+RETRAIN_UPLOAD_DIR = os.environ.get("RETRAIN_UPLOAD_DIR", "retrain_uploads")
+
+
+def _max_samples(value):
+    # "0.5" is a fraction of the rows, "200000" a row count, empty means all rows
+    if not value:
+        return None
+    return float(value) if "." in value else int(value)
+
+
+def _env_limit(name, default=None):
+    # Gate thresholds: unset keeps the default, "" or "off" disables the check
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return None if value.strip().lower() in ("", "off") else float(value)
+
+
+RETRAIN_PARAMS = {
+    "n_estimators": int(os.environ.get("RETRAIN_TREES", 300)),
+    # Training runs in its own process; -1 uses every core while it lasts
+    "n_jobs": int(os.environ.get("RETRAIN_N_JOBS", -1)),
+    "max_samples": _max_samples(os.environ.get("RETRAIN_MAX_SAMPLES")),
+    # Incremental jobs warm-start the current model with this many extra trees
+    "add_trees": int(os.environ.get("RETRAIN_INCREMENTAL_TREES", 50)),
+    "max_trees": int(os.environ.get("RETRAIN_MAX_TREES", 1000)),
+    # Evaluation times the paths serving uses, so it follows the same switches
+    "fast_inference": FAST_INFERENCE,
+    "batch_size": int(os.environ.get("BATCH_CHUNK_SIZE", 1000)),
+    # New models replace the deployed one only if they pass these on the holdout
+    "gate": {
+        "enabled": os.environ.get("RETRAIN_GATE", "1") == "1",
+        "min_r2": _env_limit("RETRAIN_GATE_MIN_R2"),
+        "max_r2_drop": _env_limit("RETRAIN_GATE_MAX_R2_DROP", 0.02),
+        "max_mae_increase": _env_limit("RETRAIN_GATE_MAX_MAE_INCREASE", 0.05),
+        "max_latency_increase": _env_limit("RETRAIN_GATE_MAX_LATENCY_INCREASE", 0.5),
+        "max_p95_ms": _env_limit("RETRAIN_GATE_MAX_P95_MS"),
+        "max_batch_p95_ms": _env_limit("RETRAIN_GATE_MAX_BATCH_P95_MS"),
+    },
+}
+# Fewer new rows than this are not worth a round of trees (and leave no holdout)
+RETRAIN_MIN_NEW_ROWS = int(os.environ.get("RETRAIN_MIN_NEW_ROWS", 100))
+
+# Columnar copy of house_data (needs pyarrow); incremental retrains read it instead of a CSV export
+SNAPSHOT_DIR = os.environ.get("SNAPSHOT_DIR", os.path.join("snapshots", "house_data"))
+SNAPSHOT_COMPRESSION = os.environ.get("SNAPSHOT_COMPRESSION", "zstd")
+SNAPSHOT_ENABLED = os.environ.get("HOUSE_SNAPSHOT", "1") == "1" and house_snapshot.available()
+# Rows younger than this are left for the next export; longer than any request's transaction
+HOUSE_DATA_SETTLE_SECONDS = int(os.environ.get("HOUSE_DATA_SETTLE_SECONDS", house_snapshot.SETTLE_SECONDS))
+
+
+def log_retrain_state(job, state):
+    retrains_counter.labels(job["mode"], state).inc()
+    # Finished jobs carry their holdout evaluation; earlier states log NULLs
+    metrics = job["metrics"] if state in ("saved", "rejected") else {}
+    try:
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO retrain_history
+                (job_id, retrained_by, dataset_name, status,
+                 mae, rmse, r2, p50_ms, p95_ms, batch_p50_ms, batch_p95_ms, metrics)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (job["id"], job["requested_by"], job["dataset_name"], state.capitalize(),
+                  metrics.get("mae"), metrics.get("rmse"), metrics.get("r2"),
+                  metrics.get("p50_ms"), metrics.get("p95_ms"),
+                  metrics.get("batch_p50_ms"), metrics.get("batch_p95_ms"),
+                  json.dumps(metrics) if metrics else None))
+            conn.commit()
+            cursor.close()
+        response_cache.invalidate("retrain_history")
+    except Exception as db_e:
+        print("HISTORY LOG ERROR:", db_e)
+
+
+def install_trained_model(job, path):
+    new_model = joblib.load(path)
+    compiled = compile_pipeline(new_model) if FAST_INFERENCE else None
+    # CSV retrains keep the previous watermark: they did not read house_data
+    trained_through_id = job["meta"].get("trained_through_id",
+                                         serving_model.manifest.get("trained_through_id", 0))
+    manifest = model_store.publish(path, compiled, extra={
+        "mode": job["mode"],
+        "trees": len(new_model.named_steps["rf"].estimators_),
+        "trained_through_id": trained_through_id,
+    })
+    install_model(ServingModel(manifest, pipeline=new_model, fast=compiled,
+                               fast_enabled=FAST_INFERENCE), manifest)
+
+
+@contextmanager
+def retrain_db_lock():
+    # MySQL named lock, so only one worker process trains at a time
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT GET_LOCK('house_price_retrain', -1)")
+        cursor.fetchone()
+    except Exception as e:
+        print("RETRAIN LOCK ERROR:", e)
+        if conn is not None:
+            conn.close()
+        conn = None
+
+    try:
+        yield
+    finally:
+        if conn is not None:
+            cursor.execute("SELECT RELEASE_LOCK('house_price_retrain')")
+            cursor.fetchone()
+            cursor.close()
+            conn.close()
+
+
+def count_new_house_rows(after_id):
+    """(last id, rows) of the settled house_data rows with id > after_id."""
+    # Bounded by the settled id, so trained_through_id never passes a row that commits later
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        last_id = max(house_snapshot.settled_max_id(cursor, HOUSE_DATA_SETTLE_SECONDS), after_id)
+        cursor.execute("SELECT COUNT(*) FROM house_data WHERE id > %s AND id <= %s", (after_id, last_id))
+        count = cursor.fetchone()[0]
+        cursor.close()
+    return last_id, count
+
+
+def export_new_house_rows(path, after_id, last_id):
+    """Write house_data rows with after_id < id <= last_id as a training CSV."""
+    # Bounded above too, so rows inserted during the export wait for the next run
+    sql, params = history_query(dict.fromkeys(HISTORY_FILTERS), before=last_id + 1, after=after_id)
+    with open(path, "w", newline="") as f:
+        for block in stream_history(sql, params, "csv"):
+            f.write(block)
+
+
+def refresh_snapshot(through_id=None):
+    """Append house_data rows newer than the snapshot; returns its manifest."""
+    return house_snapshot.export_snapshot(lambda: db_connection(), SNAPSHOT_DIR,
+                                          through_id=through_id, compression=SNAPSHOT_COMPRESSION,
+                                          settle_seconds=HOUSE_DATA_SETTLE_SECONDS)
+
+
+retrain_jobs = RetrainQueue(
+    on_state=log_retrain_state,
+    on_trained=install_trained_model,
+    lock=retrain_db_lock,
+    start_method=os.environ.get("RETRAIN_START_METHOD"),
+    params=RETRAIN_PARAMS,
+    current_model=lambda: serving_model.manifest["path"]
+)
+
+# ---------- FEATURES ----------
+# Column order the pipeline was fitted with (see model.ipynb)
+FEATURE_COLUMNS = ["location", "property_type", "area", "bhk", "bath",
+                   "balcony", "parking", "furnishing", "age"]
+
+# Rows scored per model.predict call on the batch API
+BATCH_CHUNK_SIZE = int(os.environ.get("BATCH_CHUNK_SIZE", 1000))
+
+# The compiled fast path wins on small inputs; larger chunks go to sklearn
+FAST_PATH_MAX_ROWS = int(os.environ.get("FAST_PATH_MAX_ROWS", 64))
+
+INSERT_HOUSE_SQL = """
+    INSERT INTO house_data
+    (location, property_type, area, bhk, bath, balcony, parking, furnishing, age, price)
+    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+"""
+
+HOUSE_COLUMNS = FEATURE_COLUMNS + ["price"]
+INT_COLUMNS = [col for col, dtype in NUMERIC_COLUMNS.items() if dtype.startswith("int")]
+
+
+def parse_property(record):
+    """Validate one property and return it as a tuple in FEATURE_COLUMNS order."""
+    if not isinstance(record, dict):
+        raise ValueError("property must be a JSON object")
+
+    missing = [col for col in FEATURE_COLUMNS if record.get(col) in (None, "")]
+    if missing:
+        raise ValueError(f"missing fields: {', '.join(missing)}")
+
+    # True == 1 to Python, but a boolean is not a room count
+    flags = [col for col in FEATURE_COLUMNS if isinstance(record[col], bool)]
+    if flags:
+        raise ValueError(f"invalid value: {', '.join(flags)} must be a number")
+
+    # int() would truncate a JSON 2.7 to 2 rooms
+    fractional = [col for col in INT_COLUMNS if isinstance(record[col], float) and not record[col].is_integer()]
+    if fractional:
+        raise ValueError(f"invalid value: {', '.join(fractional)} must be a whole number")
+
+    try:
+        row = (
+            str(record["location"]),
+            str(record["property_type"]),
+            float(record["area"]),
+            int(record["bhk"]),
+            int(record["bath"]),
+            int(record["balcony"]),
+            int(record["parking"]),
+            str(record["furnishing"]),
+            int(record["age"]),
+        )
+    except (TypeError, ValueError, OverflowError) as e:
+        raise ValueError(f"invalid value: {e}")
+
+    bad = [col for col, value in zip(FEATURE_COLUMNS, row) if out_of_range(col, value)]
+    if bad:
+        raise ValueError(f"invalid value: {', '.join(bad)} out of range")
+    return row
+
+
+def build_feature_frame(rows):
+    return pd.DataFrame.from_records(rows, columns=FEATURE_COLUMNS)
+
+
+def predict_prices(rows):
+    """Price feature tuples, running the model only on cache misses."""
+    # Strings are not case-folded: the location encoder is case sensitive
+    current = serving_model
+    keys = [(current.fingerprint,) + row for row in rows]
+    prices = [prediction_cache.get(key) for key in keys]
+
+    # Repeated rows inside one batch are scored once
+    missing = {}
+    for i, price in enumerate(prices):
+        if price is None:
+            missing.setdefault(keys[i], []).append(i)
+
+    if missing:
+        positions = list(missing.values())
+        unique_rows = [rows[idx[0]] for idx in positions]
+        fast = current.fast if len(unique_rows) <= FAST_PATH_MAX_ROWS else None
+        if fast is not None:
+            with timed_phase("predict"):
+                predicted = fast.predict(unique_rows, FEATURE_COLUMNS)
+        else:
+            with timed_phase("build_frame"):
+                frame = build_feature_frame(unique_rows)
+            with timed_phase("predict"):
+                predicted = current.pipeline.predict(frame)
+        for idx, price in zip(positions, predicted):
+            prediction_cache.set(keys[idx[0]], float(price))
+            for i in idx:
+                prices[i] = float(price)
+
+    return prices
+
+
+def insert_predictions(cur, records):
+    """Insert feature tuples with their price appended, keeping the chart summary in step.
+
+    The caller commits, then calls predictions_stored().
+    """
+    records = [row[:-1] + (round_price(row[-1]),) for row in records]
+    with timed_phase("db_insert"):
+        # A batch request can carry any number of rows; each INSERT stays one chunk long
+        for start in range(0, len(records), BATCH_CHUNK_SIZE):
+            cur.executemany(INSERT_HOUSE_SQL, records[start:start + BATCH_CHUNK_SIZE])
+        record_rows(cur, HOUSE_COLUMNS, records)
+        bump(cur, "predictions", len(records))
+
+
+def predictions_stored(count):
+    dashboard_counters.add("predictions", count)
+    response_cache.invalidate("house_data")
+
+
+def store_predictions(records):
+    with db_connection() as conn:
+        cur = conn.cursor()
+        insert_predictions(cur, records)
+        conn.commit()
+        cur.close()
+    predictions_stored(len(records))
+
+
+# /prediction answers before its row is stored; rows reach house_data in
+# multi-row batches every WRITE_BUFFER_MAX_ROWS rows or WRITE_BUFFER_MAX_DELAY seconds
+# Lock wait timeout and deadlock: worth retrying the same rows
+TRANSIENT_DB_ERRNOS = (1205, 1213)
+
+
+def is_transient_db_error(error):
+    # Bad rows (DataError, IntegrityError, ...) fail the same way every time; these may not
+    if isinstance(error, (PoolTimeout, mysql.connector.errors.OperationalError,
+                          mysql.connector.errors.InterfaceError)):
+        return True
+    return getattr(error, "errno", None) in TRANSIENT_DB_ERRNOS
+
+
+prediction_writer = WriteBehindBuffer(
+    store_predictions,
+    max_rows=int(os.environ.get("WRITE_BUFFER_MAX_ROWS", 500)),
+    max_delay=float(os.environ.get("WRITE_BUFFER_MAX_DELAY", 1.0)),
+    capacity=int(os.environ.get("WRITE_BUFFER_CAPACITY", 10000)),
+    overflow=os.environ.get("WRITE_BUFFER_OVERFLOW", "sync"),
+    block_timeout=float(os.environ.get("WRITE_BUFFER_BLOCK_TIMEOUT", 5)),
+    enabled=os.environ.get("WRITE_BEHIND", "1") == "1",
+    is_transient=is_transient_db_error,
+    max_attempts=int(os.environ.get("WRITE_BUFFER_MAX_ATTEMPTS", 3))
+)
+atexit.register(prediction_writer.close)
+
 
 def get_model_time():
-    if os.path.exists("house_price_model.pkl"):
-        mtime = os.path.getmtime("house_price_model.pkl")
-        return datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-    return "Never"
+    try:
+        published = datetime.fromisoformat(serving_model.manifest["published_at"])
+    except (KeyError, ValueError):
+        return "Never"
+    return published.strftime('%Y-%m-%d %H:%M:%S')
 
 
 # ---------- HOMEPAGE ----------
@@ -61,7 +602,7 @@ def signup():
 
         try:
             # Hash password (recommended even if column is small)
-            hashed_password = generate_password_hash(password)
+            hashed_password = password_hasher.hash(password)
 
             conn = get_connection()
             cursor = conn.cursor()
@@ -73,13 +614,18 @@ def signup():
             values = (username, usertype, email, hashed_password)
 
             cursor.execute(sql, values)
+            bump(cursor, "users")
             conn.commit()   # 🔥 THIS SAVES DATA
+            dashboard_counters.add("users")
+            response_cache.invalidate("userdata")
 
             cursor.close()
             conn.close()
 
             return redirect(url_for("signin"))
 
+        except HasherBusy:
+            return render_template("signup.html", error=BUSY_MESSAGE), 503
         except Exception as e:
             print("DB ERROR:", e)
             return render_template("signup.html", error="Database error occurred")
@@ -115,16 +661,26 @@ def signin():
             cursor.close()
             conn.close()
 
-            # Check hashed password
-            if user and check_password_hash(user["Password"], password):
+            # Check hashed password (off this thread), upgrading it if the policy changed
+            matches, new_hash = password_hasher.verify(user["Password"], password) if user else (False, None)
+            if new_hash:
+                upgrade_password_hash(user["user_id"], user["Password"], new_hash)
+            if matches:
+                # Fresh session id at sign-in, so a planted one is never authenticated
+                session.clear()
+                if hasattr(session, "regenerate"):
+                    session.regenerate()
                 session["user_id"] = user["user_id"]
                 session["username"] = user["Username"]
-                session["usertype"] = user["Usertype"].lower()
+                session["usertype"] = user["role"]
+                session["user"] = {field: user[field] for field in USER_RECORD_FIELDS}
 
                 return redirect(url_for("dashboard"))
 
             return render_template("signin.html", error="Invalid username or password")
 
+        except HasherBusy:
+            return render_template("signin.html", error=BUSY_MESSAGE), 503
         except Exception as e:
             print("SIGNIN ERROR:", e)
             return render_template("signin.html", error="Database error occurred")
@@ -175,7 +731,7 @@ def forgot_password():
                 )
 
             # Hash new password
-            hashed_password = generate_password_hash(new_password)
+            hashed_password = password_hasher.hash(new_password)
 
             # Update password
             cursor.execute(
@@ -184,6 +740,11 @@ def forgot_password():
             )
             conn.commit()
 
+            # Whoever was signed in with the old password is signed out
+            cursor.execute("SELECT user_id FROM userdata WHERE Email = %s", (email,))
+            for row in cursor.fetchall():
+                end_user_sessions(row["user_id"])
+
             cursor.close()
             conn.close()
 
@@ -193,6 +754,12 @@ def forgot_password():
                 status="success"
             )
 
+        except HasherBusy:
+            return render_template(
+                "forgot_password.html",
+                message=BUSY_MESSAGE,
+                status="error"
+            ), 503
         except Exception as e:
             print("FORGOT PASSWORD ERROR:", e)
             return render_template(
@@ -239,30 +806,15 @@ def customer_dashboard():
 
     username = session["username"]
 
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-
-    # Count total users
-    cursor.execute("SELECT COUNT(*) AS total_users FROM userdata")
-    user_count = cursor.fetchone()["total_users"]
-
-    # Count total predictions
-    cursor.execute("SELECT COUNT(*) AS total_predictions FROM house_data")
-    prediction_count = cursor.fetchone()["total_predictions"]
-
-    # Count total feedbacks
-    cursor.execute("SELECT COUNT(*) AS total_feedbacks FROM feedback_data")
-    feedback_count = cursor.fetchone()["total_feedbacks"]
-
-    cursor.close()
-    conn.close()
+    # No query per view: totals come from this worker's copy of app_counters
+    counts = dashboard_counters.get()
 
     return render_template(
         "customerdashboard.html",
         username=username,
-        user_count=user_count,
-        prediction_count=prediction_count,
-        feedback_count=feedback_count
+        user_count=counts["users"],
+        prediction_count=counts["predictions"],
+        feedback_count=counts["feedback"]
     )
 # ---------------- PREDICTION ----------------
 @app.route("/prediction", methods=["GET", "POST"])
@@ -273,44 +825,113 @@ def prediction():
     prediction_text = None
 
     if request.method == "POST":
-        location = request.form["location"]
-        p_type = request.form["type"]
-        area = float(request.form["area"])
-        bhk = int(request.form["bhk"])
-        bath = int(request.form["bath"])
-        balcony = int(request.form["balcony"])
-        parking = int(request.form["parking"])
-        furnishing = request.form["furnishing"]
-        age = int(request.form["age"])
-
-        df = pd.DataFrame({
-            "location": [location],
-            "property_type": [p_type],
-            "area": [area],
-            "bhk": [bhk],
-            "bath": [bath],
-            "balcony": [balcony],
-            "parking": [parking],
-            "furnishing": [furnishing],
-            "age": [age]
-        })
-
-        predicted_price = model.predict(df)[0]
+        # Validated here: a row house_data rejects would hold up the write-behind queue
+        try:
+            row = parse_property(dict(request.form.to_dict(), property_type=request.form.get("type")))
+        except ValueError as e:
+            return render_template("predictionform.html", prediction_text=f"Invalid input: {e}"), 400
+
+        predicted_price = predict_prices([row])[0]
         prediction_text = f"{round(predicted_price, 2)}"
+        predictions_counter.labels("form").inc()
 
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO house_data
-            (location, property_type, area, bhk, bath, balcony, parking, furnishing, age, price)
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-        """, (location, p_type, area, bhk, bath, balcony, parking, furnishing, age, predicted_price))
-        conn.commit()
-        cur.close()
-        conn.close()
+        # The insert itself is timed as db_insert under "background" unless the buffer is off or full
+        with timed_phase("db_enqueue"):
+            prediction_writer.add([row + (predicted_price,)])
 
     return render_template("predictionform.html", prediction_text=prediction_text)
 
+# ---------------- BATCH PREDICTION API ----------------
+def iter_batch_records():
+    # NDJSON bodies are read line by line, so only the parsed rows are held, not the raw text
+    if request.mimetype in ("application/x-ndjson", "application/jsonl"):
+        for line in request.stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield ValueError(f"invalid JSON: {e}")
+        return
+
+    payload = request.get_json(silent=True)
+    if isinstance(payload, dict):
+        payload = payload.get("properties")
+    if not isinstance(payload, list):
+        raise ValueError("expected a JSON array of properties or an NDJSON body")
+    yield from payload
+
+
+def score_chunk(chunk, results, records):
+    # chunk holds (index, row) pairs that already passed validation
+    if not chunk:
+        return
+    prices = predict_prices([row for _, row in chunk])
+    predictions_counter.labels("batch").inc(len(chunk))
+
+    records.extend(row + (price,) for (_, row), price in zip(chunk, prices))
+
+    for (index, _), price in zip(chunk, prices):
+        results[index] = {"index": index, "price": round(price, 2)}
+
+
+@app.route("/api/predict/batch", methods=["POST"])
+def predict_batch_api():
+    if "username" not in session:
+        return {"error": "Unauthorized"}, 403
+
+    results = {}
+    chunk = []
+    records = []
+
+    try:
+        # The whole body is read and scored before a connection is taken, so a slow
+        # upload holds no pool slot and no lock on the summary and counter rows
+        for index, record in enumerate(iter_batch_records()):
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                chunk.append((index, parse_property(record)))
+            except ValueError as e:
+                results[index] = {"index": index, "error": str(e)}
+
+            if len(chunk) >= BATCH_CHUNK_SIZE:
+                score_chunk(chunk, results, records)
+                chunk = []
+
+        score_chunk(chunk, results, records)
+
+        # One transaction for the whole request: a failure stores none of it, so a retry cannot duplicate rows
+        if records:
+            with db_connection() as conn:
+                cur = conn.cursor()
+                try:
+                    insert_predictions(cur, records)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    cur.close()
+    except ValueError as e:
+        return {"error": str(e), "stored": 0}, 400
+    except Exception as e:
+        print("BATCH PREDICTION ERROR:", e)
+        return {"error": "Batch prediction failed", "stored": 0}, 500
+
+    if records:
+        predictions_stored(len(records))
+
+    failed = len(results) - len(records)
+
+    ordered = [results[i] for i in range(len(results))]
+    return jsonify({
+        "results": ordered,
+        "scored": len(ordered) - failed,
+        "failed": failed
+    })
+
 # ---------------- FEEDBACK PAGE (GET) ----------------
 @app.route("/feedback", methods=["GET"])
 def feedback_page():
@@ -337,10 +958,13 @@ def submit_feedback():
         INSERT INTO feedback_data (user_id, username, rating, feedback)
         VALUES (%s, %s, %s, %s)
     """, (user_id, username, rating, feedback_text))
+    bump(cursor, "feedback")
 
     conn.commit()
     cursor.close()
     conn.close()
+    dashboard_counters.add("feedback")
+    response_cache.invalidate("feedback_data")
 
     return redirect(url_for("dashboard"))
 
@@ -350,37 +974,183 @@ def view_feedback():
     if "username" not in session:
         return redirect(url_for("signin"))
 
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
+    def render_feedback():
+        conn = get_connection()
+        cursor = conn.cursor(dictionary=True)
 
-    query = """
-        SELECT username, rating, feedback, created_at 
-        FROM feedback_data 
-        ORDER BY created_at DESC
-    """
-    cursor.execute(query)
-    feedbacks = cursor.fetchall()
+        query = """
+            SELECT username, rating, feedback, created_at 
+            FROM feedback_data 
+            ORDER BY created_at DESC
+        """
+        cursor.execute(query)
+        feedbacks = cursor.fetchall()
 
-    cursor.close()
-    conn.close()
+        cursor.close()
+        conn.close()
 
-    return render_template("feedback_data.html", feedbacks=feedbacks)
+        return render_template("feedback_data.html", feedbacks=feedbacks)
+
+    return response_cache.respond("view_feedback", CACHE_TTLS["view_feedback"],
+                                  ("feedback_data",), render_feedback)
 # ---------------- PREDICTION HISTORY ----------------
+HISTORY_COLUMNS = ["id", "created_at", "area", "location", "bhk", "bath", "balcony",
+                   "parking", "furnishing", "property_type", "age", "price"]
+HISTORY_PAGE_SIZE = int(os.environ.get("HISTORY_PAGE_SIZE", 50))
+HISTORY_MAX_PAGE_SIZE = 500
+EXPORT_FETCH_SIZE = int(os.environ.get("EXPORT_FETCH_SIZE", 1000))
+HISTORY_FILTERS = ("location", "bhk", "min_price", "max_price")
+
+
+def history_filters(args):
+    # Malformed numbers are dropped rather than failing the page
+    return {
+        "location": args.get("location", "").strip() or None,
+        "bhk": args.get("bhk", type=int),
+        "min_price": args.get("min_price", type=float),
+        "max_price": args.get("max_price", type=float),
+    }
+
+
+def history_query(filters, before=None, after=None, limit=None):
+    """SELECT on house_data for the filters, newest first, keyset-bounded on id."""
+    where, params = [], []
+    if filters["location"]:
+        where.append("location = %s")
+        params.append(filters["location"])
+    if filters["bhk"] is not None:
+        where.append("bhk = %s")
+        params.append(filters["bhk"])
+    if filters["min_price"] is not None:
+        where.append("price >= %s")
+        params.append(filters["min_price"])
+    if filters["max_price"] is not None:
+        where.append("price <= %s")
+        params.append(filters["max_price"])
+    if before is not None:
+        where.append("id < %s")
+        params.append(before)
+    if after is not None:
+        where.append("id > %s")
+        params.append(after)
+
+    sql = f"SELECT {', '.join(HISTORY_COLUMNS)} FROM house_data"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    # Paging back towards newer rows walks the key upwards; the caller reverses the page
+    sql += " ORDER BY id ASC" if after is not None else " ORDER BY id DESC"
+    if limit is not None:
+        sql += " LIMIT %s"
+        params.append(limit)
+    return sql, params
+
+
 @app.route("/history")
 def history():
     if "username" not in session:
         return redirect(url_for("signin"))
 
+    filters = history_filters(request.args)
+    before = request.args.get("before", type=int)
+    after = request.args.get("after", type=int) if before is None else None
+    limit = min(max(request.args.get("limit", HISTORY_PAGE_SIZE, type=int), 1),
+                HISTORY_MAX_PAGE_SIZE)
+
+    # One extra row tells whether another page exists in the direction we are moving
+    sql, params = history_query(filters, before, after, limit + 1)
     conn = get_connection()
     cursor = conn.cursor(dictionary=True)
-
-    cursor.execute("SELECT * FROM house_data ")
+    cursor.execute(sql, params)
     predictions = cursor.fetchall()
-
     cursor.close()
     conn.close()
 
-    return render_template("predicted_data.html", predictions=predictions)
+    has_more = len(predictions) > limit
+    predictions = predictions[:limit]
+    if after is not None:
+        predictions.reverse()
+
+    older = newer = None
+    if predictions:
+        # Whichever direction we came from, a page exists on that side
+        paging_newer = after is not None
+        if has_more or paging_newer:
+            older = predictions[-1]["id"]
+        if (has_more and paging_newer) or before is not None:
+            newer = predictions[0]["id"]
+
+    filter_args = {k: request.args[k] for k in HISTORY_FILTERS if request.args.get(k)}
+    page_args = dict(filter_args, **({"limit": limit} if "limit" in request.args else {}))
+    return render_template("predicted_data.html", predictions=predictions,
+                           filters=filters, filter_args=filter_args, page_args=page_args,
+                           older=older, newer=newer)
+
+
+def _export_value(value):
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return value
+
+
+def stream_history(sql, params, fmt):
+    conn = get_connection()
+    finished = False
+    try:
+        # Unbuffered cursor: the server sends rows as we fetch them, so memory
+        # stays at one batch however large house_data is
+        cursor = conn.cursor(dictionary=True, buffered=False)
+        cursor.execute(sql, params)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if fmt == "csv":
+            writer.writerow(HISTORY_COLUMNS)
+
+        while True:
+            rows = cursor.fetchmany(EXPORT_FETCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                values = [_export_value(row[c]) for c in HISTORY_COLUMNS]
+                if fmt == "csv":
+                    writer.writerow(values)
+                else:
+                    buffer.write(json.dumps(dict(zip(HISTORY_COLUMNS, values))) + "\n")
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        if fmt == "csv" and buffer.tell():
+            yield buffer.getvalue()
+        cursor.close()
+        finished = True
+    except Exception as e:
+        print("HISTORY EXPORT ERROR:", e)
+        raise
+    finally:
+        if finished:
+            conn.close()
+        else:
+            # The client went away mid-stream; unread rows leave the connection unusable
+            conn.invalidate()
+
+
+@app.route("/history/export")
+def export_history():
+    if "username" not in session:
+        return redirect(url_for("signin"))
+
+    fmt = request.args.get("format", "csv")
+    if fmt not in ("csv", "ndjson"):
+        return {"error": "format must be csv or ndjson"}, 400
+
+    sql, params = history_query(history_filters(request.args))
+    mimetype = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return Response(stream_history(sql, params, fmt), mimetype=mimetype, headers={
+        "Content-Disposition": f"attachment; filename=house_history.{fmt}"
+    })
     
 # ---------------- ANALYTICS PAGE ----------------
 @app.route("/analytics")
@@ -394,36 +1164,30 @@ def chart_data_api():
     if "usertype" not in session:
         return {"error": "Unauthorized"}, 403
 
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
+    def build_chart_data():
+        conn = get_connection()
+        cursor = conn.cursor(dictionary=True)
 
-    data = {}
+        data = {}
 
-    # 1. Area vs Price (Scatter)
-    cursor.execute("SELECT area, price FROM house_data LIMIT 100")
-    data["area_price"] = cursor.fetchall()
+        # 1. Area vs Price (Scatter)
+        cursor.execute("SELECT area, price FROM house_data LIMIT 100")
+        data["area_price"] = cursor.fetchall()
 
-    # 2. Age vs Price (Scatter)
-    cursor.execute("SELECT age, price FROM house_data LIMIT 100")
-    data["age_price"] = cursor.fetchall()
+        # 2. Age vs Price (Scatter)
+        cursor.execute("SELECT age, price FROM house_data LIMIT 100")
+        data["age_price"] = cursor.fetchall()
 
-    # Helper for bar charts (averages)
-    def get_avg_data(column):
-        cursor.execute(f"SELECT {column} as label, AVG(price) as avg_price FROM house_data GROUP BY {column}")
-        return cursor.fetchall()
+        # Bar charts (averages) come from the pre-aggregated summary
+        data.update(read_summary(cursor))
 
-    data["bhk"] = get_avg_data("bhk")
-    data["bath"] = get_avg_data("bath")
-    data["balcony"] = get_avg_data("balcony")
-    data["parking"] = get_avg_data("parking")
-    data["furnishing"] = get_avg_data("furnishing")
-    data["property_type"] = get_avg_data("property_type")
-    data["location"] = get_avg_data("location")
+        cursor.close()
+        conn.close()
 
-    cursor.close()
-    conn.close()
+        return data
 
-    return data
+    return response_cache.respond("chart_data", CACHE_TTLS["chart_data"],
+                                  ("house_data",), build_chart_data)
 
 # ---------------- NOTES PAGE ----------------
 @app.route("/notes")
@@ -466,6 +1230,7 @@ def update_terms():
             VALUES (%s, %s, %s, 'active')
         """, (terms_content, new_version, username))
         conn.commit()
+        response_cache.invalidate("terms_conditions")
 
         cursor.close()
         conn.close()
@@ -487,36 +1252,40 @@ def view_terms():
     if "username" not in session:
         return redirect(url_for("signin"))
 
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
+    def render_terms():
+        conn = get_connection()
+        cursor = conn.cursor(dictionary=True)
 
-    # Fetch the currently active terms
-    cursor.execute("""
-        SELECT content, version, updated_by, updated_at
-        FROM terms_conditions
-        WHERE status='active'
-        LIMIT 1
-    """)
-    row = cursor.fetchone()
-    cursor.close()
-    conn.close()
+        # Fetch the currently active terms
+        cursor.execute("""
+            SELECT content, version, updated_by, updated_at
+            FROM terms_conditions
+            WHERE status='active'
+            LIMIT 1
+        """)
+        row = cursor.fetchone()
+        cursor.close()
+        conn.close()
 
-    if row:
-        terms_text = row["content"]
-        version = row["version"]
-        updated_by = row["updated_by"]
-        updated_at = row["updated_at"]
-    else:
-        terms_text = "No terms available."
-        version = updated_by = updated_at = None
+        if row:
+            terms_text = row["content"]
+            version = row["version"]
+            updated_by = row["updated_by"]
+            updated_at = row["updated_at"]
+        else:
+            terms_text = "No terms available."
+            version = updated_by = updated_at = None
 
-    return render_template(
-        "view_terms_conditions.html",
-        terms_text=terms_text,
-        version=version,
-        updated_by=updated_by,
-        updated_at=updated_at
-    )
+        return render_template(
+            "view_terms_conditions.html",
+            terms_text=terms_text,
+            version=version,
+            updated_by=updated_by,
+            updated_at=updated_at
+        )
+
+    return response_cache.respond("terms", CACHE_TTLS["terms"],
+                                  ("terms_conditions",), render_terms)
 
 # ---------------- MODEL RETRAINING ----------------
 @app.route("/retrain_model", methods=["GET", "POST"])
@@ -525,6 +1294,9 @@ def retrain_model():
         return redirect(url_for("signin"))
 
     if request.method == "POST":
+        if request.form.get("mode") == "incremental":
+            return submit_incremental_retrain()
+
         if 'dataset' not in request.files:
             return "No file part", 400
         
@@ -534,92 +1306,118 @@ def retrain_model():
         
         if file and file.filename.endswith('.csv'):
             try:
-                # Load the data
-                data = pd.read_csv(file)
-                
-                # Basic validation: ensure required columns exist
-                required_cols = ["area", "location", "bhk", "bath", "balcony", "parking", "furnishing", "property_type", "age", "price"]
-                if not all(col in data.columns for col in required_cols):
-                    return f"Dataset must contain these columns: {', '.join(required_cols)}", 400
-
-                X = data.drop('price', axis=1)
-                y = data['price']
-
-                # Define the preprocessing steps
-                preprocess = ColumnTransformer(
-                    transformers=[
-                        ("location_ohe", OneHotEncoder(handle_unknown="ignore"), ["location"]),
-                        ("property_freq", FrequencyEncoder("property_type"), ["property_type"]),
-                        ("furnishing_lbl", FurnishingEncoder("furnishing"), ["furnishing"])
-                    ],
-                    remainder='passthrough'
-                )
-
-                # Create the pipeline
-                new_model_pipeline = Pipeline(steps=[
-                    ("prep", preprocess),
-                    ("rf", RandomForestRegressor(n_estimators=300, random_state=42))
-                ])
-
-                # Split and Train
-                X_train, X_test, y_train, y_test = train_test_split(
-                    X, y, test_size=0.2, random_state=42
-                )
-                new_model_pipeline.fit(X_train, y_train)
-
-                # Save the new model
-                joblib.dump(new_model_pipeline, "house_price_model.pkl")
-                
-                # Update the global model variable
-                global model
-                model = new_model_pipeline
-
-                # Log Success to Retrain History
+                # Keep the upload on disk; the request returns before training starts
+                os.makedirs(RETRAIN_UPLOAD_DIR, exist_ok=True)
+                fd, csv_path = tempfile.mkstemp(suffix=".csv", dir=RETRAIN_UPLOAD_DIR)
+                os.close(fd)
                 try:
-                    conn = get_connection()
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        INSERT INTO retrain_history (retrained_by, dataset_name, status)
-                        VALUES (%s, %s, 'Success')
-                    """, (session.get('username'), file.filename))
-                    conn.commit()
-                    cursor.close()
-                    conn.close()
-                except Exception as db_e:
-                    print("HISTORY LOG ERROR:", db_e)
+                    # The header is checked before any of the body is copied
+                    save_upload(file.stream, csv_path)
+                except ValueError as e:
+                    os.remove(csv_path)
+                    return str(e), 400
 
-                flash("Model retrained successfully!", "success")
-                return redirect(url_for("admin_dashboard"))
+                job = retrain_jobs.submit(csv_path, file.filename, session.get("username"))
             except Exception as e:
-                import traceback
-                print("RETRAIN ERROR:", traceback.format_exc())
-                
-                # Log Failure to Retrain History
-                try:
-                    conn = get_connection()
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        INSERT INTO retrain_history (retrained_by, dataset_name, status)
-                        VALUES (%s, %s, 'Failed')
-                    """, (session.get('username'), file.filename if 'file' in locals() else 'Unknown'))
-                    conn.commit()
-                    cursor.close()
-                    conn.close()
-                except:
-                    pass
-
+                print("RETRAIN ERROR:", e)
                 flash(f"Error during retraining: {str(e)}", "error")
                 return redirect(url_for("admin_dashboard"))
 
+            return retrain_submitted(job)
+
     return render_template("retrainmodel.html")
 
+
+def retrain_submitted(job):
+    if request.accept_mimetypes.best == "application/json":
+        return {"job_id": job["id"], "state": job["state"]}, 202
+
+    flash(f"Retraining job {job['id']} queued. Progress is shown in Retrain History.", "success")
+    return redirect(url_for("admin_dashboard"))
+
+
+def submit_incremental_retrain():
+    # Trees are added from prediction rows stored since the current model was trained
+    after_id = serving_model.manifest.get("trained_through_id", 0)
+    try:
+        last_id, count = count_new_house_rows(after_id)
+        if count < RETRAIN_MIN_NEW_ROWS:
+            message = (f"Only {count} new predictions since the last retrain; "
+                       f"at least {RETRAIN_MIN_NEW_ROWS} are needed.")
+            if request.accept_mimetypes.best == "application/json":
+                return {"error": message}, 409
+            flash(message, "error")
+            return redirect(url_for("retrain_model"))
+
+        # The job's data is exported when it starts, off the admin's request
+        if SNAPSHOT_ENABLED:
+            # The job reads its id range straight from the snapshot's segments
+            source, id_range = SNAPSHOT_DIR, (after_id, last_id)
+            prepare = lambda: refresh_snapshot(last_id)
+        else:
+            os.makedirs(RETRAIN_UPLOAD_DIR, exist_ok=True)
+            fd, source = tempfile.mkstemp(suffix=".csv", dir=RETRAIN_UPLOAD_DIR)
+            os.close(fd)
+            id_range = None
+            prepare = lambda: export_new_house_rows(source, after_id, last_id)
+
+        job = retrain_jobs.submit(source, f"house_data rows {after_id + 1}-{last_id}",
+                                  session.get("username"), mode="incremental",
+                                  meta={"trained_through_id": last_id}, id_range=id_range,
+                                  prepare=prepare)
+    except Exception as e:
+        print("RETRAIN ERROR:", e)
+        flash(f"Error during retraining: {str(e)}", "error")
+        return redirect(url_for("admin_dashboard"))
+
+    return retrain_submitted(job)
+
+@app.route("/retrain_status")
+@app.route("/retrain_status/<job_id>")
+def retrain_status(job_id=None):
+    if session.get("usertype") != "admin":
+        return {"error": "Unauthorized"}, 403
+
+    if job_id is None:
+        return jsonify({"jobs": retrain_jobs.list(), "pending": retrain_jobs.pending_count()})
+
+    job = retrain_jobs.get(job_id)
+    if job is not None:
+        return job
+
+    # Job was submitted to another worker; its history rows are the shared record
+    try:
+        with db_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute("""
+                SELECT job_id, retrained_by, dataset_name, status, retrained_at, metrics
+                FROM retrain_history WHERE job_id = %s
+                ORDER BY id DESC LIMIT 1
+            """, (job_id,))
+            row = cursor.fetchone()
+            cursor.close()
+    except Exception as e:
+        print("RETRAIN STATUS ERROR:", e)
+        return {"error": "Database error occurred"}, 500
+
+    if not row:
+        return {"error": "Unknown job"}, 404
+    return {
+        "id": row["job_id"],
+        "requested_by": row["retrained_by"],
+        "dataset_name": row["dataset_name"],
+        "state": row["status"].lower(),
+        "updated_at": str(row["retrained_at"]),
+        "metrics": json.loads(row["metrics"]) if row["metrics"] else {}
+    }
+
 # ---------------- RETRAIN HISTORY ----------------
 @app.route("/retrain_history")
 def view_retrain_history():
     if session.get("usertype") != "admin":
         return redirect(url_for("signin"))
 
-    try:
+    def render_history():
         conn = get_connection()
         cursor = conn.cursor(dictionary=True)
         cursor.execute("SELECT * FROM retrain_history ORDER BY retrained_at DESC")
@@ -627,6 +1425,10 @@ def view_retrain_history():
         cursor.close()
         conn.close()
         return render_template("retrain_history.html", history=history)
+
+    try:
+        return response_cache.respond("retrain_history", CACHE_TTLS["retrain_history"],
+                                      ("retrain_history",), render_history)
     except Exception as e:
         print("VIEW HISTORY ERROR:", e)
         flash("Database error occurred while fetching history", "error")
@@ -645,7 +1447,7 @@ def view_users():
     cursor.execute("""
         SELECT user_id, Usertype, Username, Email
         FROM userdata
-        WHERE LOWER(Usertype) != 'admin'
+        WHERE role <> 'admin'
     """)
 
     users = cursor.fetchall()
@@ -663,17 +1465,20 @@ def profile():
 
     username = session["username"]
 
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-
-    # Fetch user details
-    cursor.execute("SELECT * FROM userdata WHERE Username = %s", (username,))
-    user = cursor.fetchone()
-
-    if not user:
+    # Cached in the session at sign-in; sessions from before that still query once
+    user = session.get("user")
+    if user is None or user["Username"] != username:
+        conn = get_connection()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(f"SELECT {', '.join(USER_RECORD_FIELDS)} FROM userdata WHERE Username = %s",
+                       (username,))
+        user = cursor.fetchone()
         cursor.close()
         conn.close()
-        return redirect(url_for("signin"))
+
+        if not user:
+            return redirect(url_for("signin"))
+        session["user"] = user
 
     message = None
     error = None
@@ -684,21 +1489,32 @@ def profile():
         new_password = request.form.get("new_password")
         confirm_password = request.form.get("confirm_password")
 
-        # Check if old password matches
-        if not check_password_hash(user["Password"], old_password):
-            error = "Current password is incorrect."
-        elif new_password != confirm_password:
-            error = "New password and confirm password do not match."
-        else:
-            # Update password in DB
-            hashed_password = generate_password_hash(new_password)
-            cursor.execute("UPDATE userdata SET Password = %s WHERE Username = %s",
-                           (hashed_password, username))
-            conn.commit()
-            message = "Password updated successfully."
+        with db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT Password FROM userdata WHERE user_id = %s", (user["user_id"],))
+            row = cursor.fetchone()
+            cursor.close()
 
-    cursor.close()
-    conn.close()
+        try:
+            # Check if old password matches
+            if row is None or not password_hasher.check(row[0], old_password or ""):
+                error = "Current password is incorrect."
+            elif new_password != confirm_password:
+                error = "New password and confirm password do not match."
+            else:
+                # Update password in DB
+                hashed_password = password_hasher.hash(new_password)
+                with db_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("UPDATE userdata SET Password = %s WHERE user_id = %s",
+                                   (hashed_password, user["user_id"]))
+                    conn.commit()
+                    cursor.close()
+                # Other browsers signed in as this user have to sign in again
+                end_user_sessions(user["user_id"], keep_current=True)
+                message = "Password updated successfully."
+        except HasherBusy:
+            error = BUSY_MESSAGE
 
     return render_template("profile.html", user=user, message=message, error=error)
 
@@ -735,6 +1551,7 @@ def submit_help():
         """, (username, usertype, subject, message))
         
         conn.commit()
+        response_cache.invalidate("help_requests")
         cursor.close()
         conn.close()
         
@@ -750,15 +1567,19 @@ def view_help_requests():
     if session.get("usertype") != "admin":
         return redirect(url_for("signin"))
     
-    try:
+    def load_requests():
         conn = get_connection()
         cursor = conn.cursor(dictionary=True)
-        
-        
         cursor.execute("SELECT * FROM help_requests ORDER BY created_at DESC")
-        requests = cursor.fetchall()
+        rows = cursor.fetchall()
         cursor.close()
         conn.close()
+        return rows
+
+    try:
+        # Only the rows are cached: the page also shows per-request flash messages
+        requests = response_cache.value("view_help", CACHE_TTLS["view_help"],
+                                        ("help_requests",), load_requests)
         return render_template("view_help.html", help_requests=requests)
     except Exception as e:
         print("VIEW HELP ERROR:", e)
@@ -775,6 +1596,7 @@ def resolve_help(request_id):
         cursor = conn.cursor()
         cursor.execute("UPDATE help_requests SET status='Resolved' WHERE id=%s", (request_id,))
         conn.commit()
+        response_cache.invalidate("help_requests")
         cursor.close()
         conn.close()
         flash("Request marked as resolved", "success")
@@ -784,12 +1606,288 @@ def resolve_help(request_id):
         
     return redirect(url_for("view_help_requests"))
 
+# ---------------- MONITORING ----------------
+@app.route("/api/pool-stats")
+def pool_stats_api():
+    if session.get("usertype") != "admin":
+        return {"error": "Unauthorized"}, 403
+    return db_pool.stats()
+
+@app.route("/api/cache-stats")
+def cache_stats_api():
+    if session.get("usertype") != "admin":
+        return {"error": "Unauthorized"}, 403
+    return prediction_cache.stats()
+
+@app.route("/api/response-cache-stats")
+def response_cache_stats_api():
+    if session.get("usertype") != "admin":
+        return {"error": "Unauthorized"}, 403
+    return response_cache.stats()
+
+@app.route("/api/write-buffer-stats")
+def write_buffer_stats_api():
+    if session.get("usertype") != "admin":
+        return {"error": "Unauthorized"}, 403
+    return prediction_writer.stats()
+
+
+@app.route("/ready")
+def readiness():
+    # For load balancers: 200 only once this worker can answer predictions without cold starts
+    if not serving_state["pool_warm"] and not serving_state["draining"]:
+        warm_pool()
+    checks = {
+        "model_loaded": serving_model.loaded,
+        "db_pool_warm": serving_state["pool_warm"],
+        "draining": serving_state["draining"],
+    }
+    ready = checks["model_loaded"] and checks["db_pool_warm"] and not checks["draining"]
+    return {"ready": ready, "model_version": serving_model.version, "pid": os.getpid(),
+            **checks}, 200 if ready else 503
+
+@app.route("/api/profiles")
+def profiles_api():
+    if session.get("usertype") != "admin":
+        return {"error": "Unauthorized"}, 403
+    return {"profiler": profiler.stats(), "profiles": profiler.list()}
+
+@app.route("/api/profiles/<profile_id>")
+def download_profile(profile_id):
+    if session.get("usertype") != "admin":
+        return {"error": "Unauthorized"}, 403
+    entry = profiler.get(profile_id)
+    if entry is None:
+        return {"error": "Unknown profile"}, 404
+
+    # cProfile entries download as .prof (pstats, snakeviz); ?format=text prints the top calls.
+    # Stack samples are folded stacks for flamegraph.pl / speedscope.
+    if entry["kind"] == "cprofile" and request.args.get("format") == "text":
+        return Response(profiler.summary(entry), mimetype="text/plain")
+    if entry["kind"] == "cprofile":
+        filename, mimetype = f"{profile_id}.prof", "application/octet-stream"
+    else:
+        filename, mimetype = f"{profile_id}.folded", "text/plain"
+    return Response(entry["data"], mimetype=mimetype,
+                    headers={"Content-Disposition": f"attachment; filename={filename}"})
+
+
+@metrics_registry.collector
+def collect_component_stats():
+    # Read from the counters the components already keep, at scrape time
+    cache = prediction_cache.stats()
+    pool = db_pool.stats()
+    buffer = prediction_writer.stats()
+    counters = dashboard_counters.stats()
+    hasher = password_hasher.stats()
+    endpoints = response_cache.stats()["endpoints"]
+    sessions = []
+    if isinstance(app.session_interface, ServerSessionInterface):
+        stats = app.session_interface.stats()
+        sessions.append(("session_lookups_total", "counter", "Session cookies looked up in the store, by result.",
+                         [({"result": "hit"}, stats["hits"]), ({"result": "miss"}, stats["misses"])]))
+        if "size" in stats:
+            sessions.append(("sessions_stored", "gauge", "Sessions held in this worker's memory store.",
+                             [({}, stats["size"])]))
+    return sessions + [
+        ("prediction_cache_lookups_total", "counter", "Prediction cache lookups, by result.",
+         [({"result": "hit"}, cache["hits"]), ({"result": "shared_hit"}, cache["shared_hits"]),
+          ({"result": "miss"}, cache["misses"])]),
+        ("prediction_cache_entries", "gauge", "Prices held in this worker's cache.",
+         [({}, cache["size"])]),
+        ("response_cache_lookups_total", "counter", "Cached page lookups, by endpoint and result.",
+         [({"endpoint": endpoint, "result": result}, counts[field])
+          for endpoint, counts in sorted(endpoints.items())
+          for result, field in (("hit", "hits"), ("miss", "misses"), ("not_modified", "not_modified"))]),
+        ("db_pool_connections", "gauge", "Pooled database connections, by state.",
+         [({"state": "borrowed"}, pool["borrowed"]), ({"state": "idle"}, pool["idle"])]),
+        ("db_pool_waits_total", "counter", "Acquisitions that had to wait for a free connection.",
+         [({}, pool["waits"])]),
+        ("db_pool_wait_seconds_total", "counter", "Time spent waiting for a free connection.",
+         [({}, pool["wait_time_seconds"])]),
+        ("write_buffer_queued_rows", "gauge", "Prediction rows waiting to be written.",
+         [({}, buffer["queued"])]),
+        ("write_buffer_rows_total", "counter", "Prediction rows leaving the buffer, by outcome.",
+         [({"outcome": "flushed"}, buffer["flushed"]), ({"outcome": "sync"}, buffer["sync_writes"]),
+          ({"outcome": "dropped"}, buffer["dropped"]), ({"outcome": "dead_letter"}, buffer["dead_lettered"])]),
+        ("write_buffer_flush_errors_total", "counter", "Background flushes that failed; their rows were retried.",
+         [({}, buffer["flush_errors"])]),
+        ("dashboard_counter_refresh_errors_total", "counter", "Failed background reads of app_counters.",
+         [({}, counters["refresh_errors"])]),
+        ("dashboard_counter_corrections_total", "counter", "Counters a reconcile found drifted and reset.",
+         [({}, counters["corrections"])]),
+        ("password_hashes_total", "counter", "Password hash operations, by kind.",
+         [({"kind": "check"}, hasher["checks"]), ({"kind": "hash"}, hasher["hashes"]),
+          ({"kind": "rehash"}, hasher["rehashes"])]),
+        ("password_hash_seconds_total", "counter", "Time spent on password hashes, queueing included.",
+         [({}, hasher["hash_seconds"])]),
+        ("password_hash_in_flight", "gauge", "Password hashes running or queued in the pool.",
+         [({}, hasher["in_flight"])]),
+        ("password_hash_waits_total", "counter", "Hashes that waited for a free slot, by outcome.",
+         [({"outcome": "admitted"}, hasher["waits"] - hasher["busy"]), ({"outcome": "busy"}, hasher["busy"])]),
+        ("retrain_jobs_pending", "gauge", "Retrain jobs queued in this worker.",
+         [({}, retrain_jobs.pending_count())]),
+        ("model_info", "gauge", "Model version this worker serves.",
+         [({"version": serving_model.version}, 1)]),
+    ]
+
+
+@app.route("/metrics")
+def metrics_endpoint():
+    # Prometheus cannot sign in; set METRICS_TOKEN to require "Authorization: Bearer <token>"
+    if not METRICS_ENABLED:
+        return {"error": "Metrics are disabled"}, 404
+    token = os.environ.get("METRICS_TOKEN")
+    if token and request.headers.get("Authorization") != f"Bearer {token}" \
+            and session.get("usertype") != "admin":
+        return {"error": "Unauthorized"}, 403
+    return Response(metrics_registry.render(), mimetype="text/plain; version=0.0.4")
+
 # ---------------- LOGOUT ----------------
 @app.route("/logout")
 def logout():
     session.clear()
     return redirect(url_for("homepage"))
 
+# ---------- SERVING ----------
+# Connections each worker opens before it reports ready
+DB_POOL_WARM = int(os.environ.get("DB_POOL_WARM", 2))
+serving_state = {"pool_warm": False, "draining": False}
+
+
+def warm_pool(n=None):
+    """Open n pooled connections up front; returns whether that worked."""
+    n = min(DB_POOL_WARM if n is None else n, db_pool.size)
+    conns = []
+    try:
+        for _ in range(n):
+            conns.append(db_pool.acquire())
+        serving_state["pool_warm"] = True
+    except Exception as e:
+        print("POOL WARM ERROR:", e)
+    finally:
+        for conn in conns:
+            conn.close()
+    return serving_state["pool_warm"]
+
+
+def create_app(preload=True):
+    """The WSGI app for a production server (see gunicorn.conf.py).
+
+    preload loads the full pipeline and the compiled fast path now. Called in
+    a prefork master, the workers then share those pages instead of each
+    unpickling its own copy. Database connections are left to each worker:
+    sockets must not be shared across fork().
+    """
+    if preload:
+        serving_model.pipeline
+        serving_model.warm()
+    return app
+
+
+def shutdown():
+    """Drain a worker once it has stopped taking requests: queued prediction rows
+    are written, then pooled connections closed."""
+    serving_state["draining"] = True
+    prediction_writer.close()
+    retrain_jobs.shutdown(wait=False)
+    password_hasher.shutdown(wait=False)
+    db_pool.dispose()
+
+
+# ---------- CLI ----------
+@app.cli.command("rebuild-summary")
+@click.option("--check", is_flag=True, help="Only report differences, do not rewrite.")
+def rebuild_summary_command(check):
+    """Recompute house_data_summary from house_data."""
+    with db_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        if not check:
+            rebuild_summary(cursor)
+            conn.commit()
+        mismatches = check_summary(cursor)
+        cursor.close()
+
+    for m in mismatches:
+        click.echo(f"{m['dimension']}={m['value']}: summary {m['stored']} != table {m['actual']}")
+    click.echo(f"{len(mismatches)} mismatching entries")
+    if mismatches:
+        raise SystemExit(1)
+
+
+@app.cli.command("reconcile-counters")
+@click.option("--check", is_flag=True, help="Only report drift, do not fix it.")
+def reconcile_counters_command(check):
+    """Recount the tables behind app_counters."""
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        drift = reconcile(cursor, fix=not check)
+        conn.commit()
+        cursor.close()
+
+    for name, (stored, actual) in sorted(drift.items()):
+        click.echo(f"{name}: stored {stored} != table {actual}")
+    click.echo(f"{len(drift)} drifted counters")
+    if drift and check:
+        raise SystemExit(1)
+
+
+@app.cli.command("export-snapshot")
+@click.option("--compact", is_flag=True, help="Also merge small segments.")
+def export_snapshot_command(compact):
+    """Append new house_data rows to the columnar snapshot in SNAPSHOT_DIR."""
+    if not house_snapshot.available():
+        raise click.ClickException("the snapshot needs pyarrow: pip install pyarrow")
+    before = house_snapshot.read_manifest(SNAPSHOT_DIR)["rows"]
+    manifest = refresh_snapshot()
+    if compact:
+        manifest = house_snapshot.compact_snapshot(SNAPSHOT_DIR, SNAPSHOT_COMPRESSION)
+    click.echo(f"{manifest['rows'] - before} rows appended; {manifest['rows']} rows through id "
+               f"{manifest['last_id']} in {len(manifest['segments'])} segments")
+
+
+@app.cli.command("score-file")
+@click.argument("input_path", type=click.Path(exists=True, dir_okay=False))
+@click.argument("output_path", type=click.Path(dir_okay=False))
+@click.option("--workers", type=int, default=lambda: int(os.environ.get("SCORE_WORKERS", os.cpu_count() or 1)),
+              help="Scoring processes; 0 scores in this process.")
+@click.option("--chunk-rows", type=int, default=lambda: int(os.environ.get("SCORE_CHUNK_ROWS", bulk_score.CHUNK_ROWS)),
+              help="Rows read and scored at a time.")
+@click.option("--store", is_flag=True, help="Also insert the priced rows into house_data.")
+@click.option("--restart", is_flag=True, help="Ignore an interrupted run and start over.")
+def score_file_command(input_path, output_path, workers, chunk_rows, store, restart):
+    """Price every listing in a CSV or Parquet file with the deployed model."""
+    manifest = serving_model.manifest
+
+    def store_chunk(features, prices):
+        columns = [features[col].tolist() for col in FEATURE_COLUMNS]
+        store_predictions(list(zip(*columns, prices.tolist())))
+
+    def report(progress):
+        click.echo(f"{progress['rows']} rows ({progress['invalid']} invalid), "
+                   f"{progress['rows_per_second']:.0f} rows/s")
+
+    try:
+        progress = bulk_score.score_file(
+            input_path, output_path, FEATURE_COLUMNS,
+            model_path=manifest["path"], model_fingerprint=manifest["fingerprint"],
+            # Loaded once here; forked workers share it instead of each unpickling the forest
+            pipeline=serving_model.pipeline,
+            workers=workers, chunk_rows=chunk_rows,
+            start_method=os.environ.get("SCORE_START_METHOD"),
+            on_chunk=store_chunk if store else None, on_progress=report, restart=restart
+        )
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    if progress["resumed_at"] == progress["rows"]:
+        click.echo(f"{output_path} is already complete; --restart to score it again")
+        return
+    if progress["resumed_at"]:
+        click.echo(f"resumed after {progress['resumed_at']} rows")
+    click.echo(f"{progress['scored']} rows priced with model {manifest['version']} in "
+               f"{progress.get('seconds', 0):.1f} s, {progress['invalid']} invalid; written to {output_path}")
+
 # ---------- RUN ----------
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,83 @@
+"""Latency of /history and /prediction with and without connection pooling.
+
+Run from the repository root (house_price_model.pkl must be present):
+
+    python benchmarks/bench_db_pool.py                # SQLite stand-in, 5 ms handshake
+    python benchmarks/bench_db_pool.py --mysql        # local MySQL from app.DB_CONFIG
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import mysql.connector
+
+import app as house_app
+from db_pool import ConnectionPool
+from standin_db import StandinServer
+
+PREDICTION_FORM = {
+    "location": "Whitefield", "type": "Apartment", "area": "1200", "bhk": "2",
+    "bath": "2", "balcony": "1", "parking": "1", "furnishing": "Semi-Furnished",
+    "age": "5",
+}
+
+
+def run(client, method, path, n, **kwargs):
+    timings = []
+    for _ in range(n):
+        start = time.perf_counter()
+        response = getattr(client, method)(path, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, (path, response.status_code)
+    timings.sort()
+    return {
+        "mean_ms": statistics.fmean(timings),
+        "p50_ms": timings[len(timings) // 2],
+        "p95_ms": timings[int(len(timings) * 0.95) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mysql", action="store_true", help="use the local MySQL server")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--connect-latency", type=float, default=0.005,
+                        help="simulated handshake seconds for the stand-in")
+    args = parser.parse_args()
+
+    if args.mysql:
+        connect = lambda: mysql.connector.connect(**house_app.DB_CONFIG)
+    else:
+        server = StandinServer(connect_latency=args.connect_latency)
+        connect = server.connect
+
+    modes = {
+        # size=0 closes every connection on release: one handshake per request
+        "connect-per-request": ConnectionPool(connect, size=0, max_overflow=1000, pre_ping=False),
+        "pooled": ConnectionPool(connect, size=5, max_overflow=10),
+    }
+
+    client = house_app.app.test_client()
+    with client.session_transaction() as sess:
+        sess["username"] = "bench"
+        sess["usertype"] = "customer"
+
+    for name, pool in modes.items():
+        house_app.db_pool = pool
+        house_app.db_connection = pool.connection
+        history = run(client, "get", "/history", args.requests)
+        prediction = run(client, "post", "/prediction", args.requests, data=PREDICTION_FORM)
+        print(f"{name:>20}  /history    mean {history['mean_ms']:7.2f} ms  "
+              f"p50 {history['p50_ms']:7.2f}  p95 {history['p95_ms']:7.2f}")
+        print(f"{'':>20}  /prediction mean {prediction['mean_ms']:7.2f} ms  "
+              f"p50 {prediction['p50_ms']:7.2f}  p95 {prediction['p95_ms']:7.2f}")
+        print(f"{'':>20}  pool stats  {pool.stats()}")
+
+
+if __name__ == "__main__":
+    main()
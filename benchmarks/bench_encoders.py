@@ -0,0 +1,94 @@
+"""Time and peak memory of the column encoders against the old copy-and-map versions.
+
+    python benchmarks/bench_encoders.py              # 1e3 .. 1e7 rows
+    python benchmarks/bench_encoders.py --max-rows 1000000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+from data_encoder import FrequencyEncoder, FurnishingEncoder
+
+PROPERTY_TYPES = ["Apartment", "Villa", "Independent House", "Penthouse"]
+FURNISHING = ["Fully-Furnished", "Semi-Furnished", "Unfurnished", "Unknown"]
+
+
+# Previous implementations, kept here as the baseline
+def legacy_frequency(freq_map, column, X):
+    X = X.copy()
+    X[column] = X[column].map(freq_map).fillna(0)
+    return X
+
+
+def legacy_furnishing(mapping, column, X):
+    X = X.copy()
+    X[column] = X[column].map(mapping).fillna(0)
+    return X[[column]]
+
+
+def make_frame(n, rng):
+    return pd.DataFrame({
+        "area": rng.integers(800, 2500, n),
+        "location": rng.choice(["Whitefield", "Hebbal", "Kengeri"], n),
+        "bhk": rng.integers(1, 6, n),
+        "bath": rng.integers(1, 6, n),
+        "balcony": rng.integers(0, 3, n),
+        "parking": rng.integers(0, 3, n),
+        "furnishing": rng.choice(FURNISHING, n),
+        "property_type": rng.choice(PROPERTY_TYPES, n),
+        "age": rng.integers(0, 16, n),
+    })
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed * 1000, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-rows", type=int, default=10**7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    # Fit on a sample without "Penthouse" so unknown categories take the 0 fill
+    frequency = FrequencyEncoder("property_type").fit(
+        pd.DataFrame({"property_type": PROPERTY_TYPES[:3] * 100})
+    )
+    furnishing = FurnishingEncoder("furnishing")
+
+    print(f"{'rows':>10}  {'encoder':<11} {'old ms':>10} {'new ms':>10} {'old MiB':>9} {'new MiB':>9}")
+    n = 1000
+    while n <= args.max_rows:
+        X = make_frame(n, rng)
+        cases = [
+            ("frequency",
+             lambda: legacy_frequency(frequency.freq_map_, "property_type", X),
+             lambda: frequency.transform(X)),
+            ("furnishing",
+             lambda: legacy_furnishing(furnishing.map_, "furnishing", X),
+             lambda: furnishing.transform(X)),
+        ]
+        for name, old, new in cases:
+            expected, old_ms, old_mib = measure(old)
+            actual, new_ms, new_mib = measure(new)
+            assert_frame_equal(expected, actual)
+            print(f"{n:>10}  {name:<11} {old_ms:>10.2f} {new_ms:>10.2f} {old_mib:>9.1f} {new_mib:>9.1f}")
+        n *= 10
+
+
+if __name__ == "__main__":
+    main()
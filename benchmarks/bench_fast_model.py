@@ -0,0 +1,64 @@
+"""Compare the compiled fast path with sklearn's Pipeline.predict.
+
+Checks that both give the same prices, then times single-row and batch scoring:
+
+    python benchmarks/bench_fast_model.py house_price_model.pkl data.csv
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from fast_model import compile_pipeline
+
+
+def per_call_ms(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    if len(sys.argv) != 3:
+        sys.exit("usage: python benchmarks/bench_fast_model.py <model.pkl> <data.csv>")
+
+    pipeline = joblib.load(sys.argv[1])
+    data = pd.read_csv(sys.argv[2]).drop(columns=["price"], errors="ignore")
+    columns = list(data.columns)
+    rows = list(data.itertuples(index=False, name=None))
+
+    start = time.perf_counter()
+    engine = compile_pipeline(pipeline)
+    print(f"compile: {(time.perf_counter() - start) * 1000:.1f} ms, "
+          f"{len(engine.arrays['roots'])} trees, {len(engine.arrays['feature'])} nodes")
+
+    expected = pipeline.predict(data)
+    actual = engine.predict(rows, columns)
+    print(f"max abs difference over {len(rows)} rows: {np.abs(expected - actual).max():.6g}")
+    assert np.allclose(expected, actual, rtol=1e-9, atol=1e-6)
+
+    single_frame = data.iloc[[0]]
+    single_row = rows[:1]
+    sk_single = per_call_ms(lambda: pipeline.predict(single_frame), 50)
+    fast_single = per_call_ms(lambda: engine.predict(single_row, columns), 500)
+    print(f"single row: sklearn {sk_single:.3f} ms, fast path {fast_single:.3f} ms "
+          f"({sk_single / fast_single:.1f}x)")
+
+    # The app only routes batches up to FAST_PATH_MAX_ROWS through the fast path
+    for size in (16, 64, 256, 1000):
+        batch = rows[:size]
+        batch_frame = data.iloc[:size]
+        sk_batch = per_call_ms(lambda: pipeline.predict(batch_frame), 5)
+        fast_batch = per_call_ms(lambda: engine.predict(batch, columns), 5)
+        print(f"{len(batch):>5}-row batch: sklearn {sk_batch:8.2f} ms, "
+              f"fast path {fast_batch:8.2f} ms ({sk_batch / fast_batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Time, peak RSS and frame size of retraining CSV ingestion.
+
+Compares pd.read_csv with default dtypes (what retraining used to do) with
+training_data.load_training_frame on generated CSVs. Each load runs in a
+fresh process, so peak RSS is not hidden by memory an earlier run freed.
+
+    python benchmarks/bench_ingest.py                 # 1e4 .. 1e6 rows
+    python benchmarks/bench_ingest.py --max-rows 10000000
+"""
+import argparse
+import multiprocessing as mp
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from training_data import REQUIRED_COLUMNS, load_training_frame
+
+LOCATIONS = ["Whitefield", "Hebbal", "Kengeri", "Yelahanka", "Jayanagar", "Marathahalli",
+             "Sarjapur Road", "Electronic City", "HSR Layout", "BTM Layout"]
+
+
+def write_csv(path, n, rng):
+    # Written in slices so the generator itself stays small at 1e7 rows
+    with open(path, "w") as f:
+        f.write(",".join(REQUIRED_COLUMNS) + "\n")
+        for start in range(0, n, 500_000):
+            m = min(500_000, n - start)
+            pd.DataFrame({
+                "area": rng.integers(500, 3000, m),
+                "location": rng.choice(LOCATIONS, m),
+                "bhk": rng.integers(1, 6, m),
+                "bath": rng.integers(1, 6, m),
+                "balcony": rng.integers(0, 3, m),
+                "parking": rng.integers(0, 3, m),
+                "furnishing": rng.choice(["Fully-Furnished", "Semi-Furnished", "Unfurnished"], m),
+                "property_type": rng.choice(["Apartment", "Villa", "Independent House"], m),
+                "age": rng.integers(0, 20, m),
+                "price": rng.integers(2_000_000, 30_000_000, m),
+            })[REQUIRED_COLUMNS].to_csv(f, header=False, index=False)
+
+
+def peak_rss_kib():
+    # VmHWM belongs to this address space; ru_maxrss survives exec and would
+    # report the parent's peak in the spawned child
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _load(name, path, results):
+    # Warm up imports and parser code paths so they do not count as ingestion
+    sample = path + ".head"
+    with open(path) as src, open(sample, "w") as dst:
+        dst.writelines(line for _, line in zip(range(1000), src))
+    pd.read_csv(sample)
+    load_training_frame(sample)
+    os.remove(sample)
+
+    baseline = peak_rss_kib()
+    start = time.perf_counter()
+    frame = pd.read_csv(path) if name == "read_csv" else load_training_frame(path)[0]
+    elapsed = time.perf_counter() - start
+    peak = peak_rss_kib() - baseline
+    results.put((elapsed, peak / 1024, frame.memory_usage(deep=True).sum() / 2**20))
+
+
+def measure(name, path):
+    context = mp.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_load, args=(name, path, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-rows", type=int, default=10**6)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(f"{'rows':>10}  {'loader':<9} {'seconds':>8} {'peak RSS MiB':>13} {'frame MiB':>10}")
+    with tempfile.TemporaryDirectory() as workdir:
+        n = 10_000
+        while n <= args.max_rows:
+            path = os.path.join(workdir, f"houses_{n}.csv")
+            write_csv(path, n, rng)
+            for name in ("read_csv", "chunked"):
+                seconds, peak, size = measure(name, path)
+                print(f"{n:>10}  {name:<9} {seconds:>8.2f} {peak:>13.1f} {size:>10.1f}")
+            os.remove(path)
+            n *= 10
+
+
+if __name__ == "__main__":
+    main()
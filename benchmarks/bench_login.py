@@ -0,0 +1,161 @@
+"""Sign-in throughput and /prediction latency during a login storm.
+
+Starts the app the way loadtest.py does, once per hashing configuration,
+and runs --predictors clients posting /prediction next to --logins clients
+that sign in over and over with the bench user's scrypt password. The
+"quiet" row is the prediction latency with no logins at all.
+
+    python benchmarks/bench_login.py
+    python benchmarks/bench_login.py --logins 32 --predictors 4 --duration 20
+
+Configurations (PASSWORD_HASH_* settings of app.py):
+  inline   hashes on the request threads, no limit: how sign-in used to work
+  pool     1 hashing process at nice 5, one hash at a time per web worker
+  pool-2   2 hashing processes, two hashes at a time
+
+Sign-ins turned away with 503 because no hashing slot freed up within
+--wait seconds are counted as "busy", not as errors.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from loadtest import BENCH_PASSWORD, BENCH_USER, VirtualUser, percentile, start_server, train_small_model
+
+CONFIGS = {
+    "quiet": {"PASSWORD_HASH_WORKERS": "1"},
+    "inline": {"PASSWORD_HASH_WORKERS": "0", "PASSWORD_HASH_CONCURRENCY": "1000",
+               "PASSWORD_HASH_NICE": "0"},
+    "pool": {"PASSWORD_HASH_WORKERS": "1", "PASSWORD_HASH_CONCURRENCY": "1",
+             "PASSWORD_HASH_NICE": "5"},
+    "pool-2": {"PASSWORD_HASH_WORKERS": "2", "PASSWORD_HASH_CONCURRENCY": "2",
+               "PASSWORD_HASH_NICE": "5"},
+}
+
+
+def run_client(user, operation, warmup_until, stop_at, samples, lock):
+    local = []
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        try:
+            if operation == "prediction":
+                outcome = "ok" if user.prediction() else "error"
+            else:
+                user.cookie = None
+                status = user.request("POST", "/signin", {
+                    "usertype": "customer", "username": BENCH_USER, "password": BENCH_PASSWORD})
+                outcome = {302: "ok", 503: "busy"}.get(status, "error")
+        except (OSError, http.client.HTTPException):
+            outcome = "error"
+            user = VirtualUser(user.conn.port, user.rng)
+            if operation == "prediction":
+                user.signin()
+        if start >= warmup_until:
+            local.append((operation, time.perf_counter() - start, outcome))
+    with lock:
+        samples.extend(local)
+
+
+def summarize(samples, operation, seconds):
+    rows = [(elapsed, outcome) for op, elapsed, outcome in samples if op == operation]
+    ok = sorted(elapsed for elapsed, outcome in rows if outcome == "ok")
+    return {
+        "ok": len(ok),
+        "busy": sum(1 for _, outcome in rows if outcome == "busy"),
+        "errors": sum(1 for _, outcome in rows if outcome == "error"),
+        "per_second": round(len(ok) / seconds, 2),
+        "p50_ms": round(percentile(ok, 50) * 1000, 2),
+        "p99_ms": round(percentile(ok, 99) * 1000, 2),
+    }
+
+
+def run_config(name, workdir, args):
+    settings = dict(CONFIGS[name], PASSWORD_HASH_WAIT=str(args.wait))
+    saved = {key: os.environ.get(key) for key in settings}
+    os.environ.update(settings)
+    try:
+        process, port = start_server(workdir, args)
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    try:
+        # Prediction clients sign in before the storm starts
+        clients = []
+        for i in range(args.predictors):
+            user = VirtualUser(port, random.Random(i))
+            if not user.signin():
+                sys.exit("bench user could not sign in")
+            clients.append((user, "prediction"))
+        if name != "quiet":
+            clients += [(VirtualUser(port, random.Random(1000 + i)), "signin") for i in range(args.logins)]
+
+        samples, lock = [], threading.Lock()
+        warmup_until = time.perf_counter() + args.warmup
+        stop_at = warmup_until + args.duration
+        threads = [threading.Thread(target=run_client,
+                                    args=(user, operation, warmup_until, stop_at, samples, lock))
+                   for user, operation in clients]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        process.terminate()
+        process.wait()
+
+    return {"signin": summarize(samples, "signin", args.duration),
+            "prediction": summarize(samples, "prediction", args.duration)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=16, help="clients signing in continuously")
+    parser.add_argument("--predictors", type=int, default=4, help="clients posting /prediction")
+    parser.add_argument("--duration", type=float, default=15, help="measured seconds per configuration")
+    parser.add_argument("--warmup", type=float, default=3)
+    parser.add_argument("--wait", type=float, default=5, help="PASSWORD_HASH_WAIT for the server")
+    parser.add_argument("--trees", type=int, default=50, help="trees in the generated model")
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--configs", default=",".join(CONFIGS))
+    parser.add_argument("--output", help="write the results as JSON here")
+    args = parser.parse_args()
+    # start_server() passes these through to the loadtest server
+    args.mysql, args.database = False, None
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        train_small_model(workdir, rows=5000, trees=args.trees)
+        for name in args.configs.split(","):
+            results[name] = run_config(name, workdir, args)
+            print(f"{name} done", file=sys.stderr)
+
+    print(f"{args.logins} login clients, {args.predictors} prediction clients, "
+          f"{args.duration:.0f} s per configuration, {os.cpu_count()} CPUs")
+    print(f"{'config':<8} {'logins/s':>9} {'login p50':>10} {'login p99':>10} {'busy':>6} "
+          f"{'pred/s':>8} {'pred p50':>9} {'pred p99':>9} {'errors':>7}")
+    for name, r in results.items():
+        s, p = r["signin"], r["prediction"]
+        print(f"{name:<8} {s['per_second']:>9.1f} {s['p50_ms']:>10.1f} {s['p99_ms']:>10.1f} {s['busy']:>6} "
+              f"{p['per_second']:>8.1f} {p['p50_ms']:>9.1f} {p['p99_ms']:>9.1f} "
+              f"{s['errors'] + p['errors']:>7}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
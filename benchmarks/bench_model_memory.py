@@ -0,0 +1,90 @@
+"""Start-up time and memory of N worker processes loading the model.
+
+"pickle" is the old behaviour (every worker unpickles the full forest);
+"mmap" memory-maps the compiled arrays published next to the pickle, so the
+tree data is shared through the page cache. PSS splits shared pages between
+the processes mapping them, so its sum is the real memory cost.
+
+    python benchmarks/bench_model_memory.py house_price_model.pkl --workers 4
+"""
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import joblib
+
+from fast_model import CompiledModel, compile_pipeline
+
+SAMPLE_ROW = ("Whitefield", "Apartment", 1200.0, 2, 2, 1, 1, "Semi-Furnished", 5)
+COLUMNS = ["location", "property_type", "area", "bhk", "bath",
+           "balcony", "parking", "furnishing", "age"]
+
+
+def memory_kib():
+    values = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:"):
+                values[parts[0][:-1].lower()] = int(parts[1])
+    return values
+
+
+def worker(mode, path, ready, results, release):
+    start = time.perf_counter()
+    if mode == "pickle":
+        model = joblib.load(path)
+        model.predict(__import__("pandas").DataFrame([SAMPLE_ROW], columns=COLUMNS))
+    else:
+        model = CompiledModel.load(path, mmap_mode="r")
+        model.predict([SAMPLE_ROW], COLUMNS)
+    elapsed = time.perf_counter() - start
+
+    ready.wait()   # everyone loaded: measure while all processes share the pages
+    results.put((elapsed, memory_kib()))
+    release.wait()
+
+
+def run(mode, path, workers):
+    ctx = mp.get_context("spawn")
+    ready = ctx.Barrier(workers + 1)
+    release = ctx.Event()
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(mode, path, ready, results, release))
+             for _ in range(workers)]
+    for p in procs:
+        p.start()
+    ready.wait()
+    samples = [results.get() for _ in procs]
+    release.set()
+    for p in procs:
+        p.join()
+
+    load = max(s[0] for s in samples)
+    rss = sum(s[1]["rss"] for s in samples) / 1024
+    pss = sum(s[1]["pss"] for s in samples) / 1024
+    print(f"{mode:>7}: slowest load {load * 1000:8.1f} ms   "
+          f"total RSS {rss:8.1f} MiB   total PSS {pss:8.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("model")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fast_dir = os.path.join(tmp, "model.fast")
+        compile_pipeline(joblib.load(args.model)).save(fast_dir)
+        print(f"{args.workers} workers")
+        run("pickle", args.model, args.workers)
+        run("mmap", fast_dir, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""Time every query app.py issues, without and with migrations/004_query_indexes.sql.
+
+    python benchmarks/bench_queries.py                           # SQLite stand-in, 1e4 / 1e5 / 1e6 rows
+    python benchmarks/bench_queries.py --rows 10000 100000
+    python benchmarks/bench_queries.py --mysql --database house_app_bench
+    python benchmarks/bench_queries.py --output query_report.json
+
+For every size the schema is loaded from house_app_database.sql into a
+scratch database, the migration's indexes are dropped and the tables are
+seeded with synthetic rows. Each query is then EXPLAINed and timed, the
+migration is applied, and the same queries run again. The JSON report keeps
+timings and both plans. --mysql drops and recreates --database, so never
+point it at the real one.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from counters import ADD_COUNTER_SQL
+from house_snapshot import SELECT_ROWS_SQL, SETTLED_ID_SQL
+from standin_db import ROOT, SCHEMA_FILE, StandinServer, secondary_keys
+
+MIGRATION_FILE = os.path.join(ROOT, "migrations", "004_query_indexes.sql")
+
+LOCATIONS = ["Whitefield", "Hebbal", "Kengeri", "Yelahanka", "Jayanagar", "Marathahalli",
+             "Sarjapur Road", "Electronic City", "HSR Layout", "BTM Layout", "JP Nagar",
+             "Banashankari", "Rajajinagar", "Malleshwaram", "KR Puram", "Bellandur"]
+FURNISHING = ["Fully-Furnished", "Semi-Furnished", "Unfurnished"]
+PROPERTY_TYPES = ["Apartment", "Villa", "Independent House"]
+
+# Rows per table relative to --rows; retrain_history grows with retrains, not traffic
+TABLE_SCALE = {"house_data": 1, "userdata": 1, "feedback_data": 1, "help_requests": 1,
+               "retrain_history": 0.01}
+
+HISTORY_SELECT = ("SELECT id, created_at, area, location, bhk, bath, balcony, parking, "
+                  "furnishing, property_type, age, price FROM house_data")
+
+# app.USER_RECORD_FIELDS, the user row cached in the session
+USER_RECORD = "user_id, Username, Usertype, Email, role"
+
+# (name, sql, params(sample), writes) -- kept in step with the SQL in app.py
+QUERIES = [
+    ("signin", "SELECT * FROM userdata WHERE Username = %s AND Usertype = %s",
+     lambda s: (s["username"], s["usertype"]), False),
+    ("signin_rehash", "UPDATE userdata SET Password = %s WHERE user_id = %s AND Password = %s",
+     lambda s: ("x", s["user_id"], "pbkdf2:sha256:bench"), True),
+    ("forgot_password_lookup", "SELECT * FROM userdata WHERE Email = %s",
+     lambda s: (s["email"],), False),
+    ("forgot_password_update", "UPDATE userdata SET Password = %s WHERE Email = %s",
+     lambda s: ("x", s["email"]), True),
+    ("forgot_password_sessions", "SELECT user_id FROM userdata WHERE Email = %s",
+     lambda s: (s["email"],), False),
+    ("signup", "INSERT INTO userdata (Username, Usertype, Email, Password) VALUES (%s, %s, %s, %s)",
+     lambda s: ("newuser", "customer", "new@mail.com", "x"), True),
+    ("profile_lookup", f"SELECT {USER_RECORD} FROM userdata WHERE Username = %s",
+     lambda s: (s["username"],), False),
+    ("profile_password", "SELECT Password FROM userdata WHERE user_id = %s",
+     lambda s: (s["user_id"],), False),
+    ("profile_update", "UPDATE userdata SET Password = %s WHERE user_id = %s",
+     lambda s: ("x", s["user_id"]), True),
+    ("view_users", "SELECT user_id, Usertype, Username, Email FROM userdata "
+                   "WHERE role <> 'admin'", lambda s: (), False),
+    ("dashboard_counters", "SELECT name, value FROM app_counters", lambda s: (), False),
+    ("bump_counter", ADD_COUNTER_SQL, lambda s: ("predictions", 1), True),
+    ("insert_prediction",
+     "INSERT INTO house_data (location, property_type, area, bhk, bath, balcony, parking, "
+     "furnishing, age, price) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)",
+     lambda s: ("Whitefield", "Apartment", 1200, 2, 2, 1, 1, "Semi-Furnished", 5, 9000000), True),
+    ("history_first_page", HISTORY_SELECT + " ORDER BY id DESC LIMIT %s",
+     lambda s: (51,), False),
+    ("history_next_page", HISTORY_SELECT + " WHERE id < %s ORDER BY id DESC LIMIT %s",
+     lambda s: (s["middle_id"], 51), False),
+    ("history_location", HISTORY_SELECT + " WHERE location = %s ORDER BY id DESC LIMIT %s",
+     lambda s: (s["location"], 51), False),
+    ("history_location_bhk_price",
+     HISTORY_SELECT + " WHERE location = %s AND bhk = %s AND price >= %s AND price <= %s "
+                      "ORDER BY id DESC LIMIT %s",
+     lambda s: (s["location"], 3, 5000000, 15000000, 51), False),
+    ("history_price_range", HISTORY_SELECT + " WHERE price >= %s AND price <= %s "
+                                             "ORDER BY id DESC LIMIT %s",
+     lambda s: (29000000, 30000000, 51), False),
+    ("history_export_location", HISTORY_SELECT + " WHERE location = %s ORDER BY id DESC",
+     lambda s: (s["location"],), False),
+    ("chart_area_price", "SELECT area, price FROM house_data LIMIT 100", lambda s: (), False),
+    ("chart_age_price", "SELECT age, price FROM house_data LIMIT 100", lambda s: (), False),
+    ("chart_summary", "SELECT dimension, value, price_sum / row_count AS avg_price "
+                      "FROM house_data_summary WHERE row_count > 0", lambda s: (), False),
+    ("submit_feedback", "INSERT INTO feedback_data (user_id, username, rating, feedback) "
+                        "VALUES (%s, %s, %s, %s)",
+     lambda s: (s["user_id"], s["username"], 5, "Great"), True),
+    ("view_feedback", "SELECT username, rating, feedback, created_at FROM feedback_data "
+                      "ORDER BY created_at DESC", lambda s: (), False),
+    ("view_help", "SELECT * FROM help_requests ORDER BY created_at DESC", lambda s: (), False),
+    ("resolve_help", "UPDATE help_requests SET status='Resolved' WHERE id=%s",
+     lambda s: (s["help_id"],), True),
+    ("retrain_history", "SELECT * FROM retrain_history ORDER BY retrained_at DESC",
+     lambda s: (), False),
+    ("retrain_settled_id", SETTLED_ID_SQL, lambda s: (300,), False),
+    ("retrain_new_rows", "SELECT COUNT(*) FROM house_data WHERE id > %s AND id <= %s",
+     lambda s: (s["middle_id"], s["middle_id"] + 1000), False),
+    ("snapshot_rows", SELECT_ROWS_SQL, lambda s: (s["middle_id"], s["middle_id"] + 100000, 100000), False),
+    ("retrain_status", "SELECT job_id, retrained_by, dataset_name, status, retrained_at, metrics "
+                       "FROM retrain_history WHERE job_id = %s ORDER BY id DESC LIMIT 1",
+     lambda s: (s["job_id"],), False),
+    ("terms_latest_version", "SELECT version FROM terms_conditions ORDER BY id DESC LIMIT 1",
+     lambda s: (), False),
+    ("terms_active", "SELECT content, version, updated_by, updated_at FROM terms_conditions "
+                     "WHERE status='active' LIMIT 1", lambda s: (), False),
+]
+
+
+# ---------- BACKENDS ----------
+class SqliteBackend:
+    name = "sqlite"
+
+    def __init__(self, workdir):
+        self.workdir = workdir
+        self.conn = None
+
+    def create(self, n):
+        path = os.path.join(self.workdir, f"bench_{n}.db")
+        if os.path.exists(path):
+            os.remove(path)
+        self.conn = StandinServer(path).connect()
+
+    def drop_index(self, table, name):
+        self.execute(f"DROP INDEX `{name}`")
+
+    def apply_migration(self, sql):
+        for table, name, columns in secondary_keys(sql):
+            self.execute(f"CREATE INDEX `{name}` ON `{table}` ({', '.join(columns)})")
+        self.execute("ANALYZE")
+
+    def explain(self, sql, params):
+        cursor = self.conn.cursor()
+        cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+        return [row[-1] for row in cursor.fetchall()]
+
+    def execute(self, sql, params=()):
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        cursor.close()
+        return rows
+
+
+class MysqlBackend:
+    name = "mysql"
+
+    def __init__(self, config, database):
+        import mysql.connector
+        self.connect = lambda **kw: mysql.connector.connect(**dict(config, **kw))
+        self.database = database
+        self.conn = None
+
+    def create(self, n):
+        if self.conn is not None:
+            self.conn.close()
+        conn = self.connect(database=None)
+        cursor = conn.cursor()
+        cursor.execute(f"DROP DATABASE IF EXISTS `{self.database}`")
+        cursor.execute(f"CREATE DATABASE `{self.database}`")
+        conn.close()
+
+        self.conn = self.connect(database=self.database)
+        with open(SCHEMA_FILE, encoding="utf-8") as f:
+            dump = f.read()
+        for statement in re.split(r";\s*\n", dump):
+            statement = "\n".join(l for l in statement.splitlines() if not l.startswith("--"))
+            if statement.strip():
+                self.execute(statement)
+        self.conn.commit()
+
+    def drop_index(self, table, name):
+        self.execute(f"ALTER TABLE `{table}` DROP INDEX `{name}`")
+
+    def apply_migration(self, sql):
+        for statement in re.findall(r"ALTER TABLE .*?;", sql, re.S):
+            self.execute(statement.rstrip(";"))
+        for table in {t for t, _, _ in secondary_keys(sql)}:
+            self.execute(f"ANALYZE TABLE `{table}`")
+
+    def explain(self, sql, params):
+        cursor = self.conn.cursor(dictionary=True)
+        cursor.execute("EXPLAIN " + sql, params)
+        plan = [
+            f"{r['table']}: type={r['type']} key={r['key']} rows={r['rows']} {r['Extra'] or ''}".strip()
+            for r in cursor.fetchall()
+        ]
+        cursor.close()
+        return plan
+
+    def execute(self, sql, params=()):
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        rows = cursor.fetchall() if cursor.with_rows else []
+        cursor.close()
+        return rows
+
+
+# ---------- SEEDING ----------
+def _timestamp(rng, start):
+    return (start + timedelta(seconds=rng.randrange(365 * 86400))).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _insert(backend, sql, rows, batch=10000):
+    cursor = backend.conn.cursor()
+    for i in range(0, len(rows), batch):
+        cursor.executemany(sql, rows[i:i + batch])
+    cursor.close()
+    backend.conn.commit()
+
+
+def _count(backend, table):
+    return backend.execute(f"SELECT COUNT(*) FROM {table}")[0][0]
+
+
+def seed(backend, n, rng):
+    start = datetime.now() - timedelta(days=365)
+    target = {table: max(1, int(n * scale)) for table, scale in TABLE_SCALE.items()}
+
+    missing = target["userdata"] - _count(backend, "userdata")
+    offset = _count(backend, "userdata")
+    _insert(backend, "INSERT INTO userdata (Username, Usertype, Email, Password) VALUES (%s, %s, %s, %s)", [
+        (f"user{offset + i}", rng.choice(["customer", "customer", "agent", "admin"]),
+         f"u{offset + i}@mail.com", "pbkdf2:sha256:bench")
+        for i in range(missing)
+    ])
+    low, high = backend.execute("SELECT MIN(user_id), MAX(user_id) FROM userdata")[0]
+
+    missing = target["house_data"] - _count(backend, "house_data")
+    _insert(backend, "INSERT INTO house_data (location, property_type, area, bhk, bath, balcony, "
+                     "parking, furnishing, age, price, created_at) "
+                     "VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)", [
+        (rng.choice(LOCATIONS), rng.choice(PROPERTY_TYPES), rng.randint(500, 3000),
+         rng.randint(1, 5), rng.randint(1, 5), rng.randint(0, 2), rng.randint(0, 2),
+         rng.choice(FURNISHING), rng.randint(0, 20), rng.randrange(2000000, 30000000, 10000),
+         _timestamp(rng, start))
+        for _ in range(missing)
+    ])
+
+    missing = target["feedback_data"] - _count(backend, "feedback_data")
+    _insert(backend, "INSERT INTO feedback_data (user_id, username, rating, feedback, created_at) "
+                     "VALUES (%s, %s, %s, %s, %s)", [
+        (uid, f"user{uid}", rng.randint(1, 5), "Synthetic feedback", _timestamp(rng, start))
+        for uid in (rng.randint(low, high) for _ in range(missing))
+    ])
+
+    missing = target["help_requests"] - _count(backend, "help_requests")
+    _insert(backend, "INSERT INTO help_requests (username, usertype, subject, message, status, created_at) "
+                     "VALUES (%s, %s, %s, %s, %s, %s)", [
+        (f"user{rng.randint(low, high)}", "customer", "Synthetic request", "Please help",
+         rng.choice(["Pending", "Resolved"]), _timestamp(rng, start))
+        for _ in range(missing)
+    ])
+
+    missing = target["retrain_history"] - _count(backend, "retrain_history")
+    _insert(backend, "INSERT INTO retrain_history (job_id, retrained_by, dataset_name, status, retrained_at) "
+                     "VALUES (%s, %s, %s, %s, %s)", [
+        (uuid.UUID(int=rng.getrandbits(128)).hex, "admin", "houses.csv",
+         rng.choice(["Queued", "Fitting", "Saved", "Failed"]), _timestamp(rng, start))
+        for _ in range(missing)
+    ])
+
+    # Values from the middle of each table, so no lookup hits the first page by luck
+    user_id = (low + high) // 2
+    username, usertype, email = backend.execute(
+        "SELECT Username, Usertype, Email FROM userdata WHERE user_id = %s", (user_id,))[0]
+    low_id, high_id = backend.execute("SELECT MIN(id), MAX(id) FROM house_data")[0]
+    help_low, help_high = backend.execute("SELECT MIN(id), MAX(id) FROM help_requests")[0]
+    job_id = backend.execute("SELECT job_id FROM retrain_history WHERE job_id IS NOT NULL "
+                             "ORDER BY id LIMIT 1")
+    return {
+        "user_id": user_id, "username": username, "usertype": usertype, "email": email,
+        "middle_id": (low_id + high_id) // 2, "location": LOCATIONS[0],
+        "help_id": (help_low + help_high) // 2,
+        "job_id": job_id[0][0] if job_id else "missing",
+    }
+
+
+# ---------- MEASUREMENT ----------
+def run_queries(backend, sample, repeat):
+    results = {}
+    for name, sql, params, writes in QUERIES:
+        args = params(sample)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            backend.execute(sql, args)
+            timings.append((time.perf_counter() - start) * 1000)
+            if writes:
+                backend.conn.rollback()
+        results[name] = {
+            "median_ms": statistics.median(timings),
+            "plan": backend.explain(sql, args),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--mysql", action="store_true", help="use the MySQL server from app.DB_CONFIG")
+    parser.add_argument("--database", default="house_app_bench",
+                        help="scratch MySQL database (dropped and recreated)")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args()
+
+    with open(MIGRATION_FILE, encoding="utf-8") as f:
+        migration = f.read()
+    new_keys = secondary_keys(migration)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.mysql:
+            from app import DB_CONFIG
+            backend = MysqlBackend(DB_CONFIG, args.database)
+        else:
+            backend = SqliteBackend(workdir)
+
+        report = {"backend": backend.name, "migration": os.path.basename(MIGRATION_FILE), "sizes": []}
+        for n in args.rows:
+            rng = random.Random(42)
+            backend.create(n)
+            for table, name, _ in new_keys:
+                backend.drop_index(table, name)
+
+            start = time.perf_counter()
+            sample = seed(backend, n, rng)
+            print(f"\nseeded {n} rows in {time.perf_counter() - start:.1f}s")
+
+            before = run_queries(backend, sample, args.repeat)
+            start = time.perf_counter()
+            backend.apply_migration(migration)
+            migrate_s = time.perf_counter() - start
+            after = run_queries(backend, sample, args.repeat)
+
+            print(f"migration applied in {migrate_s:.2f}s")
+            print(f"{'query':<28} {'before ms':>10} {'after ms':>10} {'speedup':>8}  plan after")
+            for name, _, _, _ in QUERIES:
+                b, a = before[name]["median_ms"], after[name]["median_ms"]
+                print(f"{name:<28} {b:>10.3f} {a:>10.3f} {b / a if a else 0:>7.1f}x  "
+                      f"{' | '.join(after[name]['plan'])}")
+
+            report["sizes"].append({
+                "rows": n, "migration_seconds": migrate_s,
+                "queries": {name: {"before": before[name], "after": after[name]}
+                            for name, _, _, _ in QUERIES},
+            })
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nreport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
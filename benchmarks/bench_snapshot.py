@@ -0,0 +1,139 @@
+"""Load time and peak memory of the house_data snapshot versus CSV.
+
+Generates --rows listings, loads them into the SQLite stand-in's house_data
+and exports them with house_snapshot (zstd and uncompressed), timing the
+export and an append of 1% new rows. Every load then runs in a fresh
+process, so peak RSS is that load's alone:
+
+    csv: pd.read_csv             plain pandas, object columns
+    csv: load_training_frame     what retraining does with an upload
+    snapshot: training frame     load_training_frame on the snapshot
+    snapshot: read_frame         all columns, for analytics
+    snapshot: 2 columns          location and price only
+
+    python benchmarks/bench_snapshot.py                  # 1M rows
+    python benchmarks/bench_snapshot.py --rows 200000
+"""
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+
+import house_snapshot
+from bench_ingest import peak_rss_kib
+from bench_training import write_csv
+from db_pool import ConnectionPool
+from standin_db import StandinServer
+from training_data import REQUIRED_COLUMNS, load_training_frame
+
+INSERT_SQL = f"INSERT INTO house_data ({', '.join(REQUIRED_COLUMNS)}) VALUES ({', '.join(['%s'] * 10)})"
+
+
+def _load(kind, path, results):
+    import pyarrow  # noqa: F401  (imported before the baseline in every run)
+
+    baseline = peak_rss_kib()
+    start = time.perf_counter()
+    if kind == "read_csv":
+        frame = pd.read_csv(path)
+    elif kind == "training":
+        frame, _ = load_training_frame(path)
+    elif kind == "read_frame":
+        frame = house_snapshot.read_frame(path)
+    else:
+        frame = house_snapshot.read_frame(path, columns=["location", "price"])
+    elapsed = time.perf_counter() - start
+    results.put({
+        "seconds": elapsed,
+        "peak_mib": (peak_rss_kib() - baseline) / 1024,
+        "frame_mib": frame.memory_usage(deep=True).sum() / 2**20,
+        "rows": len(frame),
+    })
+
+
+def run(kind, path):
+    context = mp.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_load, args=(kind, path, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def disk_mib(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path) / 2**20
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path)
+               if name.startswith("part-")) / 2**20
+
+
+def insert_csv(pool, csv_path):
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        for chunk in pd.read_csv(csv_path, chunksize=100_000):
+            cursor.executemany(INSERT_SQL, chunk[REQUIRED_COLUMNS].itertuples(index=False, name=None))
+        conn.commit()
+        cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    if not house_snapshot.available():
+        sys.exit("the snapshot needs pyarrow: pip install pyarrow")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = os.path.join(workdir, "houses.csv")
+        write_csv(csv_path, args.rows, np.random.default_rng(42))
+        pool = ConnectionPool(StandinServer().connect, size=2)
+        insert_csv(pool, csv_path)
+
+        snapshots = {}
+        print(f"{args.rows} rows (+1001 seeded), export from the SQLite stand-in")
+        print(f"{'export':<22} {'seconds':>8} {'MiB on disk':>12}")
+        for compression in ("zstd", "none"):
+            directory = os.path.join(workdir, f"snapshot-{compression}")
+            start = time.perf_counter()
+            manifest = house_snapshot.export_snapshot(pool.connection, directory, compression=compression,
+                                                      settle_seconds=0)
+            print(f"{'full, ' + compression:<22} {time.perf_counter() - start:>8.2f} {disk_mib(directory):>12.1f}")
+            snapshots[compression] = directory
+
+        extra_path = os.path.join(workdir, "extra.csv")
+        write_csv(extra_path, max(args.rows // 100, 1), np.random.default_rng(7))
+        insert_csv(pool, extra_path)
+        start = time.perf_counter()
+        appended = house_snapshot.export_snapshot(pool.connection, snapshots["zstd"], settle_seconds=0)
+        print(f"{'append 1%, zstd':<22} {time.perf_counter() - start:>8.2f} "
+              f"{disk_mib(snapshots['zstd']):>12.1f}  ({appended['rows'] - manifest['rows']} rows)")
+        print(f"{'CSV file':<22} {'':>8} {disk_mib(csv_path):>12.1f}")
+
+        loads = [
+            ("csv: pd.read_csv", "read_csv", csv_path),
+            ("csv: load_training_frame", "training", csv_path),
+            ("snapshot zstd: training frame", "training", snapshots["zstd"]),
+            ("snapshot none: training frame", "training", snapshots["none"]),
+            ("snapshot zstd: read_frame", "read_frame", snapshots["zstd"]),
+            ("snapshot none: read_frame", "read_frame", snapshots["none"]),
+            ("snapshot zstd: 2 columns", "columns", snapshots["zstd"]),
+            ("snapshot none: 2 columns", "columns", snapshots["none"]),
+        ]
+        print()
+        print(f"{'load':<32} {'seconds':>8} {'peak MiB':>9} {'frame MiB':>10} {'rows':>9}")
+        for name, kind, path in loads:
+            r = run(kind, path)
+            print(f"{name:<32} {r['seconds']:>8.3f} {r['peak_mib']:>9.1f} {r['frame_mib']:>10.1f} {r['rows']:>9}")
+
+
+if __name__ == "__main__":
+    main()
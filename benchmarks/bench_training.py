@@ -0,0 +1,135 @@
+"""Wall time, peak RSS and holdout error of retraining configurations.
+
+Every configuration trains in a fresh process on the same generated CSV and
+is scored on the same 20% holdout retrain_jobs uses. "incremental" first
+fits --trees trees on 90% of the training rows (not timed), then times
+warm-starting --add-trees more on the remaining 10%, the way an incremental
+retrain extends the deployed model with newly stored rows.
+
+    python benchmarks/bench_training.py                       # 100k rows
+    python benchmarks/bench_training.py --rows 1000000 --trees 300
+"""
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import train_test_split
+
+from bench_ingest import LOCATIONS, peak_rss_kib
+from retrain_jobs import build_pipeline, extend_model
+from training_data import REQUIRED_COLUMNS, load_training_frame
+
+LOCATION_RATE = dict(zip(LOCATIONS, np.linspace(4_000, 12_000, len(LOCATIONS))))
+FURNISHING_PREMIUM = {"Fully-Furnished": 1.15, "Semi-Furnished": 1.05, "Unfurnished": 1.0}
+TYPE_PREMIUM = {"Apartment": 1.0, "Independent House": 1.2, "Villa": 1.5}
+
+
+def write_csv(path, n, rng):
+    # Unlike bench_ingest's random prices these follow the features, so
+    # holdout error says something about the configurations
+    frame = pd.DataFrame({
+        "area": rng.integers(500, 3000, n),
+        "location": rng.choice(LOCATIONS, n),
+        "bhk": rng.integers(1, 6, n),
+        "bath": rng.integers(1, 6, n),
+        "balcony": rng.integers(0, 3, n),
+        "parking": rng.integers(0, 3, n),
+        "furnishing": rng.choice(list(FURNISHING_PREMIUM), n),
+        "property_type": rng.choice(list(TYPE_PREMIUM), n),
+        "age": rng.integers(0, 20, n),
+    })
+    frame["price"] = (
+        frame["area"] * frame["location"].map(LOCATION_RATE)
+        * frame["furnishing"].map(FURNISHING_PREMIUM)
+        * frame["property_type"].map(TYPE_PREMIUM)
+        * (1 - frame["age"] * 0.01)
+        + frame["parking"] * 300_000 + frame["bath"] * 150_000
+    ) * rng.normal(1.0, 0.08, n)
+    frame[REQUIRED_COLUMNS].round({"price": 0}).to_csv(path, index=False)
+
+
+def _train(config, csv_path, results):
+    data, _ = load_training_frame(csv_path)
+    X = data.drop("price", axis=1)
+    y = data["price"]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    if config["mode"] == "incremental":
+        split = int(len(X_train) * 0.9)
+        pipeline = build_pipeline(config["trees"], config["n_jobs"], config["max_samples"])
+        pipeline.fit(X_train[:split], y_train[:split])
+        baseline = peak_rss_kib()
+        start = time.perf_counter()
+        extend_model(pipeline, X_train[split:], y_train[split:], config["add_trees"],
+                     n_jobs=config["n_jobs"], max_samples=config["max_samples"])
+    else:
+        baseline = peak_rss_kib()
+        start = time.perf_counter()
+        pipeline = build_pipeline(config["trees"], config["n_jobs"], config["max_samples"])
+        pipeline.fit(X_train, y_train)
+    elapsed = time.perf_counter() - start
+    peak = (peak_rss_kib() - baseline) / 1024
+
+    pipeline.named_steps["rf"].set_params(n_jobs=None)
+    predicted = pipeline.predict(X_test)
+    results.put({
+        "seconds": elapsed,
+        "peak_mib": peak,
+        "mae": mean_absolute_error(y_test, predicted),
+        "rmse": float(np.sqrt(mean_squared_error(y_test, predicted))),
+        "r2": r2_score(y_test, predicted),
+        "trees": len(pipeline.named_steps["rf"].estimators_),
+    })
+
+
+def run(config, csv_path):
+    context = mp.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_train, args=(config, csv_path, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--trees", type=int, default=100)
+    parser.add_argument("--add-trees", type=int, default=50)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    full = {"mode": "full", "trees": args.trees, "add_trees": args.add_trees}
+    configs = [
+        ("1 core", dict(full, n_jobs=None, max_samples=None)),
+        (f"n_jobs=-1 ({cores} cpu)", dict(full, n_jobs=-1, max_samples=None)),
+        (f"n_jobs=-1 ({cores} cpu), max_samples=0.5", dict(full, n_jobs=-1, max_samples=0.5)),
+        (f"n_jobs=-1 ({cores} cpu), max_samples=0.2", dict(full, n_jobs=-1, max_samples=0.2)),
+        (f"incremental +{args.add_trees}", dict(full, mode="incremental", n_jobs=-1, max_samples=None)),
+    ]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path = os.path.join(workdir, "houses.csv")
+        write_csv(csv_path, args.rows, np.random.default_rng(42))
+
+        print(f"{args.rows} rows, {args.trees} trees")
+        print(f"{'configuration':<40} {'seconds':>8} {'peak MiB':>9} {'trees':>6} "
+              f"{'MAE':>12} {'RMSE':>12} {'R2':>7}")
+        for name, config in configs:
+            r = run(config, csv_path)
+            print(f"{name:<40} {r['seconds']:>8.2f} {r['peak_mib']:>9.1f} {r['trees']:>6} "
+                  f"{r['mae']:>12,.0f} {r['rmse']:>12,.0f} {r['r2']:>7.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+"""Load test for app.py with a JSON baseline to catch performance regressions.
+
+Trains a small model in place of house_price_model.pkl, starts the app over
+HTTP in a child process against the SQLite stand-in seeded from
+house_app_database.sql (or a MySQL database loaded from it), and drives a
+weighted mix of signin, /prediction, /history, /chart-data and
+/view_feedback from --users concurrent clients with keep-alive connections.
+
+    python benchmarks/loadtest.py --users 8 --duration 30 --save-baseline baseline.json
+    python benchmarks/loadtest.py --users 8 --duration 30 --baseline baseline.json
+    python benchmarks/loadtest.py --mysql --database house_app_bench   # scratch copy, rows are written
+
+With --baseline the run fails (exit status 1) when an operation's p95 grows,
+or its throughput falls, by more than --tolerance (default 20%), or when more
+than --max-error-rate of its requests fail. Baselines only compare runs on the
+same machine with the same options.
+"""
+import argparse
+import http.client
+import json
+import logging
+import os
+import platform
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlencode
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+BENCH_USER = "loadtest"
+BENCH_PASSWORD = "loadtest-password"
+
+DEFAULT_MIX = "prediction=40,history=25,chart=15,feedback=15,signin=5"
+
+# The area is drawn per request, so most predictions miss the prediction cache
+PREDICTION_FORMS = [
+    {"location": location, "type": p_type, "bhk": str(bhk), "bath": str(bhk),
+     "balcony": "1", "parking": "1", "furnishing": furnishing, "age": str(age)}
+    for location, p_type, furnishing in [
+        ("Whitefield", "Apartment", "Semi-Furnished"),
+        ("Hebbal", "Villa", "Fully-Furnished"),
+        ("Kengeri", "Independent House", "Unfurnished"),
+        ("Jayanagar", "Apartment", "Fully-Furnished"),
+    ]
+    for bhk, age in [(1, 12), (2, 5), (3, 2), (4, 8)]
+]
+HISTORY_QUERIES = ["", "?location=Whitefield", "?bhk=2", "?property_type=Villa&min_price=5000000"]
+
+
+# ---------- SERVER (child process) ----------
+def serve(workdir, mysql_database, pool_size):
+    # The legacy model path and MODEL_DIR are relative to the working directory
+    os.chdir(workdir)
+    os.environ.setdefault("MODEL_DIR", os.path.join(workdir, "models"))
+    os.environ.setdefault("RETRAIN_UPLOAD_DIR", os.path.join(workdir, "uploads"))
+
+    from werkzeug.security import generate_password_hash
+    from werkzeug.serving import make_server
+
+    import app as house_app
+    from db_pool import ConnectionPool
+
+    if mysql_database:
+        house_app.DB_CONFIG["database"] = mysql_database
+        import mysql.connector
+        connect = lambda: mysql.connector.connect(**house_app.DB_CONFIG)
+    else:
+        from standin_db import StandinServer
+        connect = StandinServer().connect
+    pool = ConnectionPool(connect, size=pool_size, max_overflow=pool_size * 2,
+                          observe=house_app.observe_phase if house_app.METRICS_ENABLED else None)
+    house_app.db_pool = pool
+    house_app.db_connection = pool.connection
+
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM userdata WHERE Username = %s", (BENCH_USER,))
+        cursor.execute("SELECT COALESCE(MAX(user_id), 0) + 1 FROM userdata")
+        user_id = cursor.fetchone()[0]
+        cursor.execute(
+            "INSERT INTO userdata (user_id, Username, Usertype, Email, Password) VALUES (%s, %s, %s, %s, %s)",
+            (user_id, BENCH_USER, "customer", "load@test", generate_password_hash(BENCH_PASSWORD)))
+        conn.commit()
+        cursor.close()
+
+    house_app.serving_model.warm()
+    server = make_server("127.0.0.1", 0, house_app.app, threaded=True)
+    # terminate() from the parent unwinds serve_forever so queued rows are written
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f"READY {server.server_port}", flush=True)
+    # Nobody reads the pipe after READY; app prints go to stderr instead of filling it
+    sys.stdout = sys.stderr
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    try:
+        server.serve_forever()
+    finally:
+        house_app.prediction_writer.close()
+
+
+def train_small_model(workdir, rows, trees):
+    import joblib
+    import numpy as np
+
+    from bench_training import write_csv
+    from retrain_jobs import build_pipeline
+    from training_data import load_training_frame
+
+    csv_path = os.path.join(workdir, "train.csv")
+    write_csv(csv_path, rows, np.random.default_rng(42))
+    data, _ = load_training_frame(csv_path)
+    pipeline = build_pipeline(trees)
+    pipeline.fit(data.drop("price", axis=1), data["price"])
+    joblib.dump(pipeline, os.path.join(workdir, "house_price_model.pkl"))
+    os.remove(csv_path)
+
+
+def start_server(workdir, args):
+    command = [sys.executable, os.path.abspath(__file__), "--serve", workdir,
+               "--pool-size", str(args.pool_size)]
+    if args.mysql:
+        command += ["--mysql", "--database", args.database]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    for line in process.stdout:
+        if line.startswith("READY "):
+            return process, int(line.split()[1])
+    process.wait()
+    sys.exit(f"server exited with status {process.returncode} before it was ready")
+
+
+# ---------- CLIENTS ----------
+class VirtualUser:
+    """One signed-in browser: its own keep-alive connection and session cookie."""
+
+    def __init__(self, port, rng):
+        self.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        self.rng = rng
+        self.cookie = None
+
+    def request(self, method, path, form=None):
+        headers = {"Cookie": self.cookie} if self.cookie else {}
+        body = None
+        if form is not None:
+            body = urlencode(form)
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        try:
+            self.conn.request(method, path, body=body, headers=headers)
+            response = self.conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            raise
+        cookie = response.getheader("Set-Cookie")
+        if cookie:
+            self.cookie = cookie.split(";", 1)[0]
+        return response.status
+
+    # Each operation returns True when the app answered the way a browser expects
+    def signin(self):
+        status = self.request("POST", "/signin", {
+            "usertype": "customer", "username": BENCH_USER, "password": BENCH_PASSWORD})
+        return status == 302
+
+    def prediction(self):
+        form = dict(self.rng.choice(PREDICTION_FORMS), area=str(self.rng.randint(500, 3000)))
+        return self.request("POST", "/prediction", form) == 200
+
+    def history(self):
+        return self.request("GET", "/history" + self.rng.choice(HISTORY_QUERIES)) == 200
+
+    def chart(self):
+        return self.request("GET", "/chart-data") in (200, 304)
+
+    def feedback(self):
+        return self.request("GET", "/view_feedback") in (200, 304)
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if not hasattr(VirtualUser, name.strip()):
+            raise SystemExit(f"unknown operation in --mix: {name}")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def run_user(port, seed, mix, warmup_until, stop_at, samples, lock):
+    rng = random.Random(seed)
+    user = VirtualUser(port, rng)
+    names, weights = list(mix), list(mix.values())
+    user.signin()
+    local = []
+    while True:
+        now = time.perf_counter()
+        if now >= stop_at:
+            break
+        name = rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        try:
+            ok = getattr(user, name)()
+        except (OSError, http.client.HTTPException):
+            ok = False
+            user = VirtualUser(port, rng)
+            user.signin()
+        elapsed = time.perf_counter() - start
+        if start >= warmup_until:
+            local.append((name, elapsed, ok))
+    with lock:
+        samples.extend(local)
+
+
+# ---------- REPORT ----------
+def percentile(sorted_values, q):
+    # Nearest rank
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(q / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(timings, errors, seconds):
+    timings = sorted(timings)
+    count = len(timings)
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 4) if count else 0.0,
+        "throughput_rps": round(count / seconds, 2),
+        "mean_ms": round(sum(timings) / count * 1000, 3) if count else 0.0,
+        "p50_ms": round(percentile(timings, 50) * 1000, 3),
+        "p95_ms": round(percentile(timings, 95) * 1000, 3),
+        "p99_ms": round(percentile(timings, 99) * 1000, 3),
+    }
+
+
+def build_report(samples, seconds, args, mix):
+    operations = {}
+    for name in mix:
+        rows = [(elapsed, ok) for op, elapsed, ok in samples if op == name]
+        operations[name] = summarize([e for e, _ in rows], sum(1 for _, ok in rows if not ok), seconds)
+    overall = summarize([e for _, e, _ in samples], sum(1 for *_, ok in samples if not ok), seconds)
+    return {
+        "config": {
+            "backend": "mysql" if args.mysql else "sqlite-standin",
+            "users": args.users, "duration": args.duration, "warmup": args.warmup,
+            "mix": mix, "model_trees": args.trees, "pool_size": args.pool_size,
+        },
+        "environment": {"python": platform.python_version(), "cpus": os.cpu_count(),
+                        "machine": platform.machine()},
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "overall": overall,
+        "operations": operations,
+    }
+
+
+def print_report(report):
+    print(f"{'operation':<12} {'requests':>9} {'errors':>7} {'req/s':>9} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    rows = list(report["operations"].items()) + [("overall", report["overall"])]
+    for name, r in rows:
+        print(f"{name:<12} {r['requests']:>9} {r['errors']:>7} {r['throughput_rps']:>9.1f} "
+              f"{r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f}")
+
+
+def compare(report, baseline, tolerance, max_error_rate):
+    """Regression messages for operations present in both runs."""
+    failures = []
+    for name, current in report["operations"].items():
+        if current["error_rate"] > max_error_rate:
+            failures.append(f"{name}: error rate {current['error_rate']:.2%} above {max_error_rate:.2%}")
+        base = baseline["operations"].get(name)
+        if base is None or not base["requests"]:
+            continue
+        if current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            failures.append(f"{name}: p95 {current['p95_ms']:.2f} ms vs baseline {base['p95_ms']:.2f} ms")
+        if current["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            failures.append(f"{name}: {current['throughput_rps']:.1f} req/s vs baseline "
+                            f"{base['throughput_rps']:.1f} req/s")
+    if baseline.get("config") != report["config"]:
+        print("warning: baseline was recorded with different options:", baseline.get("config"))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=8, help="concurrent clients")
+    parser.add_argument("--duration", type=float, default=30, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="seconds before measuring")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="operation=weight,...")
+    parser.add_argument("--trees", type=int, default=50, help="trees in the generated model")
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--mysql", action="store_true", help="use MySQL from app.DB_CONFIG")
+    parser.add_argument("--database", default="house_app_bench",
+                        help="MySQL database loaded from house_app_database.sql; it is written to")
+    parser.add_argument("--output", help="write this run's JSON report here")
+    parser.add_argument("--save-baseline", help="write the report as the baseline")
+    parser.add_argument("--baseline", help="compare with this baseline and fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--serve", metavar="WORKDIR", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.database if args.mysql else None, args.pool_size)
+        return
+
+    mix = parse_mix(args.mix)
+    with tempfile.TemporaryDirectory() as workdir:
+        train_small_model(workdir, rows=5000, trees=args.trees)
+        process, port = start_server(workdir, args)
+        try:
+            samples, lock = [], threading.Lock()
+            begin = time.perf_counter()
+            warmup_until = begin + args.warmup
+            stop_at = warmup_until + args.duration
+            threads = [threading.Thread(target=run_user,
+                                        args=(port, i, mix, warmup_until, stop_at, samples, lock))
+                       for i in range(args.users)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            process.terminate()
+            process.wait()
+
+    report = build_report(samples, args.duration, args, mix)
+    print_report(report)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"report written to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        failures = compare(report, baseline, args.tolerance, args.max_error_rate)
+        if failures:
+            print("\nREGRESSION")
+            for failure in failures:
+                print("  " + failure)
+            sys.exit(1)
+        print(f"\nno regressions beyond {args.tolerance:.0%} of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
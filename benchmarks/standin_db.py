@@ -0,0 +1,167 @@
+"""SQLite stand-in for the MySQL database, seeded from house_app_database.sql.
+
+Only meant for benchmarks: it speaks the small slice of the mysql.connector
+API that app.py uses (cursor(dictionary=True), %s placeholders, executemany,
+commit, ping) and can simulate the TCP/auth handshake of a real server.
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_FILE = os.path.join(ROOT, "house_app_database.sql")
+
+
+def secondary_keys(sql):
+    """(table, index name, [columns]) for every ADD KEY in ALTER TABLE statements."""
+    keys = []
+    for table, body in re.findall(r"ALTER TABLE `(\w+)`(.*?);", sql, re.S):
+        for name, columns in re.findall(r"ADD KEY `(\w+)` \(([^)]*)\)", body):
+            keys.append((table, name, re.findall(r"`(\w+)`", columns)))
+    return keys
+
+
+def _mysql_to_sqlite(dump):
+    primary_keys = {
+        table: re.findall(r"`(\w+)`", columns)
+        for table, columns in re.findall(r"ALTER TABLE `(\w+)`\s+ADD PRIMARY KEY \(([^)]*)\)", dump)
+    }
+    statements = []
+
+    for table, body in re.findall(r"CREATE TABLE `(\w+)` \((.*?)\n\)", dump, re.S):
+        columns = []
+        for line in body.strip().splitlines():
+            line = line.strip().rstrip(",")
+            name = re.match(r"`(\w+)`", line).group(1)
+            if [name] == primary_keys.get(table) and re.match(r"`\w+` (big)?int", line):
+                columns.append(f"`{name}` INTEGER PRIMARY KEY")
+                continue
+            line = re.sub(r"ON UPDATE current_timestamp\(\)", "", line)
+            line = line.replace("current_timestamp()", "CURRENT_TIMESTAMP")
+            line = re.sub(r"enum\([^)]*\)", "TEXT", line)
+            columns.append(line)
+        if primary_keys.get(table) and not any("PRIMARY KEY" in c for c in columns):
+            columns.append(f"PRIMARY KEY ({', '.join(primary_keys[table])})")
+        statements.append(f"CREATE TABLE `{table}` ({', '.join(columns)})")
+
+    for insert in re.findall(r"^INSERT INTO .*?\);$", dump, re.S | re.M):
+        insert = insert.replace("\\r", "\r").replace("\\n", "\n").replace("\\'", "''")
+        statements.append(insert)
+
+    for table, name, columns in secondary_keys(dump):
+        statements.append(f"CREATE INDEX `{name}` ON `{table}` ({', '.join(columns)})")
+
+    return statements
+
+
+def create_database(path=":memory:", schema_file=SCHEMA_FILE):
+    db = sqlite3.connect(path, check_same_thread=False)
+    with open(schema_file, encoding="utf-8") as f:
+        for statement in _mysql_to_sqlite(f.read()):
+            db.execute(statement)
+    db.commit()
+    return db
+
+
+def _translate(query):
+    query = query.replace("%s", "?")
+    # created_at is stored as UTC text, like SQLite's datetime('now')
+    query = query.replace("NOW() - INTERVAL ? SECOND", "datetime('now', '-' || ? || ' seconds')")
+    # MySQL upsert -> SQLite upsert
+    if "ON DUPLICATE KEY UPDATE" in query:
+        query = query.replace("ON DUPLICATE KEY UPDATE", "ON CONFLICT DO UPDATE SET")
+        query = re.sub(r"VALUES\((\w+)\)", r"excluded.\1", query)
+    return query
+
+
+class StandinCursor:
+    def __init__(self, conn, dictionary=False, **kwargs):
+        self._conn = conn
+        self._cursor = conn._db.cursor()
+        self._dictionary = dictionary
+
+    def _row(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip([d[0] for d in self._cursor.description], row))
+
+    def execute(self, query, params=()):
+        with self._conn._lock:
+            self._cursor.execute(_translate(query), tuple(params))
+
+    def executemany(self, query, seq_params):
+        with self._conn._lock:
+            self._cursor.executemany(_translate(query), [tuple(p) for p in seq_params])
+
+    def fetchone(self):
+        return self._row(self._cursor.fetchone())
+
+    def fetchmany(self, size=1):
+        return [self._row(r) for r in self._cursor.fetchmany(size)]
+
+    def fetchall(self):
+        return [self._row(r) for r in self._cursor.fetchall()]
+
+    def __iter__(self):
+        for row in self._cursor:
+            yield self._row(row)
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    def close(self):
+        self._cursor.close()
+
+
+class StandinConnection:
+    def __init__(self, db, lock):
+        self._db = db
+        self._lock = lock
+        self.in_transaction = False
+
+    def cursor(self, **kwargs):
+        return StandinCursor(self, **kwargs)
+
+    def commit(self):
+        with self._lock:
+            self._db.commit()
+
+    def rollback(self):
+        with self._lock:
+            self._db.rollback()
+
+    def ping(self, reconnect=False, attempts=1, delay=0):
+        return None
+
+    def is_connected(self):
+        return True
+
+    def close(self):
+        pass
+
+
+class StandinServer:
+    """Hands out connections to one shared SQLite database.
+
+    connect_latency is slept on every connect() to model the handshake cost
+    of a fresh mysql.connector connection.
+    """
+
+    def __init__(self, path=":memory:", connect_latency=0.0):
+        self.db = create_database(path)
+        self.lock = threading.RLock()
+        self.connect_latency = connect_latency
+        self.connects = 0
+
+    def connect(self, **kwargs):
+        if self.connect_latency:
+            time.sleep(self.connect_latency)
+        self.connects += 1
+        return StandinConnection(self.db, self.lock)
@@ -0,0 +1,250 @@
+"""Offline scoring of large listing files with the deployed model.
+
+score_file() streams a CSV or Parquet file chunk_rows rows at a time, scores
+the chunks on a process pool and appends every input row, its predicted
+price and, for rows that fail validation, an error to an output CSV. At most
+two chunks per worker are in flight, and results are written in input order,
+so memory stays flat whatever the file size.
+
+Workers share the parent's model: with the fork start method the pipeline
+loaded in the parent is inherited copy-on-write, otherwise each worker maps
+the pickle's arrays with joblib (mmap_mode="r").
+
+Progress is saved next to the output (<output>.progress.json) after every
+chunk. Running the same command again truncates the output to the last
+completed chunk and carries on from there. Chunks also handed to on_chunk
+(e.g. stored in house_data) are committed before their progress is saved,
+so a crash between the two can store that one chunk twice.
+
+Parquet input needs pyarrow, imported only when a Parquet file is read.
+"""
+import json
+import multiprocessing as mp
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from property_limits import NUMERIC_COLUMNS, out_of_range
+
+CHUNK_ROWS = 50_000
+
+PRICE_COLUMN = "predicted_price"
+ERROR_COLUMN = "error"
+
+
+# ---------- WORKERS ----------
+_pipeline = None
+
+
+def _init_worker(model_path):
+    global _pipeline
+    # Forked workers already have the parent's pipeline
+    if _pipeline is None:
+        _pipeline = joblib.load(model_path, mmap_mode="r")
+
+
+def _predict(features):
+    if features.empty:
+        return np.empty(0)
+    return _pipeline.predict(features)
+
+
+# ---------- INPUT ----------
+def _read_chunks(path, chunk_rows, skip_rows):
+    if path.lower().endswith((".parquet", ".pq")):
+        return _parquet_chunks(path, chunk_rows, skip_rows)
+    # Text as-is, so the output repeats the input exactly
+    chunks = pd.read_csv(path, chunksize=chunk_rows, dtype=str, keep_default_na=False)
+    return _skip(chunks, skip_rows)
+
+
+def _parquet_chunks(path, chunk_rows, skip_rows):
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(path)
+    # Whole row groups before the resume point are never read
+    groups, offset = [], 0
+    for i in range(parquet.num_row_groups):
+        rows = parquet.metadata.row_group(i).num_rows
+        if groups or offset + rows > skip_rows:
+            groups.append(i)
+        else:
+            offset += rows
+    batches = parquet.iter_batches(batch_size=chunk_rows, row_groups=groups)
+    return _skip((batch.to_pandas() for batch in batches), skip_rows - offset)
+
+
+def _skip(chunks, rows):
+    for chunk in chunks:
+        if rows >= len(chunk):
+            rows -= len(chunk)
+            continue
+        if rows:
+            chunk = chunk.iloc[rows:]
+            rows = 0
+        yield chunk.reset_index(drop=True)
+
+
+def _prepare(chunk, columns):
+    """(features of the valid rows, per-row error messages or "") for one chunk."""
+    missing = [col for col in columns if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"input is missing columns: {', '.join(missing)}")
+
+    features = {}
+    bad = pd.DataFrame(False, index=chunk.index, columns=columns)
+    for col in columns:
+        values = chunk[col]
+        if col in NUMERIC_COLUMNS:
+            values = pd.to_numeric(values, errors="coerce")
+            bad[col] = values.isna()
+            if NUMERIC_COLUMNS[col].startswith("int"):
+                bad[col] |= values % 1 != 0
+        else:
+            text = values.astype(str).str.strip()
+            bad[col] = values.isna() | (text == "")
+            values = values.astype(str)
+        # The limits parse_property applies, so a bad row gets an error instead of a price
+        bad[col] |= out_of_range(col, values)
+        features[col] = values
+
+    invalid = bad.any(axis=1).to_numpy()
+    errors = np.full(len(chunk), "", dtype=object)
+    for i in np.flatnonzero(invalid):
+        errors[i] = "missing or invalid: " + ", ".join(bad.columns[bad.iloc[i].to_numpy()])
+
+    valid = ~invalid
+    frame = pd.DataFrame({
+        col: values.to_numpy()[valid].astype(NUMERIC_COLUMNS.get(col, object))
+        for col, values in features.items()
+    }, columns=columns)
+    return frame, errors
+
+
+# ---------- PROGRESS ----------
+def _progress_path(output_path):
+    return output_path + ".progress.json"
+
+
+def _read_progress(output_path):
+    try:
+        with open(_progress_path(output_path)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write_progress(output_path, progress):
+    directory = os.path.dirname(os.path.abspath(output_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    with os.fdopen(fd, "w") as f:
+        json.dump(progress, f, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, _progress_path(output_path))
+
+
+def _job_identity(input_path, model_fingerprint, stored):
+    # A resumed run must read the same file with the same model
+    stat = os.stat(input_path)
+    return {
+        "input": os.path.abspath(input_path),
+        "input_size": stat.st_size,
+        "input_mtime_ns": stat.st_mtime_ns,
+        "model": model_fingerprint,
+        "stored": stored,
+    }
+
+
+# ---------- SCORING ----------
+def score_file(input_path, output_path, columns, model_path, model_fingerprint,
+               pipeline=None, workers=None, chunk_rows=CHUNK_ROWS, start_method=None,
+               on_chunk=None, on_progress=None, restart=False):
+    """Score input_path into output_path; returns the final progress dict.
+
+    columns are the feature columns in the order the model expects. on_chunk
+    (features, prices) gets the valid rows of every chunk once they are
+    written; on_progress(progress) is called after every chunk.
+    workers=0 scores in this process.
+    """
+    identity = _job_identity(input_path, model_fingerprint, on_chunk is not None)
+    progress = None if restart else _read_progress(output_path)
+    if progress is not None:
+        if {key: progress.get(key) for key in identity} != identity:
+            raise ValueError("the input file, model or storing differ from the interrupted run; "
+                             "restart to score from the beginning")
+    elif os.path.exists(output_path) and not restart:
+        raise ValueError(f"{output_path} exists; restart to overwrite it")
+
+    if progress is None:
+        progress = dict(identity, rows=0, scored=0, invalid=0, output_bytes=0)
+    progress["resumed_at"] = progress["rows"]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    global _pipeline
+    _pipeline = pipeline
+    executor = None
+    if workers:
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context(start_method),
+                                       initializer=_init_worker, initargs=(model_path,))
+    else:
+        _init_worker(model_path)
+
+    def submit(features):
+        if executor is not None:
+            return executor.submit(_predict, features)
+        future = Future()
+        future.set_result(_predict(features))
+        return future
+
+    with open(output_path, "a" if progress["rows"] else "w", newline="", encoding="utf-8") as out:
+        # Drop whatever a crash left after the last completed chunk
+        out.truncate(progress["output_bytes"])
+        started = time.perf_counter()
+
+        def write(chunk, features, errors, future):
+            prices = future.result()
+            column = np.full(len(chunk), None, dtype=object)
+            column[errors == ""] = np.round(prices, 2)
+            chunk = chunk.assign(**{PRICE_COLUMN: column, ERROR_COLUMN: errors})
+            chunk.to_csv(out, header=progress["output_bytes"] == 0, index=False)
+            out.flush()
+            os.fsync(out.fileno())
+            if on_chunk is not None and len(features):
+                on_chunk(features, prices)
+
+            progress["rows"] += len(chunk)
+            progress["scored"] += len(features)
+            progress["invalid"] += len(chunk) - len(features)
+            progress["output_bytes"] = os.fstat(out.fileno()).st_size
+            elapsed = time.perf_counter() - started
+            progress["seconds"] = round(elapsed, 3)
+            progress["rows_per_second"] = round((progress["rows"] - progress["resumed_at"]) / elapsed, 1)
+            _write_progress(output_path, progress)
+            if on_progress is not None:
+                on_progress(progress)
+
+        pending = deque()
+        try:
+            for chunk in _read_chunks(input_path, chunk_rows, progress["rows"]):
+                features, errors = _prepare(chunk, columns)
+                pending.append((chunk, features, errors, submit(features)))
+                # Two chunks per worker keep the pool busy without reading ahead further
+                if len(pending) >= max(2 * workers, 1):
+                    write(*pending.popleft())
+            while pending:
+                write(*pending.popleft())
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=not pending, cancel_futures=True)
+
+    progress["complete"] = True
+    _write_progress(output_path, progress)
+    return progress
@@ -0,0 +1,166 @@
+"""Running row counts behind the dashboards.
+
+app_counters keeps one total per counted table. Writers add to it in the
+same transaction as their INSERT, so the stored totals move with the data.
+Each worker holds a copy in memory that its own writes update immediately
+and a background thread re-reads every few seconds. Rendering a dashboard
+therefore runs no query at all. reconcile() recounts the tables to correct
+drift, e.g. from rows inserted or deleted outside the app.
+"""
+import os
+import threading
+import time
+
+# counter name -> table it counts
+COUNTED_TABLES = {
+    "users": "userdata",
+    "predictions": "house_data",
+    "feedback": "feedback_data",
+}
+
+ADD_COUNTER_SQL = """
+    INSERT INTO app_counters (name, value) VALUES (%s, %s)
+    ON DUPLICATE KEY UPDATE value = value + VALUES(value)
+"""
+
+
+def bump(cursor, name, amount=1):
+    """Add to a stored total; call inside the writer's transaction."""
+    cursor.execute(ADD_COUNTER_SQL, (name, amount))
+
+
+def read_counters(cursor):
+    cursor.execute("SELECT name, value FROM app_counters")
+    stored = {row[0]: int(row[1]) for row in cursor.fetchall()}
+    return {name: stored.get(name, 0) for name in COUNTED_TABLES}
+
+
+def reconcile(cursor, fix=True):
+    """Recount every table; returns {name: (stored, actual)} for totals that had drifted.
+
+    The totals and counts come from one REPEATABLE READ snapshot, while
+    writers keep bumping the live rows. The correction therefore adds the
+    difference rather than writing the count, so bumps committed since the
+    snapshot are kept.
+    """
+    stored = read_counters(cursor)
+    drift = {}
+    for name, table in COUNTED_TABLES.items():
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        actual = int(cursor.fetchone()[0])
+        if actual != stored[name]:
+            drift[name] = (stored[name], actual)
+            if fix:
+                bump(cursor, name, actual - stored[name])
+    return drift
+
+
+class CounterCache:
+    """This worker's copy of app_counters.
+
+    connection() is a context manager yielding a database connection. The
+    first get() loads the totals; after that a daemon thread re-reads them
+    every `refresh` seconds and, every `reconcile_every` seconds, recounts
+    the tables. lock() may return a context manager yielding whether this
+    worker won the right to reconcile, so several workers do not all recount.
+    """
+
+    def __init__(self, connection, refresh=10.0, reconcile_every=3600.0, lock=None):
+        self._connection = connection
+        self.refresh_interval = refresh
+        self.reconcile_interval = reconcile_every
+        self._reconcile_lock = lock
+        self._lock = threading.Lock()
+        self._values = None
+        self._loaded_at = 0.0
+        self._reconciled_at = time.monotonic()
+        self._thread = None
+        self._pid = None
+
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.reconciles = 0
+        self.corrections = 0
+
+    # ---------- PUBLIC API ----------
+    def get(self):
+        self._start()
+        with self._lock:
+            values = self._values
+        if values is None:
+            values = self.refresh()
+        return dict(values)
+
+    def add(self, name, amount=1):
+        # After the writer's commit: this worker sees its own rows right away
+        with self._lock:
+            if self._values is not None:
+                self._values[name] = self._values.get(name, 0) + amount
+
+    def refresh(self):
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            values = read_counters(cursor)
+            cursor.close()
+        with self._lock:
+            self._values = values
+            self._loaded_at = time.monotonic()
+            self.refreshes += 1
+        return values
+
+    def reconcile(self):
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            drift = reconcile(cursor)
+            conn.commit()
+            cursor.close()
+        with self._lock:
+            self.reconciles += 1
+            self.corrections += len(drift)
+        if drift:
+            print("COUNTER DRIFT CORRECTED:", drift)
+            self.refresh()
+        return drift
+
+    def stats(self):
+        with self._lock:
+            return {
+                "values": dict(self._values or {}),
+                "age_seconds": round(time.monotonic() - self._loaded_at, 3) if self._values else None,
+                "refresh_seconds": self.refresh_interval,
+                "reconcile_seconds": self.reconcile_interval,
+                "refreshes": self.refreshes,
+                "refresh_errors": self.refresh_errors,
+                "reconciles": self.reconciles,
+                "corrections": self.corrections,
+            }
+
+    # ---------- INTERNALS ----------
+    def _start(self):
+        # Lazily, and again in a forked worker: threads do not survive fork()
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name="counter-refresh", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.refresh_interval)
+            try:
+                if self.reconcile_interval and \
+                        time.monotonic() - self._reconciled_at >= self.reconcile_interval:
+                    self._reconciled_at = time.monotonic()
+                    if self._reconcile_lock is None:
+                        self.reconcile()
+                    else:
+                        with self._reconcile_lock() as acquired:
+                            if acquired:
+                                self.reconcile()
+                self.refresh()
+            except Exception as e:
+                with self._lock:
+                    self.refresh_errors += 1
+                print("COUNTER REFRESH ERROR:", e)
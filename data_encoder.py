@@ -1,29 +1,78 @@
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
 
 
-from sklearn.base import BaseEstimator, TransformerMixin
+def _column_values(X, column):
+    # Pull the one column we encode without copying the rest of the frame
+    if isinstance(X, pd.DataFrame):
+        return X[column]
+    if isinstance(X, pd.Series):
+        return X
+    X = np.asarray(X)
+    return X[:, 0] if X.ndim == 2 else X
+
+
+def _lookup(values, categories, table):
+    # Categorical codes index straight into the table; unknowns (-1) hit the 0 fill
+    codes = pd.Categorical(values, categories=categories).codes
+    if (codes < 0).any():
+        return np.append(table.astype(np.float64), 0.0)[codes]
+    return table[codes]
+
+
+def _wrap(X, column, encoded, keep_other_columns):
+    if isinstance(X, pd.DataFrame):
+        if keep_other_columns and X.shape[1] > 1:
+            return X.assign(**{column: encoded})
+        return pd.DataFrame({column: encoded}, index=X.index)
+    if isinstance(X, pd.Series):
+        return pd.DataFrame({column: encoded}, index=X.index)
+    return encoded.reshape(-1, 1)
+
 
 class FrequencyEncoder(BaseEstimator, TransformerMixin):
     def __init__(self, column):
         self.column = column
 
     def fit(self, X, y=None):
-        self.freq_map_ = X[self.column].value_counts()
+        freq = pd.Series(_column_values(X, self.column)).value_counts()
+        if isinstance(freq.index, pd.CategoricalIndex):
+            # Categorical input counts unseen categories too; keep the map as object input builds it
+            freq = freq[freq > 0]
+            freq.index = pd.Index(freq.index.astype(object), name=freq.index.name)
+        self.freq_map_ = freq
         return self
 
+    def _tables(self):
+        # Built lazily so models pickled before the lookup tables existed still load
+        if getattr(self, "_table_source", None) is not self.freq_map_:
+            self._categories = pd.Index(self.freq_map_.index)
+            self._table = self.freq_map_.to_numpy()
+            self._table_source = self.freq_map_
+        return self._categories, self._table
+
     def transform(self, X):
-        X = X.copy()
-        X[self.column] = X[self.column].map(self.freq_map_).fillna(0)
-        return X
+        categories, table = self._tables()
+        encoded = _lookup(_column_values(X, self.column), categories, table)
+        return _wrap(X, self.column, encoded, keep_other_columns=True)
 
 class FurnishingEncoder(BaseEstimator, TransformerMixin):
     def __init__(self, column):
         self.column = column
         self.map_ = {"Fully-Furnished": 2, "Semi-Furnished": 1, "Unfurnished": 0}
-    
+
     def fit(self, X, y=None):
         return self
-    
+
+    def _tables(self):
+        if getattr(self, "_table_source", None) is not self.map_:
+            self._categories = pd.Index(list(self.map_.keys()))
+            self._table = np.array(list(self.map_.values()), dtype=np.int64)
+            self._table_source = self.map_
+        return self._categories, self._table
+
     def transform(self, X):
-        X = X.copy()
-        X[self.column] = X[self.column].map(self.map_).fillna(0)
-        return X[[self.column]]
+        categories, table = self._tables()
+        encoded = _lookup(_column_values(X, self.column), categories, table)
+        return _wrap(X, self.column, encoded, keep_other_columns=False)
@@ -0,0 +1,246 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class TimedCursor:
+    # Reports time spent executing and fetching to the pool's observe hook
+    _TIMED = ("execute", "executemany", "fetchone", "fetchmany", "fetchall", "callproc")
+
+    def __init__(self, raw, observe):
+        self._raw = raw
+        self._observe = observe
+
+    def __getattr__(self, name):
+        attr = getattr(self._raw, name)
+        if name not in self._TIMED:
+            return attr
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                self._observe("db_query", time.perf_counter() - start)
+        return timed
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._raw.close()
+
+
+class PooledConnection:
+    # Thin proxy around a driver connection; close() hands it back to the pool
+    def __init__(self, pool, raw, created_at):
+        self._pool = pool
+        self._raw = raw
+        self._created_at = created_at
+
+    def __getattr__(self, name):
+        if self.__dict__.get("_raw") is None:
+            raise AttributeError("connection has been returned to the pool")
+        return getattr(self._raw, name)
+
+    def cursor(self, *args, **kwargs):
+        cursor = self.__getattr__("cursor")(*args, **kwargs)
+        observe = self._pool.observe
+        return cursor if observe is None else TimedCursor(cursor, observe)
+
+    def close(self):
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool._release(raw, self._created_at)
+
+    def invalidate(self):
+        # Close the driver connection instead of pooling it, e.g. after an aborted stream
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool._release(raw, self._created_at, discard=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        # Routes that raise before close() still give their slot back
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    def __init__(self, connect, size=5, max_overflow=10, timeout=30.0,
+                 recycle=3600, pre_ping=True, observe=None):
+        self._connect = connect
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        # observe(phase, seconds) for "db_acquire" and each cursor's "db_query"
+        self.observe = observe
+
+        self._cond = threading.Condition()
+        self._idle = deque()   # (raw, created_at, returned_at), newest on the right
+        self._total = 0
+        self._borrowed = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._created = 0
+        self._recycled = 0
+        self._failed_pings = 0
+
+    # ---------- BORROW / RETURN ----------
+    def acquire(self):
+        if self.observe is None:
+            return self._acquire()
+        start = time.perf_counter()
+        try:
+            return self._acquire()
+        finally:
+            self.observe("db_acquire", time.perf_counter() - start)
+
+    def _acquire(self):
+        deadline = None
+        waited_from = None
+        entry = None
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._total < self.size + self.max_overflow:
+                    self._total += 1
+                    break
+
+                if waited_from is None:
+                    waited_from = time.perf_counter()
+                    deadline = waited_from + self.timeout
+                    self._waits += 1
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self._wait_time += time.perf_counter() - waited_from
+                    raise PoolTimeout(
+                        f"no connection available after {self.timeout}s "
+                        f"(size={self.size}, overflow={self.max_overflow})"
+                    )
+                self._cond.wait(remaining)
+
+            if waited_from is not None:
+                self._wait_time += time.perf_counter() - waited_from
+            self._borrowed += 1
+
+        try:
+            if entry is not None:
+                raw, created_at = self._checkout(entry)
+            else:
+                raw, created_at = self._new_connection(), time.time()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._borrowed -= 1
+                self._cond.notify()
+            raise
+
+        return PooledConnection(self, raw, created_at)
+
+    def _checkout(self, entry):
+        raw, created_at, returned_at = entry
+        now = time.time()
+
+        if self.recycle is not None and now - returned_at > self.recycle:
+            self._discard(raw)
+            with self._cond:
+                self._recycled += 1
+            return self._new_connection(), now
+
+        if self.pre_ping:
+            try:
+                raw.ping(reconnect=False)
+            except Exception:
+                self._discard(raw)
+                with self._cond:
+                    self._failed_pings += 1
+                return self._new_connection(), now
+
+        return raw, created_at
+
+    def _new_connection(self):
+        raw = self._connect()
+        with self._cond:
+            self._created += 1
+        return raw
+
+    def _discard(self, raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    def _release(self, raw, created_at, discard=False):
+        try:
+            # Never hand an open transaction to the next borrower
+            if not discard and getattr(raw, "in_transaction", False):
+                raw.rollback()
+        except Exception:
+            discard = True
+        if discard:
+            self._discard(raw)
+            raw = None
+
+        with self._cond:
+            self._borrowed -= 1
+            if raw is not None and len(self._idle) < self.size:
+                self._idle.append((raw, created_at, time.time()))
+                raw = None
+            else:
+                self._total -= 1
+            self._cond.notify()
+
+        if raw is not None:
+            self._discard(raw)
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    # ---------- MONITORING ----------
+    def stats(self):
+        with self._cond:
+            return {
+                "size": self.size,
+                "max_overflow": self.max_overflow,
+                "open": self._total,
+                "borrowed": self._borrowed,
+                "idle": len(self._idle),
+                "waits": self._waits,
+                "wait_time_seconds": round(self._wait_time, 6),
+                "created": self._created,
+                "recycled": self._recycled,
+                "failed_pings": self._failed_pings,
+            }
+
+    def dispose(self):
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+            self._total -= len(idle)
+        for raw, _, _ in idle:
+            self._discard(raw)
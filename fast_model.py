@@ -0,0 +1,212 @@
+"""Flattened inference engine for the house price pipeline.
+
+compile_pipeline() turns the fitted sklearn Pipeline (ColumnTransformer +
+RandomForestRegressor) into plain NumPy arrays, and CompiledModel scores raw
+rows straight from them without building a DataFrame. Every tree is stored in
+one concatenated node table; leaves point at themselves so all trees can be
+walked together, one NumPy step per tree level.
+
+    python fast_model.py house_price_model.pkl house_price_model.fast
+"""
+import json
+import os
+import sys
+
+import numpy as np
+from sklearn.preprocessing import OneHotEncoder
+
+from data_encoder import FrequencyEncoder, FurnishingEncoder
+
+# Arrays written to disk, one .npy each so they can be memory-mapped
+ARRAY_NAMES = ("feature", "threshold", "left", "right", "value", "roots")
+
+
+def _single_column(columns):
+    if isinstance(columns, str):
+        return columns
+    if len(columns) != 1:
+        raise ValueError(f"expected one column per encoder, got {columns}")
+    return columns[0]
+
+
+def compile_pipeline(pipeline):
+    prep = pipeline.named_steps["prep"]
+    forest = pipeline.steps[-1][1]
+
+    encoders = []
+    passthrough = []
+    for name, transformer, columns in prep.transformers_:
+        out = prep.output_indices_[name]
+        if transformer == "drop" or out.stop == out.start:
+            continue
+
+        if name == "remainder":
+            if transformer != "passthrough" and not hasattr(transformer, "feature_names_out"):
+                raise ValueError(f"unsupported remainder transformer: {transformer!r}")
+            names = [prep.feature_names_in_[c] if isinstance(c, (int, np.integer)) else c
+                     for c in columns]
+            passthrough.extend(zip(names, range(out.start, out.stop)))
+        elif transformer == "passthrough":
+            passthrough.extend(zip(columns, range(out.start, out.stop)))
+        elif isinstance(transformer, OneHotEncoder):
+            if transformer.drop is not None:
+                raise ValueError("OneHotEncoder with drop= is not supported")
+            categories = transformer.categories_[0]
+            encoders.append({
+                "kind": "onehot",
+                "column": _single_column(columns),
+                "mapping": {str(c): out.start + i for i, c in enumerate(categories)},
+            })
+        elif isinstance(transformer, FrequencyEncoder):
+            encoders.append({
+                "kind": "value",
+                "column": _single_column(columns),
+                "output": out.start,
+                "mapping": {str(k): float(v) for k, v in transformer.freq_map_.items()},
+            })
+        elif isinstance(transformer, FurnishingEncoder):
+            encoders.append({
+                "kind": "value",
+                "column": _single_column(columns),
+                "output": out.start,
+                "mapping": {str(k): float(v) for k, v in transformer.map_.items()},
+            })
+        else:
+            raise ValueError(f"unsupported transformer {name}: {transformer!r}")
+
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        n = tree.node_count
+        own = np.arange(offset, offset + n, dtype=np.int32)
+        leaf = tree.children_left == -1
+
+        features.append(np.where(leaf, 0, tree.feature).astype(np.int32))
+        # Leaves send every sample back to themselves
+        thresholds.append(np.where(leaf, np.inf, tree.threshold))
+        lefts.append(np.where(leaf, own, tree.children_left + offset).astype(np.int32))
+        rights.append(np.where(leaf, own, tree.children_right + offset).astype(np.int32))
+        values.append(tree.value[:, 0, 0].astype(np.float64))
+        roots.append(offset)
+
+        offset += n
+        max_depth = max(max_depth, tree.max_depth)
+
+    arrays = {
+        "feature": np.concatenate(features),
+        "threshold": np.concatenate(thresholds),
+        "left": np.concatenate(lefts),
+        "right": np.concatenate(rights),
+        "value": np.concatenate(values),
+        "roots": np.asarray(roots, dtype=np.int32),
+    }
+    meta = {
+        "n_features": int(max(s.stop for s in prep.output_indices_.values())),
+        "max_depth": int(max_depth),
+        "encoders": encoders,
+        "passthrough": [[str(c), int(i)] for c, i in passthrough],
+    }
+    return CompiledModel(arrays, meta)
+
+
+class CompiledModel:
+    def __init__(self, arrays, meta):
+        self.arrays = arrays
+        self.meta = meta
+        self.n_features = meta["n_features"]
+        self.max_depth = meta["max_depth"]
+        self.encoders = meta["encoders"]
+        self.passthrough = meta["passthrough"]
+
+        self._feature = arrays["feature"]
+        self._threshold = arrays["threshold"]
+        self._left = arrays["left"]
+        self._right = arrays["right"]
+        self._value = arrays["value"]
+        self._roots = arrays["roots"]
+
+    # ---------- ENCODING ----------
+    def encode(self, rows, columns):
+        """Build the float32 design matrix for rows given as sequences in `columns` order."""
+        position = {name: i for i, name in enumerate(columns)}
+        X = np.zeros((len(rows), self.n_features), dtype=np.float32)
+
+        for enc in self.encoders:
+            col = position[enc["column"]]
+            mapping = enc["mapping"]
+            if enc["kind"] == "onehot":
+                # Unknown categories stay all-zero, like handle_unknown="ignore"
+                for r, row in enumerate(rows):
+                    out = mapping.get(str(row[col]))
+                    if out is not None:
+                        X[r, out] = 1.0
+            else:
+                X[:, enc["output"]] = [mapping.get(str(row[col]), 0.0) for row in rows]
+
+        for name, out in self.passthrough:
+            col = position[name]
+            X[:, out] = [row[col] for row in rows]
+
+        return X
+
+    # ---------- SCORING ----------
+    def predict_matrix(self, X, chunk_size=4096):
+        # Node table is (trees x rows), so large batches are walked in slices
+        if X.shape[0] > chunk_size:
+            return np.concatenate([
+                self.predict_matrix(X[start:start + chunk_size], chunk_size)
+                for start in range(0, X.shape[0], chunk_size)
+            ])
+
+        n, n_features = X.shape
+        flat_X = X.ravel()
+        # One slot per (tree, row) pair, laid out tree-major
+        row_offset = np.tile(np.arange(n, dtype=np.int64) * n_features, len(self._roots))
+        nodes = np.repeat(self._roots, n)
+
+        for _ in range(self.max_depth):
+            go_left = flat_X.take(row_offset + self._feature.take(nodes)) <= self._threshold.take(nodes)
+            nodes = np.where(go_left, self._left.take(nodes), self._right.take(nodes))
+
+        return self._value.take(nodes).reshape(-1, n).mean(axis=0)
+
+    def predict(self, rows, columns):
+        if not len(rows):
+            return np.empty(0)
+        return self.predict_matrix(self.encode(rows, columns))
+
+    def predict_dicts(self, records):
+        columns = [enc["column"] for enc in self.encoders] + [c for c, _ in self.passthrough]
+        rows = [[record[c] for c in columns] for record in records]
+        return self.predict(rows, columns)
+
+    # ---------- PERSISTENCE ----------
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        for name in ARRAY_NAMES:
+            np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(self.arrays[name]))
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump(self.meta, f)
+
+    @classmethod
+    def load(cls, path, mmap_mode=None):
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in ARRAY_NAMES
+        }
+        return cls(arrays, meta)
+
+
+if __name__ == "__main__":
+    import joblib
+
+    if len(sys.argv) != 3:
+        sys.exit("usage: python fast_model.py <model.pkl> <output_dir>")
+    compiled = compile_pipeline(joblib.load(sys.argv[1]))
+    compiled.save(sys.argv[2])
+    print(f"Exported {len(compiled.arrays['roots'])} trees, "
+          f"{len(compiled.arrays['feature'])} nodes to {sys.argv[2]}")
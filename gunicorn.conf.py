@@ -0,0 +1,45 @@
+"""gunicorn settings for serving app.py in production.
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+
+Each worker is a process with WEB_THREADS request threads. Scoring is CPU
+bound and holds the GIL, so add workers (processes) for prediction
+throughput and threads to cover time spent waiting on MySQL.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get("WEB_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_WORKERS", multiprocessing.cpu_count()))
+worker_class = "gthread"
+threads = int(os.environ.get("WEB_THREADS", 4))
+
+# Load the model once in the master; forked workers share its pages
+preload_app = True
+
+# Seconds a request may run, and how long shutdown waits for in-flight ones
+timeout = int(os.environ.get("WEB_TIMEOUT", 120))
+graceful_timeout = int(os.environ.get("WEB_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("WEB_KEEPALIVE", 5))
+
+# Recycling workers would throw away their warm pool and caches; off unless asked
+max_requests = int(os.environ.get("WEB_MAX_REQUESTS", 0))
+max_requests_jitter = max_requests // 10
+
+accesslog = os.environ.get("WEB_ACCESS_LOG") or None
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # Connections are opened per worker, after fork, never inherited from the master
+    import app as house_app
+
+    if not house_app.warm_pool():
+        server.log.warning("worker %s started without a warm DB pool; /ready will retry", worker.pid)
+
+
+def worker_exit(server, worker):
+    # Runs after in-flight requests finished (or graceful_timeout expired)
+    import app as house_app
+
+    house_app.shutdown()
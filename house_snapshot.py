@@ -0,0 +1,291 @@
+"""Columnar snapshot of house_data for retraining and analytics.
+
+The snapshot is a directory of Arrow IPC files ("segments"), each holding a
+contiguous id range of house_data, plus manifest.json listing them.
+location, furnishing and property_type are dictionary-encoded, so they load
+straight into pandas categoricals, and every column is stored in its final
+numeric type. Segments are compressed with zstd by default. With
+compression="none" they are memory-mapped with no copy at all.
+
+export_snapshot() appends only rows newer than the manifest's last_id, and only
+rows that have settled (see settled_max_id), so a row committed late with a
+lower id is never skipped. Segments
+are never modified after they are written; compaction writes merged segments
+and then swaps the manifest, so readers that already opened the old files
+keep reading them.
+
+pyarrow is optional: nothing here imports it until a snapshot is written or read.
+"""
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:     # Windows: exports in one process at a time are still serialized
+    fcntl = None
+
+MANIFEST_NAME = "manifest.json"
+
+DICTIONARY_COLUMNS = ["location", "furnishing", "property_type"]
+
+# Wide enough for every value house_data can hold; training narrows them after validation
+NUMERIC_TYPES = {
+    "id": "int64",
+    "area": "int32",
+    "bhk": "int32",
+    "bath": "int32",
+    "balcony": "int32",
+    "parking": "int32",
+    "age": "int32",
+    "price": "float64",
+}
+
+SNAPSHOT_COLUMNS = ["id", "area", "location", "bhk", "bath", "balcony", "parking",
+                    "furnishing", "property_type", "age", "price", "created_at"]
+
+# InnoDB hands out auto-increment ids at insert but rows appear at commit, so an id
+# below one already visible can still show up. A row older than any transaction
+# runs is safe: every lower id was taken even earlier and has committed or rolled back.
+# Ordering by (created_at, id) reads one entry off idx_house_created_at; ORDER BY id
+# alone sorts every settled row.
+SETTLED_ID_SQL = """
+    SELECT id FROM house_data WHERE created_at <= NOW() - INTERVAL %s SECOND
+    ORDER BY created_at DESC, id DESC LIMIT 1
+"""
+
+SETTLE_SECONDS = 300
+
+SELECT_ROWS_SQL = f"""
+    SELECT {', '.join(SNAPSHOT_COLUMNS)} FROM house_data
+    WHERE id > %s AND id <= %s ORDER BY id LIMIT %s
+"""
+
+SEGMENT_ROWS = 100_000
+COMPACT_ROWS = 1_000_000
+MAX_SEGMENTS = 32
+
+_local_lock = threading.Lock()
+
+
+def available():
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _arrow():
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.ipc
+
+    return pyarrow
+
+
+def settled_max_id(cursor, settle_seconds=SETTLE_SECONDS):
+    """Highest house_data id below which no row can still appear."""
+    cursor.execute(SETTLED_ID_SQL, (settle_seconds,))
+    row = cursor.fetchone()
+    return row[0] if row else 0
+
+
+def read_manifest(directory):
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"last_id": 0, "rows": 0, "segments": []}
+
+
+def _write_manifest(directory, manifest):
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    with os.fdopen(fd, "w") as f:
+        json.dump(manifest, f, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, os.path.join(directory, MANIFEST_NAME))
+
+
+@contextmanager
+def _export_lock(directory):
+    # One exporter per snapshot, across threads and (where flock exists) processes
+    with _local_lock, open(os.path.join(directory, ".lock"), "w") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+# ---------- WRITING ----------
+def _rows_to_table(pa, rows):
+    columns = dict(zip(SNAPSHOT_COLUMNS, zip(*rows)))
+    arrays = []
+    for name in SNAPSHOT_COLUMNS:
+        values = columns[name]
+        if name in DICTIONARY_COLUMNS:
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        elif name == "created_at":
+            arrays.append(pa.array(pd.to_datetime(pd.Series(values)).to_numpy("datetime64[s]")))
+        else:
+            arrays.append(pa.array(np.array(values, dtype=NUMERIC_TYPES[name])))
+    return pa.Table.from_arrays(arrays, names=SNAPSHOT_COLUMNS)
+
+
+def _write_segment(pa, directory, table, compression):
+    first_id = table["id"][0].as_py()
+    last_id = table["id"][-1].as_py()
+    name = f"part-{first_id:012d}-{last_id:012d}.arrow"
+    options = pa.ipc.IpcWriteOptions(compression=None if compression in (None, "none") else compression)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    os.close(fd)
+    try:
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, os.path.join(directory, name))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return {"file": name, "first_id": first_id, "last_id": last_id, "rows": table.num_rows}
+
+
+def export_snapshot(connection, directory, through_id=None, compression="zstd",
+                    segment_rows=SEGMENT_ROWS, max_segments=MAX_SEGMENTS,
+                    settle_seconds=SETTLE_SECONDS):
+    """Append house_data rows with last_id < id <= through_id to the snapshot.
+
+    through_id defaults to the newest settled id (settled_max_id); an
+    explicit one must be settled too.
+
+    connection() is a context manager yielding a database connection. Rows are
+    read in id order, segment_rows at a time, and the manifest is updated after
+    every segment, so an interrupted export resumes where it stopped. Returns
+    the manifest.
+    """
+    pa = _arrow()
+    os.makedirs(directory, exist_ok=True)
+    with _export_lock(directory):
+        manifest = read_manifest(directory)
+        with connection() as conn:
+            cursor = conn.cursor()
+            if through_id is None:
+                through_id = settled_max_id(cursor, settle_seconds)
+            while manifest["last_id"] < through_id:
+                cursor.execute(SELECT_ROWS_SQL, (manifest["last_id"], through_id, segment_rows))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                segment = _write_segment(pa, directory, _rows_to_table(pa, rows), compression)
+                del rows
+                manifest["segments"].append(segment)
+                manifest["rows"] += segment["rows"]
+                manifest["last_id"] = segment["last_id"]
+                manifest["compression"] = compression or "none"
+                _write_manifest(directory, manifest)
+            cursor.close()
+
+        if len(manifest["segments"]) > max_segments:
+            manifest = _compact(pa, directory, manifest, compression)
+    return manifest
+
+
+def compact_snapshot(directory, compression="zstd"):
+    """Merge consecutive segments into segments of up to COMPACT_ROWS rows."""
+    pa = _arrow()
+    with _export_lock(directory):
+        return _compact(pa, directory, read_manifest(directory), compression)
+
+
+def _compact(pa, directory, manifest, compression):
+    groups, group = [], []
+    for segment in manifest["segments"]:
+        if group and sum(s["rows"] for s in group) + segment["rows"] > COMPACT_ROWS:
+            groups.append(group)
+            group = []
+        group.append(segment)
+    if group:
+        groups.append(group)
+
+    segments = []
+    for group in groups:
+        if len(group) == 1:
+            segments.append(group[0])
+            continue
+        table = pa.concat_tables(_open_segment(pa, directory, s).read_all() for s in group)
+        segments.append(_write_segment(pa, directory, table.unify_dictionaries().combine_chunks(),
+                                       compression))
+        del table
+
+    manifest = dict(manifest, segments=segments)
+    _write_manifest(directory, manifest)
+    _remove_unlisted(directory, manifest)
+    return manifest
+
+
+def _remove_unlisted(directory, manifest):
+    listed = {s["file"] for s in manifest["segments"]}
+    for name in os.listdir(directory):
+        if name.startswith("part-") and name not in listed:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                # Still mapped by a reader on Windows; removed after a later export
+                pass
+
+
+# ---------- READING ----------
+def _open_segment(pa, directory, segment, columns=None):
+    """An IPC file reader for one segment; only the requested columns are read
+    (and, if compressed, decompressed)."""
+    options = None
+    if columns:
+        options = pa.ipc.IpcReadOptions(included_fields=sorted(SNAPSHOT_COLUMNS.index(c) for c in columns))
+    source = pa.memory_map(os.path.join(directory, segment["file"]))
+    return pa.ipc.open_file(source, options=options)
+
+
+def _open_tables(directory, columns, id_range):
+    """Yield the segments holding rows with after < id <= through as tables.
+
+    Every segment is opened before the first is read, so a concurrent
+    compaction cannot remove them mid-read; each is decoded only when reached.
+    """
+    pa = _arrow()
+    segments = read_manifest(directory)["segments"]
+    wanted = None
+    if columns:
+        wanted = list(dict.fromkeys(list(columns) + (["id"] if id_range is not None else [])))
+    if id_range is not None:
+        segments = [s for s in segments if s["last_id"] > id_range[0] and s["first_id"] <= id_range[1]]
+    readers = [_open_segment(pa, directory, s, wanted) for s in segments]
+
+    while readers:
+        table = readers.pop(0).read_all()
+        if id_range is not None:
+            ids = table["id"]
+            table = table.filter(pa.compute.and_(pa.compute.greater(ids, id_range[0]),
+                                                 pa.compute.less_equal(ids, id_range[1])))
+            if columns and "id" not in columns:
+                table = table.drop_columns(["id"])
+        yield table
+
+
+def iter_frames(directory, columns=None, id_range=None):
+    """Yield the snapshot as one DataFrame per segment; id_range=(after, through)."""
+    for table in _open_tables(directory, columns, id_range):
+        yield table.to_pandas(split_blocks=True)
+
+
+def read_frame(directory, columns=None, id_range=None):
+    """The whole snapshot (or an id range of it) as one DataFrame with categorical text columns."""
+    pa = _arrow()
+    tables = list(_open_tables(directory, columns, id_range))
+    if not tables:
+        return pd.DataFrame(columns=columns or SNAPSHOT_COLUMNS)
+    # Segments carry their own dictionaries; pandas gets one set of categories
+    table = pa.concat_tables(tables).unify_dictionaries()
+    del tables
+    return table.to_pandas(split_blocks=True, self_destruct=True)
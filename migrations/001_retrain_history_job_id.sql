@@ -0,0 +1,6 @@
+-- Background retrain jobs log one retrain_history row per state change.
+-- job_id groups those rows and backs the /retrain_status lookup.
+
+ALTER TABLE `retrain_history`
+  ADD COLUMN `job_id` varchar(32) DEFAULT NULL,
+  ADD KEY `idx_retrain_job` (`job_id`);
@@ -0,0 +1,27 @@
+-- Pre-aggregated price summaries behind /chart-data.
+-- Writers keep it current; `flask --app app rebuild-summary` recomputes it.
+
+CREATE TABLE IF NOT EXISTS `house_data_summary` (
+  `dimension` varchar(20) NOT NULL,
+  `value` varchar(40) NOT NULL,
+  `row_count` bigint(20) NOT NULL DEFAULT 0,
+  `price_sum` decimal(30,0) NOT NULL DEFAULT 0,
+  PRIMARY KEY (`dimension`, `value`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+DELETE FROM `house_data_summary`;
+
+INSERT INTO `house_data_summary` (`dimension`, `value`, `row_count`, `price_sum`)
+SELECT 'bhk', `bhk`, COUNT(*), SUM(`price`) FROM `house_data` GROUP BY `bhk`
+UNION ALL
+SELECT 'bath', `bath`, COUNT(*), SUM(`price`) FROM `house_data` GROUP BY `bath`
+UNION ALL
+SELECT 'balcony', `balcony`, COUNT(*), SUM(`price`) FROM `house_data` GROUP BY `balcony`
+UNION ALL
+SELECT 'parking', `parking`, COUNT(*), SUM(`price`) FROM `house_data` GROUP BY `parking`
+UNION ALL
+SELECT 'furnishing', `furnishing`, COUNT(*), SUM(`price`) FROM `house_data` GROUP BY `furnishing`
+UNION ALL
+SELECT 'property_type', `property_type`, COUNT(*), SUM(`price`) FROM `house_data` GROUP BY `property_type`
+UNION ALL
+SELECT 'location', `location`, COUNT(*), SUM(`price`) FROM `house_data` GROUP BY `location`;
@@ -0,0 +1,9 @@
+-- Stable row identity and insert time for house_data.
+-- /history pages on `id` (keyset) instead of OFFSET or a full SELECT *;
+-- existing rows are numbered in table order and stamped with the migration time.
+
+ALTER TABLE `house_data`
+  ADD COLUMN `id` bigint(20) UNSIGNED NOT NULL AUTO_INCREMENT FIRST,
+  ADD COLUMN `created_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `idx_house_created_at` (`created_at`);
@@ -0,0 +1,28 @@
+-- Secondary indexes for the queries app.py actually runs.
+-- Measured with benchmarks/bench_queries.py (EXPLAIN before/after in its report).
+--
+-- house_data:     /history filters; InnoDB appends the id primary key to every
+--                 secondary index, so `WHERE location = ? AND id < ? ORDER BY id DESC`
+--                 is a single index range scan. property_type also serves the
+--                 summary rebuild's GROUP BY. No price index: a range on price
+--                 trades the id-ordered early exit for a sort and was slower.
+-- feedback_data, help_requests, retrain_history: admin lists ORDER BY the timestamp.
+-- userdata:       sign-in (Username + Usertype), profile (Username), password reset (Email).
+
+ALTER TABLE `house_data`
+  ADD KEY `idx_house_location` (`location`),
+  ADD KEY `idx_house_bhk` (`bhk`),
+  ADD KEY `idx_house_property_type` (`property_type`);
+
+ALTER TABLE `feedback_data`
+  ADD KEY `idx_feedback_created_at` (`created_at`);
+
+ALTER TABLE `help_requests`
+  ADD KEY `idx_help_created_at` (`created_at`);
+
+ALTER TABLE `retrain_history`
+  ADD KEY `idx_retrain_at` (`retrained_at`);
+
+ALTER TABLE `userdata`
+  ADD KEY `idx_user_name_type` (`Username`, `Usertype`),
+  ADD KEY `idx_user_email` (`Email`);
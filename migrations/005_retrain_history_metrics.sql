@@ -0,0 +1,14 @@
+-- Holdout evaluation of each finished retrain job (Saved or Rejected rows).
+-- Accuracy is in rupees / R2; latencies are milliseconds for one row and for
+-- one BATCH_CHUNK_SIZE batch. `metrics` keeps the full JSON, including the
+-- deployed model's scores on the same holdout and the quality gate's verdict.
+
+ALTER TABLE `retrain_history`
+  ADD COLUMN `mae` double DEFAULT NULL,
+  ADD COLUMN `rmse` double DEFAULT NULL,
+  ADD COLUMN `r2` double DEFAULT NULL,
+  ADD COLUMN `p50_ms` double DEFAULT NULL,
+  ADD COLUMN `p95_ms` double DEFAULT NULL,
+  ADD COLUMN `batch_p50_ms` double DEFAULT NULL,
+  ADD COLUMN `batch_p95_ms` double DEFAULT NULL,
+  ADD COLUMN `metrics` text DEFAULT NULL;
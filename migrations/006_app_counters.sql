@@ -0,0 +1,19 @@
+-- Running row counts behind the customer dashboard (see counters.py).
+-- Writers add to them in their own transaction; `flask --app app reconcile-counters`
+-- recounts the tables.
+
+CREATE TABLE IF NOT EXISTS `app_counters` (
+  `name` varchar(32) NOT NULL,
+  `value` bigint(20) NOT NULL DEFAULT 0,
+  PRIMARY KEY (`name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+INSERT INTO `app_counters` (`name`, `value`)
+SELECT * FROM (
+  SELECT 'users', COUNT(*) FROM `userdata`
+  UNION ALL
+  SELECT 'predictions', COUNT(*) FROM `house_data`
+  UNION ALL
+  SELECT 'feedback', COUNT(*) FROM `feedback_data`
+) AS `counts`
+ON DUPLICATE KEY UPDATE `value` = VALUES(`value`);
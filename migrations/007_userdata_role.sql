@@ -0,0 +1,8 @@
+-- Normalized, indexed role next to the free-form Usertype ('Admin', 'agent', ...).
+-- Generated from Usertype, so signup and existing rows need no changes.
+-- The user list's filter (`role <> 'admin'`) becomes a range scan of idx_user_role
+-- instead of evaluating LOWER(Usertype) on every row.
+
+ALTER TABLE `userdata`
+  ADD COLUMN `role` varchar(20) GENERATED ALWAYS AS (lower(`Usertype`)) STORED,
+  ADD KEY `idx_user_role` (`role`);
@@ -0,0 +1,236 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+import joblib
+
+from fast_model import CompiledModel, compile_pipeline
+from prediction_cache import file_fingerprint
+
+MANIFEST_NAME = "current.json"
+
+
+def _atomic_write(path, write):
+    # Write next to the target, fsync, then rename over it: readers see old or new, never half
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600; artifacts must stay readable by every worker user
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ModelStore:
+    """Versioned model artifacts plus a manifest naming the current one.
+
+    Artifacts are never modified after they are published, so a worker can
+    keep reading its version while a newer one is being written.
+    """
+
+    def __init__(self, directory, legacy_path=None, keep=5):
+        self.directory = directory
+        self.legacy_path = legacy_path
+        self.keep = keep
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+
+    def current(self):
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+            manifest["path"] = os.path.join(self.directory, manifest["file"])
+            return manifest
+        except FileNotFoundError:
+            pass
+
+        # Deployments from before the store: serve the single pickle as-is
+        if self.legacy_path and os.path.exists(self.legacy_path):
+            return {
+                "version": "legacy",
+                "file": os.path.basename(self.legacy_path),
+                "path": self.legacy_path,
+                "fingerprint": file_fingerprint(self.legacy_path),
+                "published_at": datetime.fromtimestamp(
+                    os.path.getmtime(self.legacy_path)
+                ).isoformat(timespec="seconds"),
+            }
+        raise FileNotFoundError(f"no model published in {self.directory}")
+
+    def manifest_mtime(self):
+        try:
+            return os.stat(self.manifest_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def publish(self, source_path, compiled=None, extra=None):
+        os.makedirs(self.directory, exist_ok=True)
+        fingerprint = file_fingerprint(source_path)
+        version = f"{datetime.now():%Y%m%d%H%M%S}-{fingerprint[:8]}"
+        file_name = f"house_price_model-{version}.pkl"
+
+        with open(source_path, "rb") as src:
+            _atomic_write(os.path.join(self.directory, file_name),
+                          lambda dst: shutil.copyfileobj(src, dst, 1 << 20))
+
+        manifest = {
+            "version": version,
+            "file": file_name,
+            "fingerprint": fingerprint,
+            "published_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        # Caller bookkeeping, e.g. the last house_data id the model has seen
+        manifest.update(extra or {})
+
+        if compiled is not None:
+            # Flat tree arrays that workers memory-map instead of unpickling the forest
+            fast_dir = f"house_price_model-{version}.fast"
+            tmp_dir = tempfile.mkdtemp(dir=self.directory, prefix=".tmp-")
+            try:
+                compiled.save(tmp_dir)
+                os.chmod(tmp_dir, 0o755)
+                os.rename(tmp_dir, os.path.join(self.directory, fast_dir))
+            except BaseException:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise
+            manifest["fast_dir"] = fast_dir
+
+        _atomic_write(self.manifest_path, lambda f: f.write(json.dumps(manifest).encode()))
+        self._prune(version)
+
+        manifest["path"] = os.path.join(self.directory, file_name)
+        return manifest
+
+    def _prune(self, current_version):
+        versions = sorted({
+            name[len("house_price_model-"):].rsplit(".", 1)[0]
+            for name in os.listdir(self.directory)
+            if name.startswith("house_price_model-")
+        })
+        # Names sort by publish time; workers still on an old version keep it in memory
+        for version in versions[:-self.keep]:
+            if version == current_version:
+                continue
+            pkl = os.path.join(self.directory, f"house_price_model-{version}.pkl")
+            if os.path.exists(pkl):
+                os.remove(pkl)
+            shutil.rmtree(os.path.join(self.directory, f"house_price_model-{version}.fast"),
+                          ignore_errors=True)
+
+
+class ServingModel:
+    """One published model version, loaded lazily.
+
+    The compiled fast path is memory-mapped read-only from the .fast
+    directory, so every worker shares the same page-cache copy of the tree
+    arrays. The full sklearn pipeline is only unpickled when something needs
+    it: large batches, or versions published without compiled arrays.
+    """
+
+    def __init__(self, manifest, pipeline=None, fast=None, fast_enabled=True):
+        self.manifest = manifest
+        self.version = manifest["version"]
+        self.fingerprint = manifest["fingerprint"]
+        self.fast_enabled = fast_enabled
+        self._pipeline = pipeline
+        self._fast = fast
+        self._fast_loaded = fast is not None or not fast_enabled
+        self._lock = threading.Lock()
+
+    @property
+    def pipeline(self):
+        if self._pipeline is None:
+            with self._lock:
+                if self._pipeline is None:
+                    # Plain numpy arrays in the pickle are mapped; sklearn copies tree nodes
+                    self._pipeline = joblib.load(self.manifest["path"], mmap_mode="r")
+        return self._pipeline
+
+    @property
+    def fast(self):
+        if not self._fast_loaded:
+            fast_dir = self.manifest.get("fast_dir")
+            if fast_dir:
+                path = os.path.join(os.path.dirname(self.manifest["path"]), fast_dir)
+                fast = CompiledModel.load(path, mmap_mode="r")
+            else:
+                try:
+                    fast = compile_pipeline(self.pipeline)
+                except Exception as e:
+                    print("FAST PATH COMPILE ERROR:", e)
+                    fast = None
+            with self._lock:
+                if not self._fast_loaded:
+                    self._fast, self._fast_loaded = fast, True
+        return self._fast
+
+    @property
+    def loaded(self):
+        return self._pipeline is not None or (self._fast_loaded and self._fast is not None)
+
+    def warm(self):
+        # Load whatever the first prediction would need
+        if self.fast is None:
+            self.pipeline
+        return self
+
+
+class ModelWatcher:
+    """Polls the manifest and loads a newly published model in the background.
+
+    check() is cheap enough to run on every request: at most one stat() per
+    interval, and the load happens on a separate thread so the current model
+    keeps serving until the new one is completely in memory.
+    """
+
+    def __init__(self, store, on_load, interval=2.0, load=None):
+        self.store = store
+        self.on_load = on_load
+        self.interval = interval
+        self.load = load or (lambda manifest: joblib.load(manifest["path"]))
+        self.version = None
+        self._last_check = 0.0
+        self._last_mtime = store.manifest_mtime()
+        self._loading = False
+        self._lock = threading.Lock()
+
+    def check(self):
+        now = time.monotonic()
+        if now - self._last_check < self.interval:
+            return
+        with self._lock:
+            if self._loading or now - self._last_check < self.interval:
+                return
+            self._last_check = now
+            mtime = self.store.manifest_mtime()
+            if mtime == self._last_mtime:
+                return
+            self._last_mtime = mtime
+            self._loading = True
+        threading.Thread(target=self._reload, name="model-reload", daemon=True).start()
+
+    def _reload(self):
+        try:
+            manifest = self.store.current()
+            if manifest["version"] != self.version:
+                loaded = self.load(manifest)
+                self.on_load(loaded, manifest)
+                self.version = manifest["version"]
+        except Exception as e:
+            print("MODEL RELOAD ERROR:", e)
+            with self._lock:
+                # Try again on the next check
+                self._last_mtime = None
+        finally:
+            with self._lock:
+                self._loading = False
@@ -0,0 +1,153 @@
+"""Password hashing off the request thread, with a bounded concurrency.
+
+scrypt and pbkdf2 are deliberately expensive: about 150 ms of CPU per check
+at the default scrypt:32768:8:1. Run on the request threads, a burst of
+logins takes as many cores as there are threads and /prediction queues
+behind it. PasswordHasher runs hashes on a small process pool, optionally
+at a lower CPU priority, and admits at most `max_concurrent` at a time per
+web worker. A caller that cannot get a slot within `wait_timeout` gets
+HasherBusy instead of piling up more work.
+
+The hash policy is a werkzeug method string ("scrypt", "scrypt:65536:8:1",
+"pbkdf2:sha256:600000", ...). verify() tells the caller when a stored hash
+was made with a different policy, so it can store the new hash it returns.
+"""
+import multiprocessing as mp
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class HasherBusy(Exception):
+    """No hashing slot became free within the wait timeout."""
+
+
+def _init_worker(nice):
+    if nice and hasattr(os, "nice"):
+        os.nice(nice)
+
+
+def policy_prefix(method):
+    # The parameters werkzeug writes before the first "$", e.g. "scrypt:32768:8:1"
+    return generate_password_hash("", method).split("$", 1)[0]
+
+
+class PasswordHasher:
+    """Hashes and checks passwords for one web worker process.
+
+    workers=0 hashes on the calling thread; the concurrency limit still
+    applies. The pool is created on first use, and again in a forked child.
+    """
+
+    def __init__(self, method="scrypt", workers=1, max_concurrent=None, wait_timeout=10.0,
+                 nice=0, start_method=None):
+        self.method = method
+        self.workers = workers
+        self.max_concurrent = max_concurrent or max(workers, 1)
+        self.wait_timeout = wait_timeout
+        self.nice = nice
+        self._context = mp.get_context(start_method)
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self._prefix = None
+
+        self.hashes = 0
+        self.checks = 0
+        self.rehashes = 0
+        self.waits = 0
+        self.busy = 0
+        self.in_flight = 0
+        self.hash_seconds = 0.0
+
+    # ---------- PUBLIC API ----------
+    def hash(self, password):
+        result = self._run(generate_password_hash, password, self.method)
+        with self._lock:
+            self.hashes += 1
+        return result
+
+    def check(self, pwhash, password):
+        result = self._run(check_password_hash, pwhash, password)
+        with self._lock:
+            self.checks += 1
+        return result
+
+    def needs_rehash(self, pwhash):
+        if self._prefix is None:
+            self._prefix = self._run(policy_prefix, self.method)
+        return pwhash.split("$", 1)[0] != self._prefix
+
+    def verify(self, pwhash, password):
+        """(matches, new hash or None). A new hash comes back only for a correct
+        password whose stored hash does not follow the current policy."""
+        if not self.check(pwhash, password):
+            return False, None
+        if not self.needs_rehash(pwhash):
+            return True, None
+        new_hash = self.hash(password)
+        with self._lock:
+            self.rehashes += 1
+        return True, new_hash
+
+    def stats(self):
+        with self._lock:
+            return {
+                "method": self.method,
+                "workers": self.workers,
+                "max_concurrent": self.max_concurrent,
+                "in_flight": self.in_flight,
+                "hashes": self.hashes,
+                "checks": self.checks,
+                "rehashes": self.rehashes,
+                "waits": self.waits,
+                "busy": self.busy,
+                "hash_seconds": round(self.hash_seconds, 3),
+            }
+
+    def shutdown(self, wait=True):
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        self._executor = None
+
+    # ---------- INTERNALS ----------
+    def _get_executor(self):
+        with self._lock:
+            # Lazily, and again in a forked worker: the parent's pool processes are not ours
+            if self._executor is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=self._context,
+                    initializer=_init_worker, initargs=(self.nice,)
+                )
+            return self._executor
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.waits += 1
+            if not self._slots.acquire(timeout=self.wait_timeout):
+                with self._lock:
+                    self.busy += 1
+                raise HasherBusy(f"{self.max_concurrent} password hashes already running")
+        with self._lock:
+            self.in_flight += 1
+        start = time.perf_counter()
+        try:
+            if not self.workers:
+                return fn(*args)
+            try:
+                return self._get_executor().submit(fn, *args).result()
+            except BrokenProcessPool:
+                self._executor = None
+                raise
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.hash_seconds += time.perf_counter() - start
+            self._slots.release()
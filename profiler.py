@@ -0,0 +1,188 @@
+import cProfile
+import heapq
+import io
+import itertools
+import marshal
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+
+from flask import g, request
+
+
+class StackSampler:
+    """Samples the stacks of registered threads every `interval` seconds.
+
+    Runs only while at least one thread is registered, so an idle worker
+    pays nothing. Stacks are folded ("file:function:line;..." -> count), the
+    format flamegraph tools read.
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self._cond = threading.Condition()
+        self._active = {}        # thread id -> Counter of folded stacks
+        self._thread = None
+        self._pid = None
+
+    def start(self, thread_id):
+        with self._cond:
+            if self._thread is None or self._pid != os.getpid():
+                # Lazily, and again in a forked worker: threads do not survive fork()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+                self._thread.start()
+            self._active[thread_id] = Counter()
+            self._cond.notify()
+
+    def stop(self, thread_id):
+        with self._cond:
+            return self._active.pop(thread_id, Counter())
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._active:
+                    self._cond.wait()
+                threads = list(self._active)
+            frames = sys._current_frames()
+            for thread_id in threads:
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                    frame = frame.f_back
+                folded = ";".join(reversed(stack))
+                with self._cond:
+                    samples = self._active.get(thread_id)
+                    if samples is not None:
+                        samples[folded] += 1
+            del frames
+            time.sleep(self.interval)
+
+
+class RequestProfiler:
+    """Opt-in profiling of Flask requests, keeping the `keep` slowest profiles.
+
+    A `sample_rate` fraction of requests runs under cProfile; when
+    `slow_seconds` is set, every other request is stack-sampled and its
+    samples are kept only if it took at least that long. Nothing is hooked
+    into the app unless one of the two is on.
+    """
+
+    def __init__(self, sample_rate=0.0, slow_seconds=None, keep=20, interval=0.005):
+        self.sample_rate = sample_rate
+        self.slow_seconds = slow_seconds
+        self.keep = keep
+        self.enabled = sample_rate > 0 or slow_seconds is not None
+        self._sampler = StackSampler(interval) if slow_seconds is not None else None
+        self._lock = threading.Lock()
+        self._heap = []          # (duration, seq, profile); fastest kept profile on top
+        self._seq = itertools.count()
+        self.profiled = 0
+        self.evicted = 0
+
+    def init_app(self, app):
+        if not self.enabled:
+            return
+        app.before_request(self._start)
+        app.teardown_request(self._finish)
+
+    # ---------- REQUEST HOOKS ----------
+    def _start(self):
+        g.profile_started = time.perf_counter()
+        if self.sample_rate and random.random() < self.sample_rate:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+                g.profile = profile
+                return
+            except ValueError:
+                # Python 3.12+ allows one active cProfile per process
+                pass
+        if self._sampler is not None:
+            g.profile_thread = threading.get_ident()
+            self._sampler.start(g.profile_thread)
+
+    def _finish(self, exc=None):
+        started = g.pop("profile_started", None)
+        profile = g.pop("profile", None)
+        thread_id = g.pop("profile_thread", None)
+        if started is None:
+            return
+        duration = time.perf_counter() - started
+
+        if profile is not None:
+            profile.disable()
+            profile.create_stats()
+            self._store(duration, "cprofile", marshal.dumps(profile.stats))
+        elif thread_id is not None:
+            samples = self._sampler.stop(thread_id)
+            if duration >= self.slow_seconds and samples:
+                folded = "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
+                self._store(duration, "stacks", folded.encode())
+
+    def _store(self, duration, kind, data):
+        entry = {
+            "id": uuid.uuid4().hex,
+            "kind": kind,
+            "method": request.method,
+            "path": request.full_path.rstrip("?"),
+            "route": request.url_rule.rule if request.url_rule is not None else None,
+            "duration_ms": round(duration * 1000, 3),
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "data": data,
+        }
+        with self._lock:
+            self.profiled += 1
+            item = (duration, next(self._seq), entry)
+            if len(self._heap) < self.keep:
+                heapq.heappush(self._heap, item)
+            elif duration > self._heap[0][0]:
+                heapq.heapreplace(self._heap, item)
+                self.evicted += 1
+            else:
+                self.evicted += 1
+
+    # ---------- ACCESS ----------
+    def list(self):
+        with self._lock:
+            entries = [entry for _, _, entry in sorted(self._heap, reverse=True)]
+        return [{k: v for k, v in entry.items() if k != "data"} for entry in entries]
+
+    def get(self, profile_id):
+        with self._lock:
+            for _, _, entry in self._heap:
+                if entry["id"] == profile_id:
+                    return entry
+        return None
+
+    def summary(self, entry, limit=40):
+        """Human-readable top functions of a cProfile entry (by cumulative time)."""
+        stream = io.StringIO()
+        stats = pstats.Stats(stream=stream)
+        stats.stats = marshal.loads(entry["data"])
+        stats.get_top_level_stats()
+        stats.sort_stats("cumulative").print_stats(limit)
+        return stream.getvalue()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "sample_rate": self.sample_rate,
+                "slow_ms": None if self.slow_seconds is None else self.slow_seconds * 1000,
+                "keep": self.keep,
+                "kept": len(self._heap),
+                "profiled": self.profiled,
+                "evicted": self.evicted,
+            }
@@ -0,0 +1,41 @@
+"""Types and limits a property's features must meet before it is priced or stored.
+
+parse_property in app.py checks one record at a time and bulk_score checks
+whole chunks; both go through out_of_range(), so a value the web forms turn
+away is also turned away offline.
+"""
+import numpy as np
+import pandas as pd
+
+# Numeric feature columns and the types they are scored with; the others are text
+NUMERIC_COLUMNS = {
+    "area": "float64",
+    "bhk": "int64",
+    "bath": "int64",
+    "balcony": "int64",
+    "parking": "int64",
+    "age": "int64",
+}
+
+# Widths of the house_data columns; longer text or larger numbers fail the insert
+TEXT_LIMITS = {"location": 40, "property_type": 25, "furnishing": 25}
+INT_LIMIT = 2**31 - 1
+
+
+def out_of_range(column, values):
+    """Whether values break column's limits.
+
+    values is one parsed value (str, int or float) or a pandas Series of
+    them; a Series gets a boolean Series back. NaN and infinity, which
+    float(), json.loads and pandas all accept, are out of range.
+    """
+    if column in TEXT_LIMITS:
+        lengths = values.str.len() if isinstance(values, pd.Series) else len(values)
+        return lengths > TEXT_LIMITS[column]
+    if column not in NUMERIC_COLUMNS:
+        return False
+    bad = abs(values) > INT_LIMIT
+    # Python ints are always finite, and may be too large for a float
+    if not isinstance(values, int):
+        bad = bad | ~np.isfinite(values)
+    return bad
@@ -0,0 +1,132 @@
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from flask import Response, make_response, request
+
+
+class ResponseCache:
+    """Per-process cache for read-heavy pages and query results.
+
+    Every entry names the tables it was built from. Write routes call
+    invalidate(table) and all entries that read the table are dropped. A
+    table version check stops a build that raced with a write from storing
+    stale data. Entries otherwise live for the TTL of their endpoint, which
+    also bounds staleness in other worker processes.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries = {}                      # key -> entry dict
+        self._versions = defaultdict(int)       # table -> write generation
+        self._stats = defaultdict(lambda: {"hits": 0, "misses": 0, "not_modified": 0})
+
+    # ---------- LOOKUP ----------
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["expires_at"] <= time.monotonic() or any(
+                self._versions[t] != v for t, v in entry["versions"].items()
+            ):
+                del self._entries[key]
+                return None
+            return entry
+
+    def _snapshot(self, tables):
+        with self._lock:
+            return {t: self._versions[t] for t in tables}
+
+    def _put(self, key, entry, versions, ttl):
+        with self._lock:
+            # A write landed while we were building; don't cache what we read
+            if any(self._versions[t] != v for t, v in versions.items()):
+                return
+            entry["versions"] = versions
+            entry["expires_at"] = time.monotonic() + ttl
+            self._entries[key] = entry
+
+    def _count(self, endpoint, field):
+        with self._lock:
+            self._stats[endpoint][field] += 1
+
+    # ---------- PUBLIC API ----------
+    def value(self, endpoint, ttl, tables, build, key=None):
+        """Return a cached query result, calling build() on a miss."""
+        if not self.enabled or ttl <= 0:
+            return build()
+
+        key = ("value", endpoint, key)
+        entry = self._get(key)
+        if entry is not None:
+            self._count(endpoint, "hits")
+            return entry["value"]
+
+        self._count(endpoint, "misses")
+        versions = self._snapshot(tables)
+        value = build()
+        self._put(key, {"value": value}, versions, ttl)
+        return value
+
+    def respond(self, endpoint, ttl, tables, build):
+        """Serve a whole response from cache, with ETag/Last-Modified revalidation."""
+        if not self.enabled or ttl <= 0:
+            return build()
+
+        key = ("response", endpoint, request.full_path)
+        entry = self._get(key)
+        if entry is not None:
+            self._count(endpoint, "hits")
+        else:
+            self._count(endpoint, "misses")
+            versions = self._snapshot(tables)
+            response = make_response(build())
+            if response.status_code != 200 or response.is_streamed:
+                return response
+
+            body = response.get_data()
+            entry = {
+                "body": body,
+                "mimetype": response.mimetype,
+                "etag": hashlib.sha1(body).hexdigest(),
+                "last_modified": datetime.now(timezone.utc).replace(microsecond=0),
+            }
+            self._put(key, entry, versions, ttl)
+
+        response = Response(entry["body"], mimetype=entry["mimetype"])
+        response.set_etag(entry["etag"])
+        response.last_modified = entry["last_modified"]
+        # Browsers keep the copy but must revalidate; a match costs a 304 and no DB work
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        response = response.make_conditional(request)
+        if response.status_code == 304:
+            self._count(endpoint, "not_modified")
+        return response
+
+    def invalidate(self, *tables):
+        with self._lock:
+            for table in tables:
+                self._versions[table] += 1
+            stale = [k for k, e in self._entries.items()
+                     if any(t in e["versions"] for t in tables)]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            endpoints = {}
+            for endpoint, counts in self._stats.items():
+                lookups = counts["hits"] + counts["misses"]
+                endpoints[endpoint] = dict(
+                    counts, hit_ratio=round(counts["hits"] / lookups, 4) if lookups else 0.0
+                )
+            return {"entries": len(self._entries), "endpoints": endpoints}
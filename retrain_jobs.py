@@ -0,0 +1,415 @@
+import multiprocessing as mp
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from datetime import datetime
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+
+from data_encoder import FrequencyEncoder, FurnishingEncoder
+from fast_model import compile_pipeline
+from training_data import load_training_frame
+
+# Jobs only ever move forward through these states
+JOB_STATES = ("queued", "loading", "fitting", "evaluating", "saved", "rejected", "failed")
+FINAL_STATES = ("saved", "rejected", "failed")
+
+# Thresholds a new model must meet before it replaces the deployed one.
+# Relative limits compare with the deployed model on the same holdout;
+# None switches a check off.
+DEFAULT_GATE = {
+    "enabled": True,
+    "min_r2": None,
+    "max_r2_drop": 0.02,
+    "max_mae_increase": 0.05,        # fraction of the deployed model's MAE
+    "max_latency_increase": 0.5,     # fraction of the deployed model's p95
+    "max_p95_ms": None,
+    "max_batch_p95_ms": None,
+}
+
+LATENCY_SAMPLES = 200
+BATCH_SAMPLES = 20
+
+
+# ---------- TRAINING (runs in the worker process) ----------
+_progress_queue = None
+
+
+def _init_worker(progress_queue):
+    global _progress_queue
+    _progress_queue = progress_queue
+
+
+def _report(job_id, state, **info):
+    if _progress_queue is not None:
+        _progress_queue.put((job_id, state, info))
+
+
+def build_pipeline(n_estimators=300, n_jobs=None, max_samples=None):
+    preprocess = ColumnTransformer(
+        transformers=[
+            ("location_ohe", OneHotEncoder(handle_unknown="ignore"), ["location"]),
+            ("property_freq", FrequencyEncoder("property_type"), ["property_type"]),
+            ("furnishing_lbl", FurnishingEncoder("furnishing"), ["furnishing"])
+        ],
+        remainder='passthrough'
+    )
+    return Pipeline(steps=[
+        ("prep", preprocess),
+        ("rf", RandomForestRegressor(n_estimators=n_estimators, n_jobs=n_jobs,
+                                     max_samples=max_samples, random_state=42))
+    ])
+
+
+def extend_model(pipeline, X, y, add_trees, n_jobs=None, max_samples=None, max_trees=None):
+    """Warm start: keep the fitted encoders and trees, fit add_trees more on X, y."""
+    prep, rf = pipeline.named_steps["prep"], pipeline.named_steps["rf"]
+    total = len(rf.estimators_) + add_trees
+    if max_trees and total > max_trees:
+        raise ValueError(f"Model would grow to {total} trees (limit {max_trees}); run a full retrain")
+
+    # The encoders are not refitted: the existing trees index their output
+    # columns, so locations they never saw stay unknown until a full retrain
+    rf.set_params(warm_start=True, n_estimators=total, n_jobs=n_jobs, max_samples=max_samples)
+    rf.fit(prep.transform(X), y)
+    rf.set_params(warm_start=False)
+    return pipeline
+
+
+def _percentiles(timings):
+    ms = np.asarray(timings) * 1000
+    return round(float(np.percentile(ms, 50)), 3), round(float(np.percentile(ms, 95)), 3)
+
+
+def evaluate_model(pipeline, X, y, fast_inference=True, batch_size=1000):
+    """Holdout accuracy plus p50/p95 latency of the paths serving would use."""
+    predicted = pipeline.predict(X)
+    metrics = {
+        "mae": float(mean_absolute_error(y, predicted)),
+        "rmse": float(np.sqrt(mean_squared_error(y, predicted))),
+        "r2": float(r2_score(y, predicted)),
+        "trees": len(pipeline.named_steps["rf"].estimators_),
+    }
+
+    # Single rows go through the compiled forest when serving has it enabled
+    records = X.head(LATENCY_SAMPLES).to_dict("records")
+    if fast_inference:
+        compiled = compile_pipeline(pipeline)
+        predict_one = lambda record: compiled.predict_dicts([record])
+    else:
+        predict_one = lambda record: pipeline.predict(pd.DataFrame([record], columns=X.columns))
+    predict_one(records[0])
+    timings = []
+    for record in records:
+        start = time.perf_counter()
+        predict_one(record)
+        timings.append(time.perf_counter() - start)
+    metrics["p50_ms"], metrics["p95_ms"] = _percentiles(timings)
+
+    batch = X.head(batch_size)
+    timings = []
+    for _ in range(BATCH_SAMPLES):
+        start = time.perf_counter()
+        pipeline.predict(batch)
+        timings.append(time.perf_counter() - start)
+    metrics["batch_p50_ms"], metrics["batch_p95_ms"] = _percentiles(timings)
+    metrics["batch_rows"] = len(batch)
+    return metrics
+
+
+def quality_gate(candidate, baseline, gate, compare_accuracy=True):
+    """Reasons the candidate may not replace the baseline; empty means promote."""
+    failures = []
+    if gate.get("min_r2") is not None and candidate["r2"] < gate["min_r2"]:
+        failures.append(f"R2 {candidate['r2']:.4f} below {gate['min_r2']}")
+    if gate.get("max_p95_ms") is not None and candidate["p95_ms"] > gate["max_p95_ms"]:
+        failures.append(f"p95 {candidate['p95_ms']} ms above {gate['max_p95_ms']} ms")
+    if gate.get("max_batch_p95_ms") is not None and candidate["batch_p95_ms"] > gate["max_batch_p95_ms"]:
+        failures.append(f"batch p95 {candidate['batch_p95_ms']} ms above {gate['max_batch_p95_ms']} ms")
+    if baseline is None:
+        return failures
+
+    if compare_accuracy:
+        drop = gate.get("max_r2_drop")
+        if drop is not None and candidate["r2"] < baseline["r2"] - drop:
+            failures.append(f"R2 {candidate['r2']:.4f} vs deployed {baseline['r2']:.4f}")
+        increase = gate.get("max_mae_increase")
+        if increase is not None and candidate["mae"] > baseline["mae"] * (1 + increase):
+            failures.append(f"MAE {candidate['mae']:,.0f} vs deployed {baseline['mae']:,.0f}")
+    increase = gate.get("max_latency_increase")
+    if increase is not None:
+        for key, label in (("p95_ms", "p95"), ("batch_p95_ms", "batch p95")):
+            if candidate[key] > baseline[key] * (1 + increase):
+                failures.append(f"{label} {candidate[key]} ms vs deployed {baseline[key]} ms")
+    return failures
+
+
+def train_model(job_id, csv_path, output_path, params=None, current_model_path=None,
+                incremental=False, id_range=None):
+    """Fit a new model on the CSV or snapshot (or add trees to the current one) and score both.
+
+    Returns the new model's metrics with the deployed model's under "baseline"
+    and the quality gate's verdict under "gate".
+    """
+    params = params or {}
+    _report(job_id, "loading")
+    data, counts = load_training_frame(
+        csv_path, on_progress=lambda rows, rejected: _report(job_id, "loading", rows=rows, rejected=rejected),
+        id_range=id_range
+    )
+    if not counts["rows"]:
+        raise ValueError(f"No valid rows in dataset ({counts['rejected']} rejected)")
+
+    X = data.drop('price', axis=1)
+    y = data['price']
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+
+    _report(job_id, "fitting", **counts)
+    if incremental:
+        pipeline = extend_model(
+            joblib.load(current_model_path), X_train, y_train, params.get("add_trees", 50),
+            n_jobs=params.get("n_jobs"), max_samples=params.get("max_samples"),
+            max_trees=params.get("max_trees")
+        )
+    else:
+        pipeline = build_pipeline(params.get("n_estimators", 300), params.get("n_jobs"),
+                                  params.get("max_samples"))
+        pipeline.fit(X_train, y_train)
+    # n_jobs also applies to predict(); served models must not fan out per request
+    pipeline.named_steps["rf"].set_params(n_jobs=None)
+
+    _report(job_id, "evaluating")
+    fast_inference = params.get("fast_inference", True)
+    batch_size = params.get("batch_size", 1000)
+    metrics = dict(counts, holdout_rows=len(X_test),
+                   **evaluate_model(pipeline, X_test, y_test, fast_inference, batch_size))
+
+    baseline = None
+    if current_model_path:
+        try:
+            deployed = joblib.load(current_model_path)
+            baseline = evaluate_model(deployed, X_test, y_test, fast_inference, batch_size)
+            del deployed
+        except Exception as e:
+            print("RETRAIN BASELINE ERROR:", e)
+    metrics["baseline"] = baseline
+
+    # Incremental rows are priced by the deployed model itself, so it would
+    # win any accuracy comparison on them; only the absolute limits apply
+    gate = dict(DEFAULT_GATE, **params.get("gate", {}))
+    failures = quality_gate(metrics, baseline, gate, compare_accuracy=not incremental)
+    metrics["gate"] = {"passed": not failures or not gate["enabled"],
+                       "enforced": gate["enabled"], "failures": failures}
+
+    if metrics["gate"]["passed"]:
+        joblib.dump(pipeline, output_path)
+    return metrics
+
+
+# ---------- JOB QUEUE (runs in the web process) ----------
+class RetrainQueue:
+    """Runs retrain jobs one at a time on a single-process pool.
+
+    on_state(job, state) is called on every state change and
+    on_trained(job, model_path) installs the freshly written model; jobs
+    whose model fails the quality gate end "rejected" and install nothing.
+    lock is an optional context-manager factory held for the whole job,
+    e.g. a database lock so several web workers never train at once.
+    params are passed to train_model; current_model() returns the path of
+    the deployed model, which new models are scored against and incremental
+    jobs extend. It is resolved when the job starts.
+
+    A job's prepare(), if given, runs on the dispatch thread when the job
+    starts, under the lock, to write the data it trains on.
+    """
+
+    def __init__(self, on_state, on_trained, lock=None, start_method=None, max_jobs=50,
+                 params=None, current_model=None):
+        self._on_state = on_state
+        self._on_trained = on_trained
+        self._params = dict(params or {})
+        self._current_model = current_model
+        self._lock_factory = lock or nullcontext
+        self._context = mp.get_context(start_method)
+        self._max_jobs = max_jobs
+
+        self._jobs = {}
+        self._jobs_lock = threading.Lock()
+        self._pending = queue.Queue()
+        self._progress = None
+        self._executor = None
+        self._threads_started = False
+        self._start_lock = threading.Lock()
+
+    def _start(self):
+        with self._start_lock:
+            if self._threads_started:
+                return
+            self._progress = self._context.Queue()
+            threading.Thread(target=self._dispatch, name="retrain-dispatch", daemon=True).start()
+            threading.Thread(target=self._listen, name="retrain-progress", daemon=True).start()
+            self._threads_started = True
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=1, mp_context=self._context,
+                initializer=_init_worker, initargs=(self._progress,)
+            )
+        return self._executor
+
+    # ---------- PUBLIC API ----------
+    def submit(self, csv_path, dataset_name, requested_by, mode="full", meta=None, id_range=None,
+               prepare=None):
+        if mode not in ("full", "incremental"):
+            raise ValueError("mode must be full or incremental")
+        if mode == "incremental" and self._current_model is None:
+            raise ValueError("incremental retraining needs a base model")
+        self._start()
+        job = {
+            "id": uuid.uuid4().hex,
+            "dataset_name": dataset_name,
+            "requested_by": requested_by,
+            "mode": mode,
+            "meta": dict(meta or {}),
+            "state": "queued",
+            "submitted_at": datetime.now().isoformat(timespec="seconds"),
+            "started_at": None,
+            "finished_at": None,
+            "error": None,
+            "metrics": {},
+            "csv_path": csv_path,
+            "id_range": id_range,
+            "prepare": prepare,
+        }
+        with self._jobs_lock:
+            self._jobs[job["id"]] = job
+            self._trim()
+        self._notify(job, "queued")
+        self._pending.put(job["id"])
+        return self._public(job)
+
+    def get(self, job_id):
+        with self._jobs_lock:
+            job = self._jobs.get(job_id)
+            return self._public(job) if job else None
+
+    def list(self):
+        with self._jobs_lock:
+            return [self._public(job) for job in reversed(list(self._jobs.values()))]
+
+    def pending_count(self):
+        return self._pending.qsize()
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    # ---------- INTERNALS ----------
+    def _public(self, job):
+        public = {k: v for k, v in job.items() if k not in ("csv_path", "prepare")}
+        public["metrics"] = dict(job["metrics"])
+        public["meta"] = dict(job["meta"])
+        return public
+
+    def _trim(self):
+        finished = [j for j in self._jobs.values() if j["state"] in FINAL_STATES]
+        for job in finished[:max(0, len(self._jobs) - self._max_jobs)]:
+            del self._jobs[job["id"]]
+
+    def _set_state(self, job_id, state, **info):
+        with self._jobs_lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            if state == job["state"] and state not in FINAL_STATES:
+                # Progress within a state (e.g. rows loaded so far): no new history row
+                job["metrics"].update(info)
+                return
+            # Progress messages can arrive late; never move a job backwards
+            if JOB_STATES.index(state) <= JOB_STATES.index(job["state"]) and state != "failed":
+                return
+            if job["state"] in FINAL_STATES:
+                return
+            job["state"] = state
+            job["metrics"].update(info.pop("metrics", {}))
+            job["metrics"].update(info)
+            if state in FINAL_STATES:
+                job["finished_at"] = datetime.now().isoformat(timespec="seconds")
+        self._notify(job, state)
+
+    def _notify(self, job, state):
+        try:
+            self._on_state(self._public(job), state)
+        except Exception as e:
+            print("RETRAIN STATE CALLBACK ERROR:", e)
+
+    def _listen(self):
+        while True:
+            job_id, state, info = self._progress.get()
+            self._set_state(job_id, state, **info)
+
+    def _dispatch(self):
+        while True:
+            job_id = self._pending.get()
+            with self._jobs_lock:
+                job = self._jobs.get(job_id)
+            if job is not None:
+                self._run(job)
+
+    def _run(self, job):
+        # The job's own directory: csv_path may be the shared snapshot tree
+        work_dir = tempfile.mkdtemp(prefix="retrain-")
+        output_path = os.path.join(work_dir, "model.pkl")
+        try:
+            with self._lock_factory():
+                job["started_at"] = datetime.now().isoformat(timespec="seconds")
+                if job["prepare"] is not None:
+                    self._set_state(job["id"], "loading", step="prepare")
+                    job["prepare"]()
+                current_path = self._current_model() if self._current_model else None
+                try:
+                    future = self._get_executor().submit(
+                        train_model, job["id"], job["csv_path"], output_path,
+                        self._params, current_path, job["mode"] == "incremental", job["id_range"]
+                    )
+                    metrics = future.result()
+                except BrokenProcessPool:
+                    self._executor = None
+                    raise
+                if metrics["gate"]["passed"]:
+                    self._on_trained(self._public(job), output_path)
+            if not metrics["gate"]["passed"]:
+                with self._jobs_lock:
+                    job["error"] = "; ".join(metrics["gate"]["failures"])
+                self._set_state(job["id"], "rejected", metrics=metrics)
+                return
+            self._set_state(job["id"], "saved", metrics=metrics)
+        except Exception as e:
+            print("RETRAIN ERROR:", traceback.format_exc())
+            with self._jobs_lock:
+                job["error"] = str(e)
+            self._set_state(job["id"], "failed")
+        finally:
+            # Uploaded CSVs are the job's own; a snapshot directory is shared
+            if os.path.isfile(job["csv_path"]):
+                os.remove(job["csv_path"])
+            shutil.rmtree(work_dir, ignore_errors=True)
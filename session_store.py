@@ -0,0 +1,283 @@
+"""Server-side Flask sessions.
+
+The cookie only carries a signed random session id; the session data lives
+in a backend. That keeps the signed-in user's record (everything but the
+password hash) next to the session, where Flask's cookie session would have
+to send it back and forth on every request, and lets the app end every
+session of a user at once, e.g. after a password change.
+
+Backends implement get/set/delete plus delete_user(user_id, keep=None):
+
+    MemoryBackend  per process, LRU-evicted; one web worker only
+    FileBackend    one file per session in a directory shared by the
+                   workers on a host
+"""
+import os
+import secrets
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSession, SessionInterface
+from itsdangerous import BadSignature, Signer
+
+_serializer = TaggedJSONSerializer()
+
+
+class ServerSideSession(SecureCookieSession):
+    def __init__(self, initial=None, sid=None):
+        super().__init__(initial)
+        self.sid = sid
+        self.rotated_from = None
+
+    def regenerate(self):
+        """Give the session a new id on save, e.g. at sign-in against session fixation."""
+        if self.sid is not None and self.rotated_from is None:
+            self.rotated_from = self.sid
+        self.sid = None
+        self.modified = True
+
+
+class MemoryBackend:
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # sid -> (data, user_id, expires_at)
+        self._by_user = {}              # user_id -> set of sids
+        self.evictions = 0
+
+    def get(self, sid, ttl):
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is None:
+                return None
+            data, user_id, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(sid)
+                return None
+            # Sliding expiry: an active session stays signed in
+            self._entries[sid] = (data, user_id, time.monotonic() + ttl)
+            self._entries.move_to_end(sid)
+            return dict(data)
+
+    def set(self, sid, data, ttl):
+        user_id = data.get("user_id")
+        with self._lock:
+            self._remove(sid)
+            self._entries[sid] = (dict(data), user_id, time.monotonic() + ttl)
+            if user_id is not None:
+                self._by_user.setdefault(user_id, set()).add(sid)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def delete(self, sid):
+        with self._lock:
+            self._remove(sid)
+
+    def delete_user(self, user_id, keep=None):
+        with self._lock:
+            for sid in list(self._by_user.get(user_id, ())):
+                if sid != keep:
+                    self._remove(sid)
+
+    def stats(self):
+        with self._lock:
+            return {"backend": "memory", "size": len(self._entries), "maxsize": self.maxsize,
+                    "evictions": self.evictions}
+
+    def _remove(self, sid):
+        entry = self._entries.pop(sid, None)
+        if entry is not None and entry[1] is not None:
+            sids = self._by_user.get(entry[1])
+            if sids is not None:
+                sids.discard(sid)
+                if not sids:
+                    del self._by_user[entry[1]]
+
+
+class FileBackend:
+    """<directory>/<sid>.session files, plus users/<user_id>/<sid> markers so
+    a user's sessions can be found without reading every file.
+
+    Expiry is by modification time, refreshed when a session is read after
+    half its lifetime. Expired files are swept at most every `sweep_every`
+    seconds, from whichever worker writes a session next.
+    """
+
+    def __init__(self, directory, sweep_every=3600.0):
+        self.directory = directory
+        self.sweep_every = sweep_every
+        self._users_dir = os.path.join(directory, "users")
+        self._last_sweep = time.monotonic()
+        os.makedirs(self._users_dir, exist_ok=True)
+
+    def _path(self, sid):
+        return os.path.join(self.directory, f"{sid}.session")
+
+    def get(self, sid, ttl):
+        path = self._path(sid)
+        try:
+            age = time.time() - os.stat(path).st_mtime
+            if age > ttl:
+                self.delete(sid)
+                return None
+            with open(path, "rb") as f:
+                data = _serializer.loads(f.read().decode())
+        except (FileNotFoundError, ValueError):
+            return None
+        if age > ttl / 2:
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                return None
+        return data
+
+    def set(self, sid, data, ttl):
+        # Write and rename, so a concurrent reader sees the old or the new session
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_serializer.dumps(dict(data)).encode())
+            os.replace(tmp_path, self._path(sid))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        user_id = data.get("user_id")
+        if user_id is not None:
+            user_dir = os.path.join(self._users_dir, str(user_id))
+            os.makedirs(user_dir, exist_ok=True)
+            open(os.path.join(user_dir, sid), "a").close()
+        if time.monotonic() - self._last_sweep >= self.sweep_every:
+            self._last_sweep = time.monotonic()
+            self.sweep(ttl)
+
+    def delete(self, sid):
+        try:
+            os.remove(self._path(sid))
+        except FileNotFoundError:
+            pass
+
+    def delete_user(self, user_id, keep=None):
+        user_dir = os.path.join(self._users_dir, str(user_id))
+        try:
+            names = os.listdir(user_dir)
+        except FileNotFoundError:
+            return
+        for sid in names:
+            if sid != keep:
+                self.delete(sid)
+                try:
+                    os.remove(os.path.join(user_dir, sid))
+                except FileNotFoundError:
+                    pass
+
+    def sweep(self, ttl):
+        """Remove expired sessions and markers of sessions that are gone; returns how many."""
+        removed = 0
+        cutoff = time.time() - ttl
+        for name in os.listdir(self.directory):
+            if name.endswith(".session"):
+                path = os.path.join(self.directory, name)
+                try:
+                    if os.stat(path).st_mtime < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+        for user_id in os.listdir(self._users_dir):
+            user_dir = os.path.join(self._users_dir, user_id)
+            for sid in os.listdir(user_dir):
+                if not os.path.exists(self._path(sid)):
+                    try:
+                        os.remove(os.path.join(user_dir, sid))
+                    except FileNotFoundError:
+                        pass
+        return removed
+
+    def stats(self):
+        return {"backend": "file", "directory": self.directory}
+
+
+class ServerSessionInterface(SessionInterface):
+    """Flask session interface storing sessions in `backend` for `ttl` seconds
+    since their last use. Install with `app.session_interface = ...`."""
+
+    def __init__(self, backend, ttl=86400.0):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt="server-session")
+
+    def end_user_sessions(self, user_id, keep=None):
+        # keep: a session id to leave signed in, usually the current one
+        self.backend.delete_user(user_id, keep=keep)
+
+    def open_session(self, app, request):
+        if not app.secret_key:
+            return None
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if not cookie:
+            return ServerSideSession()
+        try:
+            sid = self._signer(app).unsign(cookie).decode()
+        except BadSignature:
+            return ServerSideSession()
+        try:
+            data = self.backend.get(sid, self.ttl)
+        except Exception as e:
+            print("SESSION BACKEND ERROR:", e)
+            data = None
+        if data is None:
+            self.misses += 1
+            return ServerSideSession()
+        self.hits += 1
+        return ServerSideSession(data, sid=sid)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        if session.rotated_from is not None:
+            self.backend.delete(session.rotated_from)
+            session.rotated_from = None
+
+        if not session:
+            if session.modified:
+                if session.sid is not None:
+                    self.backend.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path,
+                                       secure=self.get_cookie_secure(app),
+                                       samesite=self.get_cookie_samesite(app),
+                                       httponly=self.get_cookie_httponly(app))
+            return
+
+        if not session.modified:
+            return
+        if session.sid is None:
+            session.sid = secrets.token_urlsafe(32)
+        self.backend.set(session.sid, dict(session), self.ttl)
+        response.set_cookie(
+            name,
+            self._signer(app).sign(session.sid).decode(),
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+            partitioned=self.get_cookie_partitioned(app),
+        )
+
+    def stats(self):
+        return dict(self.backend.stats(), hits=self.hits, misses=self.misses, ttl_seconds=self.ttl)
@@ -0,0 +1,48 @@
+"""Shared test setup: the repository on sys.path and a small trained model."""
+import os
+import sys
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from retrain_jobs import build_pipeline  # noqa: E402
+from training_data import REQUIRED_COLUMNS, load_training_frame  # noqa: E402
+
+LOCATIONS = ["Whitefield", "Hebbal", "Kengeri", "Electronic City"]
+FURNISHINGS = ["Fully-Furnished", "Semi-Furnished", "Unfurnished"]
+PROPERTY_TYPES = ["Apartment", "Independent House", "Villa"]
+
+
+@pytest.fixture(scope="session")
+def model_dir(tmp_path_factory):
+    """Directory holding a house_price_model.pkl fitted on 500 synthetic rows."""
+    directory = tmp_path_factory.mktemp("model")
+    rng = np.random.default_rng(42)
+    n = 500
+    frame = pd.DataFrame({
+        "area": rng.integers(500, 3000, n),
+        "location": rng.choice(LOCATIONS, n),
+        "bhk": rng.integers(1, 6, n),
+        "bath": rng.integers(1, 6, n),
+        "balcony": rng.integers(0, 3, n),
+        "parking": rng.integers(0, 3, n),
+        "furnishing": rng.choice(FURNISHINGS, n),
+        "property_type": rng.choice(PROPERTY_TYPES, n),
+        "age": rng.integers(0, 20, n),
+    })
+    frame["price"] = (frame["area"] * 6_000 + frame["bath"] * 150_000).round()
+
+    # Through the loader, so the model sees the dtypes a retrain gives it
+    csv_path = directory / "train.csv"
+    frame[REQUIRED_COLUMNS].to_csv(csv_path, index=False)
+    data, _ = load_training_frame(str(csv_path))
+    pipeline = build_pipeline(5)
+    pipeline.fit(data.drop("price", axis=1), data["price"])
+    joblib.dump(pipeline, directory / "house_price_model.pkl")
+    csv_path.unlink()
+    return directory
@@ -0,0 +1,25 @@
+"""bulk_score turns away the rows parse_property would, row by row."""
+import pandas as pd
+
+import bulk_score
+
+COLUMNS = ["location", "property_type", "area", "bhk", "bath", "balcony", "parking", "furnishing", "age"]
+ROW = {"location": "Whitefield", "property_type": "Apartment", "area": "1200", "bhk": "2", "bath": "2",
+       "balcony": "1", "parking": "1", "furnishing": "Semi-Furnished", "age": "5"}
+
+
+def test_prepare_rejects_out_of_range_rows():
+    chunk = pd.DataFrame([
+        ROW,
+        dict(ROW, area="inf"),
+        dict(ROW, location="x" * 41),
+        dict(ROW, bhk="99999999999999"),
+        dict(ROW, area="1300"),
+    ])
+    features, errors = bulk_score._prepare(chunk, COLUMNS)
+
+    assert list(errors) == ["", "missing or invalid: area", "missing or invalid: location",
+                            "missing or invalid: bhk", ""]
+    # Only the valid rows reach the model and house_data
+    assert list(features["area"]) == [1200.0, 1300.0]
+    assert list(features.columns) == COLUMNS
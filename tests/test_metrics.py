@@ -0,0 +1,133 @@
+"""/metrics histograms, scraped after real requests through the Flask test client.
+
+The app runs against the SQLite stand-in from benchmarks/ with the small
+model from conftest.py.
+"""
+import math
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from metrics import Registry  # noqa: E402
+
+SAMPLE = re.compile(r'^(\w+)\{(.*)\} (\S+)$')
+FORM = {"location": "Whitefield", "type": "Apartment", "bhk": "2", "bath": "2", "balcony": "1",
+        "parking": "1", "furnishing": "Semi-Furnished", "age": "5"}
+
+
+@pytest.fixture(scope="module")
+def house_app(model_dir, tmp_path_factory):
+    workdir = tmp_path_factory.mktemp("app")
+    # Undone when the module finishes, so later tests see the environment and app as they were
+    with pytest.MonkeyPatch.context() as patch:
+        # app.py loads house_price_model.pkl from the working directory
+        patch.chdir(model_dir)
+        for name, value in {
+            "MODEL_DIR": workdir / "models",
+            "RETRAIN_UPLOAD_DIR": workdir / "uploads",
+            "SESSION_DIR": workdir / "sessions",
+            "SNAPSHOT_DIR": workdir / "snapshots",
+            "METRICS": "1",
+            "WRITE_BEHIND": "0",
+        }.items():
+            patch.setenv(name, str(value))
+        patch.delenv("METRICS_TOKEN", raising=False)
+
+        import app
+        from db_pool import ConnectionPool
+        from standin_db import StandinServer
+
+        pool = ConnectionPool(StandinServer().connect, size=2, observe=app.observe_phase)
+        patch.setattr(app, "db_pool", pool)
+        patch.setattr(app, "db_connection", pool.connection)
+        yield app
+
+
+def scrape(client):
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    samples = {}
+    for line in response.get_data(as_text=True).splitlines():
+        match = SAMPLE.match(line)
+        if match:
+            name, labels, value = match.groups()
+            samples[(name, frozenset(re.findall(r'(\w+)="([^"]*)"', labels)))] = float(value)
+    return samples
+
+
+def histogram(samples, name, **labels):
+    """({le: cumulative count}, sum, count) of one labelled histogram."""
+    wanted = set(labels.items())
+    buckets = {}
+    for (sample, pairs), value in samples.items():
+        pairs = dict(pairs)
+        le = pairs.pop("le", None)
+        if sample == f"{name}_bucket" and set(pairs.items()) == wanted:
+            buckets[math.inf if le == "+Inf" else float(le)] = value
+    key = frozenset(labels.items())
+    return buckets, samples[(f"{name}_sum", key)], samples[(f"{name}_count", key)]
+
+
+def check_histogram(buckets, total, count, expected_count):
+    bounds = sorted(buckets)
+    assert bounds[-1] == math.inf
+    assert count == expected_count
+    assert buckets[math.inf] == count
+    # Cumulative: every bucket holds the ones below it
+    counts = [buckets[b] for b in bounds]
+    assert counts == sorted(counts)
+    assert total > 0
+    # le: observations above a bound each add more than that bound to the sum
+    for bound in bounds[:-1]:
+        assert (count - buckets[bound]) * bound <= total
+
+
+def test_histogram_le_semantics():
+    registry = Registry()
+    latency = registry.histogram("latency_seconds", "Test.", ("route",), buckets=(0.1, 0.5, 1.0))
+    for value in (0.05, 0.1, 0.3, 0.5, 2.0):
+        latency.labels("/x").observe(value)
+
+    samples = {}
+    for line in registry.render().splitlines():
+        match = SAMPLE.match(line)
+        if match:
+            samples[(match.group(1), match.group(2))] = float(match.group(3))
+
+    # A value equal to a bound is counted in that bound's bucket
+    assert samples[("latency_seconds_bucket", 'route="/x",le="0.1"')] == 2
+    assert samples[("latency_seconds_bucket", 'route="/x",le="0.5"')] == 4
+    assert samples[("latency_seconds_bucket", 'route="/x",le="1"')] == 4
+    assert samples[("latency_seconds_bucket", 'route="/x",le="+Inf"')] == 5
+    assert samples[("latency_seconds_sum", 'route="/x"')] == pytest.approx(2.95)
+    assert samples[("latency_seconds_count", 'route="/x"')] == 5
+
+
+def test_request_and_phase_histograms(house_app):
+    client = house_app.app.test_client()
+    with client.session_transaction() as session:
+        session.update(username="metrics", usertype="customer", user_id=1)
+
+    before = scrape(client)
+    # Different areas, so the prediction cache does not skip the model
+    for area in (1200, 1300, 1400):
+        response = client.post("/prediction", data=dict(FORM, area=str(area)))
+        assert response.status_code == 200
+    after = scrape(client)
+
+    route = {"method": "POST", "route": "/prediction", "status": "200"}
+    assert not any(name.startswith("http_request_duration_seconds") and ("route", "/prediction") in pairs
+                   for name, pairs in before)
+    check_histogram(*histogram(after, "http_request_duration_seconds", **route), expected_count=3)
+
+    phase = {"route": "/prediction", "phase": "predict"}
+    check_histogram(*histogram(after, "http_request_phase_seconds", **phase), expected_count=3)
+
+    # A phase never takes longer than the request around it
+    _, request_sum, _ = histogram(after, "http_request_duration_seconds", **route)
+    _, phase_sum, _ = histogram(after, "http_request_phase_seconds", **phase)
+    assert phase_sum <= request_sum
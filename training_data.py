@@ -0,0 +1,122 @@
+"""Chunked, compactly typed loading of retraining CSVs.
+
+Uploads are copied to disk in fixed-size blocks and parsed CHUNK_ROWS rows at
+a time. Each chunk is validated and cast straight to TRAINING_DTYPES, so peak
+memory stays close to the final compact frame instead of pandas' default
+object/int64 frame of the whole file.
+
+A house_data snapshot directory (see house_snapshot.py) can be loaded in place
+of a CSV; its segments are the chunks and nothing is parsed.
+"""
+import csv
+import io
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+import house_snapshot
+
+REQUIRED_COLUMNS = ["area", "location", "bhk", "bath", "balcony", "parking",
+                    "furnishing", "property_type", "age", "price"]
+
+CATEGORICAL_COLUMNS = ["location", "furnishing", "property_type"]
+
+# float32 would round rupee prices above 2**24 (~1.7 crore), so the target stays float64
+TRAINING_DTYPES = {
+    "area": "float32",
+    "bhk": "int16",
+    "bath": "int16",
+    "balcony": "int16",
+    "parking": "int16",
+    "age": "int16",
+    "price": "float64",
+}
+
+CHUNK_ROWS = 100_000
+COPY_BUFFER = 1 << 20
+
+
+def check_header(columns):
+    missing = [col for col in REQUIRED_COLUMNS if col not in columns]
+    if missing:
+        raise ValueError(f"Dataset must contain these columns: {', '.join(REQUIRED_COLUMNS)}")
+
+
+def save_upload(stream, path):
+    """Copy an uploaded CSV to path block by block, rejecting a bad header first."""
+    header = stream.readline()
+    text = header.decode("utf-8-sig") if isinstance(header, bytes) else header
+    check_header(next(csv.reader(io.StringIO(text)), []))
+
+    with open(path, "wb") as out:
+        out.write(header if isinstance(header, bytes) else header.encode())
+        shutil.copyfileobj(stream, out, COPY_BUFFER)
+
+
+def _clean_chunk(chunk):
+    """Cast one chunk to TRAINING_DTYPES; returns ({column: values}, rejected count)."""
+    valid = pd.Series(True, index=chunk.index)
+    numeric = {}
+    for col, dtype in TRAINING_DTYPES.items():
+        values = pd.to_numeric(chunk[col], errors="coerce")
+        valid &= values.notna()
+        if dtype.startswith("int"):
+            limits = np.iinfo(dtype)
+            valid &= (values % 1 == 0) & values.between(limits.min, limits.max)
+        numeric[col] = values
+    valid &= (numeric["area"] > 0) & (numeric["price"] > 0)
+    for col in CATEGORICAL_COLUMNS:
+        valid &= chunk[col].notna()
+
+    kept = valid.to_numpy()
+    columns = {col: chunk[col].array[kept] for col in CATEGORICAL_COLUMNS}
+    columns.update({col: numeric[col].to_numpy()[kept].astype(dtype)
+                    for col, dtype in TRAINING_DTYPES.items()})
+    return columns, int((~kept).sum())
+
+
+def _concat(parts):
+    columns = {}
+    for col in REQUIRED_COLUMNS:
+        # pop() frees each column's chunks as soon as they are merged
+        pieces = parts.pop(col)
+        if col in CATEGORICAL_COLUMNS:
+            # Chunks see different category sets; merge codes instead of falling back to object
+            columns[col] = (union_categoricals(pieces).remove_unused_categories()
+                            if pieces else pd.Categorical([]))
+        else:
+            columns[col] = np.concatenate(pieces) if pieces else np.array([], TRAINING_DTYPES[col])
+    # copy=False keeps one array per column instead of consolidating them into new blocks
+    return pd.DataFrame(columns, copy=False)
+
+
+def load_training_frame(path, chunk_rows=CHUNK_ROWS, on_progress=None, id_range=None):
+    """Read a training CSV, or a house_data snapshot directory, into a compact frame.
+
+    id_range=(after, through) limits a snapshot to after < id <= through.
+    Returns (frame, {"rows", "rejected"}).
+    """
+    if os.path.isdir(path):
+        reader = house_snapshot.iter_frames(path, REQUIRED_COLUMNS, id_range)
+    else:
+        check_header(pd.read_csv(path, nrows=0).columns)
+        reader = pd.read_csv(
+            path, usecols=REQUIRED_COLUMNS, chunksize=chunk_rows,
+            dtype={col: "category" for col in CATEGORICAL_COLUMNS}
+        )
+
+    parts = {col: [] for col in REQUIRED_COLUMNS}
+    rows = rejected = 0
+    for chunk in reader:
+        columns, bad = _clean_chunk(chunk)
+        for col, values in columns.items():
+            parts[col].append(values)
+        rows += len(columns["price"])
+        rejected += bad
+        if on_progress is not None:
+            on_progress(rows, rejected)
+
+    return _concat(parts), {"rows": rows, "rejected": rejected}
@@ -0,0 +1,226 @@
+import os
+import threading
+import time
+from collections import deque
+
+OVERFLOW_POLICIES = ("sync", "block", "drop")
+
+
+class WriteBehindBuffer:
+    """Queues rows in memory and writes them in batches on a background thread.
+
+    flush(records) gets up to max_rows records once max_rows are queued or
+    the oldest has waited max_delay seconds, and whatever is left on close().
+    When capacity rows are already waiting, overflow decides what add() does:
+    "sync" writes the caller's rows itself, "block" waits up to block_timeout
+    for room (then writes synchronously) and "drop" discards them.
+
+    A batch that fails with an error is_transient(error) accepts (database
+    down, pool exhausted) is queued again as it was. Any other failure is
+    blamed on the rows: they are retried one at a time, so the rest of the
+    batch still gets written, and a row that has failed max_attempts times
+    is logged and moved to dead_letters.
+    """
+
+    def __init__(self, flush, max_rows=500, max_delay=1.0, capacity=10000,
+                 overflow="sync", block_timeout=5.0, enabled=True,
+                 is_transient=None, max_attempts=3, dead_letter_size=1000):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(OVERFLOW_POLICIES)}")
+        self._flush = flush
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.capacity = capacity
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.enabled = enabled
+        self.is_transient = is_transient or (lambda error: False)
+        self.max_attempts = max_attempts
+        self.dead_letters = deque(maxlen=dead_letter_size)
+
+        self._cond = threading.Condition()
+        self._queue = deque()        # (enqueued_at, record, failed attempts), oldest on the left
+        self._thread = None
+        self._pid = None
+        self._closed = False
+
+        self.enqueued = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.flush_errors = 0
+        self.dead_lettered = 0
+        self.dropped = 0
+        self.sync_writes = 0
+        self.blocked = 0
+        self._flush_time = 0.0
+        self._max_flush_time = 0.0
+        self._lag_sum = 0.0
+        self._max_lag = 0.0
+
+    # ---------- PUBLIC API ----------
+    def add(self, records):
+        if not self.enabled or self._closed:
+            self._write_now(records)
+            return
+
+        with self._cond:
+            self._start()
+            if self._full(records) and self.overflow == "block":
+                self.blocked += 1
+                self._cond.notify_all()
+                self._cond.wait_for(lambda: not self._full(records), self.block_timeout)
+            if not self._full(records):
+                self._enqueue(records)
+                return
+            if self.overflow == "drop":
+                self.dropped += len(records)
+                return
+
+        # "sync", or "block" that ran out of patience
+        self._write_now(records)
+
+    def close(self, timeout=10.0):
+        """Stop the flusher and write everything still queued."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout)
+
+        while True:
+            with self._cond:
+                batch = self._take()
+            if not batch:
+                break
+            if not self._write_batch(batch):
+                with self._cond:
+                    lost = len(self._queue)
+                    self._queue.clear()
+                print("WRITE BUFFER: giving up on", lost, "rows at shutdown")
+                break
+
+    def stats(self):
+        with self._cond:
+            oldest = time.monotonic() - self._queue[0][0] if self._queue else 0.0
+            return {
+                "enabled": self.enabled,
+                "overflow": self.overflow,
+                "capacity": self.capacity,
+                "max_rows": self.max_rows,
+                "max_delay_seconds": self.max_delay,
+                "queued": len(self._queue),
+                "oldest_queued_seconds": round(oldest, 6),
+                "enqueued": self.enqueued,
+                "flushed": self.flushed,
+                "flushes": self.flushes,
+                "flush_errors": self.flush_errors,
+                "dead_lettered": self.dead_lettered,
+                "dropped": self.dropped,
+                "sync_writes": self.sync_writes,
+                "blocked": self.blocked,
+                "avg_flush_ms": round(self._flush_time / self.flushes * 1000, 3) if self.flushes else 0.0,
+                "max_flush_ms": round(self._max_flush_time * 1000, 3),
+                # add() until commit, per row
+                "avg_write_lag_ms": round(self._lag_sum / self.flushed * 1000, 3) if self.flushed else 0.0,
+                "max_write_lag_ms": round(self._max_lag * 1000, 3),
+            }
+
+    # ---------- INTERNALS ----------
+    def _start(self):
+        # Lazily, and again in a forked worker: threads do not survive fork()
+        if self._thread is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._thread.start()
+
+    def _full(self, records):
+        return len(self._queue) + len(records) > self.capacity
+
+    def _enqueue(self, records):
+        was_empty = not self._queue
+        now = time.monotonic()
+        self._queue.extend((now, record, 0) for record in records)
+        self.enqueued += len(records)
+        # The flusher sleeps without a deadline while the queue is empty
+        if was_empty or len(self._queue) >= self.max_rows:
+            self._cond.notify_all()
+
+    def _take(self):
+        batch = []
+        while self._queue and len(batch) < self.max_rows:
+            batch.append(self._queue.popleft())
+        if batch:
+            self._cond.notify_all()
+        return batch
+
+    def _write_now(self, records):
+        self._flush(list(records))
+        with self._cond:
+            self.sync_writes += len(records)
+
+    def _write_batch(self, batch):
+        """Write queued entries; False if the database looks unavailable and they were requeued."""
+        start = time.monotonic()
+        try:
+            self._flush([record for _, record, _ in batch])
+        except Exception as e:
+            print("WRITE BUFFER FLUSH ERROR:", e)
+            with self._cond:
+                self.flush_errors += 1
+            if self.is_transient(e):
+                self._requeue(batch)
+                return False
+            if len(batch) == 1:
+                self._row_failed(batch[0], e)
+                return True
+            # One bad row must not hold back the rest of the batch
+            for i, entry in enumerate(batch):
+                if not self._write_batch([entry]):
+                    self._requeue(batch[i + 1:])
+                    return False
+            return True
+
+        done = time.monotonic()
+        with self._cond:
+            self.flushes += 1
+            self.flushed += len(batch)
+            self._flush_time += done - start
+            self._max_flush_time = max(self._max_flush_time, done - start)
+            lags = [done - enqueued_at for enqueued_at, _, _ in batch]
+            self._lag_sum += sum(lags)
+            self._max_lag = max(self._max_lag, max(lags))
+        return True
+
+    def _requeue(self, entries):
+        # Back at the front in order, for the next pass
+        with self._cond:
+            self._queue.extendleft(reversed(entries))
+
+    def _row_failed(self, entry, error):
+        enqueued_at, record, attempts = entry
+        if attempts + 1 < self.max_attempts:
+            self._requeue([(enqueued_at, record, attempts + 1)])
+            return
+        print("WRITE BUFFER DEAD LETTER:", record, error)
+        with self._cond:
+            self.dead_lettered += 1
+            self.dead_letters.append(record)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and len(self._queue) < self.max_rows:
+                    wait = None
+                    if self._queue:
+                        wait = self._queue[0][0] + self.max_delay - time.monotonic()
+                        if wait <= 0:
+                            break
+                    self._cond.wait(wait)
+                if self._closed:
+                    # close() drains the rest on the caller's thread
+                    return
+                batch = self._take()
+
+            if not self._write_batch(batch):
+                # Database is unhappy: back off for one interval before retrying
+                time.sleep(max(self.max_delay, 0.5))
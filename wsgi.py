@@ -0,0 +1,4 @@
+"""Production entry point: gunicorn -c gunicorn.conf.py wsgi:application"""
+from app import create_app
+
+application = create_app(preload=True)